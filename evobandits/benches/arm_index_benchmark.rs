@@ -0,0 +1,114 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use criterion::{criterion_group, criterion_main, BenchmarkId, Criterion};
+use evobandits::arm_index::ArmIndex;
+use rand::rngs::StdRng;
+use rand::{Rng, SeedableRng};
+use std::alloc::{GlobalAlloc, Layout, System};
+use std::collections::HashMap;
+use std::hint::black_box;
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+// Counts all heap allocations of the benchmark process
+struct CountingAllocator;
+
+static ALLOCATIONS: AtomicUsize = AtomicUsize::new(0);
+
+unsafe impl GlobalAlloc for CountingAllocator {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        ALLOCATIONS.fetch_add(1, Ordering::Relaxed);
+        System.alloc(layout)
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        System.dealloc(ptr, layout)
+    }
+}
+
+#[global_allocator]
+static GLOBAL: CountingAllocator = CountingAllocator;
+
+fn allocations_per_probe<F: FnMut(&[i32])>(action_vectors: &[Vec<i32>], mut probe: F) -> f64 {
+    let before = ALLOCATIONS.load(Ordering::Relaxed);
+    for action_vector in action_vectors {
+        probe(action_vector);
+    }
+    let after = ALLOCATIONS.load(Ordering::Relaxed);
+    (after - before) as f64 / action_vectors.len() as f64
+}
+
+fn benchmark_arm_index(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Arm Lookup");
+
+    for dimension in [2, 10, 100].iter() {
+        // Index 10k arms, and probe with a mix of known and unknown action vectors
+        let mut rng = StdRng::seed_from_u64(42);
+        let action_vectors: Vec<Vec<i32>> = (0..20_000)
+            .map(|_| (0..*dimension).map(|_| rng.random_range(0..100)).collect())
+            .collect();
+
+        let mut arm_index = ArmIndex::new();
+        let mut lookup_table: HashMap<Vec<i32>, i32> = HashMap::new();
+        for (i, action_vector) in action_vectors.iter().take(10_000).enumerate() {
+            arm_index.insert(action_vector);
+            lookup_table.insert(action_vector.clone(), i as i32);
+        }
+
+        let allocations = allocations_per_probe(&action_vectors, |action_vector| {
+            black_box(arm_index.get(action_vector));
+        });
+        println!(
+            "ArmIndex/{}: {} allocations per probe",
+            dimension, allocations
+        );
+
+        let allocations = allocations_per_probe(&action_vectors, |action_vector| {
+            black_box(lookup_table.get(&action_vector.to_vec()));
+        });
+        println!(
+            "HashMap<Vec<i32>>/{}: {} allocations per probe",
+            dimension, allocations
+        );
+
+        group.bench_with_input(
+            BenchmarkId::new("ArmIndex", dimension),
+            &action_vectors,
+            |b, action_vectors| {
+                b.iter(|| {
+                    for action_vector in action_vectors {
+                        black_box(arm_index.get(black_box(action_vector)));
+                    }
+                });
+            },
+        );
+
+        group.bench_with_input(
+            BenchmarkId::new("HashMap<Vec<i32>>", dimension),
+            &action_vectors,
+            |b, action_vectors| {
+                b.iter(|| {
+                    for action_vector in action_vectors {
+                        black_box(lookup_table.get(&black_box(action_vector).to_vec()));
+                    }
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+criterion_group!(benches, benchmark_arm_index);
+criterion_main!(benches);
@@ -0,0 +1,354 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// Measures the components of GMAB separately, to locate regressions: the sorted tree of the arms,
+// the genetic operators, the UCB selection of the best arm, the lookup of arms by action vector,
+// and a whole generation. Objectives cost (almost) nothing, so only the overhead of the algorithm
+// is measured. Besides the time, each benchmark reports its heap allocations.
+//
+// Run the full grids with `cargo bench --bench components_benchmark`, or the corners of the grids
+// with `cargo bench --bench components_benchmark -- --quick`.
+
+use criterion::{criterion_group, criterion_main, BenchmarkId, Criterion};
+use evobandits::arm::Arm;
+use evobandits::arm_index::ArmIndex;
+use evobandits::evobandits::GMAB;
+use evobandits::genetic::GeneticAlgorithm;
+use evobandits::sorted_multi_map::{FloatKey, SortedMultiMap};
+use rand::rngs::StdRng;
+use rand::{Rng, SeedableRng};
+use std::alloc::{GlobalAlloc, Layout, System};
+use std::hint::black_box;
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+// Counts all heap allocations of the benchmark process
+struct CountingAllocator;
+
+static ALLOCATIONS: AtomicUsize = AtomicUsize::new(0);
+
+unsafe impl GlobalAlloc for CountingAllocator {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        ALLOCATIONS.fetch_add(1, Ordering::Relaxed);
+        System.alloc(layout)
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        System.dealloc(ptr, layout)
+    }
+}
+
+#[global_allocator]
+static GLOBAL: CountingAllocator = CountingAllocator;
+
+// Runs `f` once, and returns the number of its heap allocations per operation.
+fn allocations_per_op<F: FnOnce()>(n_ops: usize, f: F) -> f64 {
+    let before = ALLOCATIONS.load(Ordering::Relaxed);
+    f();
+    let after = ALLOCATIONS.load(Ordering::Relaxed);
+    (after - before) as f64 / n_ops as f64
+}
+
+// The parameters that the benchmarks are measured for.
+struct Grid {
+    dimensions: &'static [usize],
+    population_sizes: &'static [usize],
+    // The number of arms in the memory of GMAB
+    memory_sizes: &'static [usize],
+    // The share of arms whose mean equals the mean of another arm
+    collision_rates: &'static [f64],
+}
+
+const FULL_GRID: Grid = Grid {
+    dimensions: &[2, 10, 100, 1000],
+    population_sizes: &[20, 200, 2000, 10_000],
+    memory_sizes: &[1_000, 10_000, 100_000, 1_000_000],
+    collision_rates: &[0.0, 0.5, 0.99],
+};
+
+const QUICK_GRID: Grid = Grid {
+    dimensions: &[2, 1000],
+    population_sizes: &[20, 2000],
+    memory_sizes: &[1_000, 100_000],
+    collision_rates: &[0.0, 0.99],
+};
+
+// Grid points with more actions (e.g. dimension * memory size) than this are skipped, so the
+// benchmarks fit in memory.
+const MAX_ACTIONS: usize = 10_000_000;
+
+fn grid() -> &'static Grid {
+    if std::env::args().any(|arg| arg == "--quick") {
+        &QUICK_GRID
+    } else {
+        &FULL_GRID
+    }
+}
+
+// Draws means, of which `collision_rate` collide with other means.
+fn colliding_means(rng: &mut StdRng, n: usize, collision_rate: f64) -> Vec<f64> {
+    let n_distinct = ((n as f64 * (1.0 - collision_rate)).ceil() as usize).max(1);
+    (0..n)
+        .map(|_| rng.random_range(0..n_distinct) as f64)
+        .collect()
+}
+
+// An objective without any cost, which rewards the first action
+fn zero_cost(action_vector: &[i32]) -> f64 {
+    action_vector[0] as f64
+}
+
+fn benchmark_sorted_multi_map(c: &mut Criterion) {
+    let mut group = c.benchmark_group("SortedMultiMap");
+    let n_updates = 1_000;
+
+    for &memory_size in grid().memory_sizes {
+        for &collision_rate in grid().collision_rates {
+            let mut rng = StdRng::seed_from_u64(42);
+            let mut means = colliding_means(&mut rng, memory_size, collision_rate);
+            let mut tree: SortedMultiMap<FloatKey, i32> = SortedMultiMap::new();
+            for (arm_index, &mean) in means.iter().enumerate() {
+                tree.insert(FloatKey::new(mean), arm_index as i32);
+            }
+
+            // Move random arms to new means, like the rewards of a generation do
+            let new_means = colliding_means(&mut rng, n_updates, collision_rate);
+            let updates: Vec<(usize, f64)> = new_means
+                .into_iter()
+                .map(|mean| (rng.random_range(0..memory_size), mean))
+                .collect();
+            let mut update_keys = |tree: &mut SortedMultiMap<FloatKey, i32>| {
+                for &(arm_index, mean) in &updates {
+                    let old_key = FloatKey::new(means[arm_index]);
+                    tree.update_key(&old_key, FloatKey::new(mean), arm_index as i32);
+                    means[arm_index] = mean;
+                }
+            };
+
+            let parameter = format!("{}/{}", memory_size, collision_rate);
+            let allocations = allocations_per_op(n_updates, || update_keys(&mut tree));
+            println!(
+                "SortedMultiMap/update_key/{}: {} allocations per update",
+                parameter, allocations
+            );
+
+            group.bench_function(BenchmarkId::new("update_key", &parameter), |b| {
+                b.iter(|| update_keys(black_box(&mut tree)))
+            });
+        }
+    }
+
+    group.finish();
+}
+
+fn benchmark_genetic_algorithm(c: &mut Criterion) {
+    let mut group = c.benchmark_group("GeneticAlgorithm");
+    group.sample_size(10);
+
+    for &dimension in grid().dimensions {
+        for &population_size in grid().population_sizes {
+            if dimension * population_size > MAX_ACTIONS {
+                continue;
+            }
+            let mut genetic_algorithm = GeneticAlgorithm {
+                population_size,
+                ..Default::default()
+            };
+            genetic_algorithm.set_bounds(vec![(0, 100); dimension]);
+            let population = genetic_algorithm.generate_new_population(42);
+
+            let parameter = format!("{}/{}", dimension, population_size);
+            let allocations = allocations_per_op(population_size, || {
+                let crossover_pop = genetic_algorithm.crossover(1, &population);
+                black_box(genetic_algorithm.mutate(2, &crossover_pop));
+            });
+            println!(
+                "GeneticAlgorithm/{}: {} allocations per individual",
+                parameter, allocations
+            );
+
+            group.bench_with_input(
+                BenchmarkId::new("crossover", &parameter),
+                &population,
+                |b, population| {
+                    b.iter(|| genetic_algorithm.crossover(1, black_box(population)));
+                },
+            );
+            group.bench_with_input(
+                BenchmarkId::new("mutate", &parameter),
+                &population,
+                |b, population| b.iter(|| genetic_algorithm.mutate(2, black_box(population))),
+            );
+        }
+    }
+
+    group.finish();
+}
+
+fn benchmark_ucb_selection(c: &mut Criterion) {
+    let mut group = c.benchmark_group("UCB Selection");
+
+    for &memory_size in grid().memory_sizes {
+        for &collision_rate in grid().collision_rates {
+            // Fill the memory with distinct arms, with colliding means and spread numbers of
+            // evaluations, and evaluate one generation to start the optimization
+            let mut rng = StdRng::seed_from_u64(42);
+            let means = colliding_means(&mut rng, memory_size, collision_rate);
+            let arms: Vec<Arm> = means
+                .iter()
+                .enumerate()
+                .map(|(i, &mean)| {
+                    let action_vector = [
+                        (i % 100) as i32,
+                        (i / 100 % 100) as i32,
+                        (i / 10_000) as i32,
+                    ];
+                    Arm::from_statistics(&action_vector, mean, 1.0, rng.random_range(1..=50))
+                })
+                .collect();
+            let mut gmab = GMAB::new(Default::default());
+            gmab.warm_start(&arms, 1.0);
+            gmab.start(vec![(0, 99); 3], Some(42));
+            for (ticket, action_vector) in gmab.ask(usize::MAX) {
+                gmab.tell(ticket, zero_cost(&action_vector));
+            }
+
+            let parameter = format!("{}/{}", memory_size, collision_rate);
+            let allocations = allocations_per_op(1, || {
+                black_box(gmab.best_arm());
+            });
+            println!(
+                "UCB Selection/best_arm/{}: {} allocations per selection",
+                parameter, allocations
+            );
+
+            group.bench_function(BenchmarkId::new("best_arm", &parameter), |b| {
+                b.iter(|| black_box(&gmab).best_arm())
+            });
+        }
+    }
+
+    group.finish();
+}
+
+fn benchmark_arm_lookup(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Arm Lookup");
+    let n_probes = 10_000;
+
+    for &dimension in grid().dimensions {
+        for &memory_size in grid().memory_sizes {
+            if dimension * memory_size > MAX_ACTIONS {
+                continue;
+            }
+            // Probe with a mix of known and unknown action vectors
+            let mut rng = StdRng::seed_from_u64(42);
+            let mut arm_index = ArmIndex::with_capacity(dimension, memory_size);
+            let mut action_vector = vec![0; dimension];
+            while arm_index.len() < memory_size {
+                action_vector.fill_with(|| rng.random_range(0..i32::MAX));
+                arm_index.insert(&action_vector);
+            }
+            let probes: Vec<Vec<i32>> = (0..n_probes)
+                .map(|i| {
+                    if i % 2 == 0 {
+                        let known = rng.random_range(0..memory_size) as i32;
+                        arm_index.action_vector(known).to_vec()
+                    } else {
+                        (0..dimension)
+                            .map(|_| rng.random_range(0..i32::MAX))
+                            .collect()
+                    }
+                })
+                .collect();
+
+            let parameter = format!("{}/{}", dimension, memory_size);
+            let allocations = allocations_per_op(n_probes, || {
+                for probe in &probes {
+                    black_box(arm_index.get(probe));
+                }
+            });
+            println!(
+                "Arm Lookup/ArmIndex/{}: {} allocations per probe",
+                parameter, allocations
+            );
+
+            group.bench_with_input(
+                BenchmarkId::new("ArmIndex", &parameter),
+                &probes,
+                |b, probes| {
+                    b.iter(|| {
+                        for probe in probes {
+                            black_box(arm_index.get(black_box(probe)));
+                        }
+                    });
+                },
+            );
+        }
+    }
+
+    group.finish();
+}
+
+fn benchmark_generation(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Generation");
+    group.sample_size(10);
+
+    for &dimension in grid().dimensions {
+        for &population_size in grid().population_sizes {
+            if dimension * population_size > MAX_ACTIONS {
+                continue;
+            }
+            // The initial population and two bred generations
+            let n_trials = 5 * population_size;
+            let bounds = vec![(0, 100); dimension];
+            let genetic_algorithm = GeneticAlgorithm {
+                population_size,
+                ..Default::default()
+            };
+            let optimize = || {
+                GMAB::new(genetic_algorithm.clone()).optimize(
+                    zero_cost,
+                    bounds.clone(),
+                    n_trials,
+                    1,
+                    Some(42),
+                )
+            };
+
+            let parameter = format!("{}/{}", dimension, population_size);
+            let allocations = allocations_per_op(n_trials, || {
+                black_box(optimize());
+            });
+            println!(
+                "Generation/{}: {} allocations per trial",
+                parameter, allocations
+            );
+
+            group.bench_function(BenchmarkId::new("optimize", &parameter), |b| {
+                b.iter(optimize)
+            });
+        }
+    }
+
+    group.finish();
+}
+
+criterion_group!(
+    benches,
+    benchmark_sorted_multi_map,
+    benchmark_genetic_algorithm,
+    benchmark_ucb_selection,
+    benchmark_arm_lookup,
+    benchmark_generation
+);
+criterion_main!(benches);
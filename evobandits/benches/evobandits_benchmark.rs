@@ -14,11 +14,14 @@
 
 use criterion::{criterion_group, criterion_main, BenchmarkId, Criterion};
 use evobandits::evobandits::GMAB;
-use rand::rng;
+use evobandits::parallel::ParallelOptimizationFn;
+use evobandits::seeded::SeededOptimizationFn;
+use rand::rngs::StdRng;
+use rand::SeedableRng;
 use rand_distr::{Distribution, Normal};
 use std::hint::black_box;
 
-pub fn noisy_rosenbrock(x: &[i32]) -> f64 {
+pub fn noisy_rosenbrock(x: &[i32], seed: u64) -> f64 {
     let x_f64 = x[0] as f64 / 10.0;
     let y_f64 = x[1] as f64 / 10.0;
 
@@ -27,14 +30,25 @@ pub fn noisy_rosenbrock(x: &[i32]) -> f64 {
     let term2 = 100.0 * (y_f64 - x_f64.powi(2)).powi(2);
     let base_value = term1 + term2;
 
-    // Add Gaussian noise
-    let mut rng = rng();
+    // Add Gaussian noise, drawn with the seed of the pull to be reproducible
+    let mut rng = StdRng::seed_from_u64(seed);
     let normal = Normal::new(0.0, 5.0).unwrap();
     let noise = normal.sample(&mut rng);
 
     base_value + noise
 }
 
+// Deterministic objective with an artificial workload, to model an expensive simulation
+pub fn expensive_rosenbrock(x: &[i32]) -> f64 {
+    let mut value = 0.0;
+    for i in 0..10_000 {
+        let x_f64 = (x[0] + i % 3) as f64 / 10.0;
+        let y_f64 = x[1] as f64 / 10.0;
+        value += (1.0 - x_f64).powi(2) + 100.0 * (y_f64 - x_f64.powi(2)).powi(2);
+    }
+    black_box(value) / 10_000.0
+}
+
 fn benchmark_evobandits(c: &mut Criterion) {
     let mut group = c.benchmark_group("Rosenbrock Optimization");
 
@@ -52,7 +66,7 @@ fn benchmark_evobandits(c: &mut Criterion) {
 
                     // Run the optimization
                     let result = gmab.optimize(
-                        black_box(noisy_rosenbrock),
+                        black_box(SeededOptimizationFn::new(noisy_rosenbrock)),
                         black_box(bounds),
                         black_box(n_trials),
                         1,
@@ -68,5 +82,40 @@ fn benchmark_evobandits(c: &mut Criterion) {
     group.finish();
 }
 
-criterion_group!(benches, benchmark_evobandits);
+fn benchmark_parallel_evobandits(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Parallel Rosenbrock Optimization");
+
+    group.sample_size(10);
+
+    // Compare the wall-clock time for different numbers of worker threads
+    for n_workers in [1, 2, 4, 8].iter() {
+        group.bench_with_input(
+            BenchmarkId::new("Expensive", n_workers),
+            n_workers,
+            |b, &n_workers| {
+                b.iter(|| {
+                    let mut gmab = GMAB::new(Default::default());
+                    let bounds = vec![(-50, 50), (-50, 50)];
+                    let opti_function =
+                        ParallelOptimizationFn::new(expensive_rosenbrock, n_workers);
+
+                    // Run the optimization
+                    let result = gmab.optimize(
+                        black_box(opti_function),
+                        black_box(bounds),
+                        black_box(1_000),
+                        1,
+                        Some(42),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+criterion_group!(benches, benchmark_evobandits, benchmark_parallel_evobandits);
 criterion_main!(benches);
@@ -16,6 +16,24 @@ use std::hash::{Hash, Hasher};
 
 pub trait OptimizationFn {
     fn evaluate(&self, action_vector: &[i32]) -> f64;
+
+    // Evaluates the action vector of a pull with the seed of the pull, see `seeded::pull_seed`.
+    // Stochastic objectives can draw from a generator seeded with it, to be reproducible with any
+    // evaluation schedule. By default, the seed is ignored.
+    fn evaluate_seeded(&self, action_vector: &[i32], _seed: u64) -> f64 {
+        self.evaluate(action_vector)
+    }
+
+    // Evaluates all pending pulls of a generation, each with the seed of its pull. The rewards must
+    // be returned in the same order as the action vectors. By default, the action vectors are
+    // evaluated one after another.
+    fn evaluate_batch(&self, action_vectors: &[&[i32]], seeds: &[u64]) -> Vec<f64> {
+        action_vectors
+            .iter()
+            .zip(seeds)
+            .map(|(action_vector, &seed)| self.evaluate_seeded(action_vector, seed))
+            .collect()
+    }
 }
 
 impl<F: Fn(&[i32]) -> f64> OptimizationFn for F {
@@ -24,21 +42,12 @@ impl<F: Fn(&[i32]) -> f64> OptimizationFn for F {
     }
 }
 
+// A snapshot of an arm: its action vector and the statistics of its observed rewards.
+//
+// During the optimization, the arms are kept in the ArmStore and referenced by their index. An Arm
+// is only built to hand an arm out of the store, e.g. as a result of the optimization.
 #[derive(Debug)]
 pub struct Arm {
-    // Tracks the running mean (`value`) and corrected sum of squares (`corr_ssq`) of observed rewards
-    // using Welford’s one‐pass algorithm. On each new reward `g`, we incrementally update:
-    //   let delta = g - value;
-    //   value += delta / n;
-    //   corr_ssq += delta * (g - value);
-    // `delta` is the difference between the incoming reward x and the current mean (value),
-    // i.e. the instantaneous error used to update both the mean and the corrected sum of squares.
-    //
-    // This yields a numerically stable estimate of the variance (corr_ssq / (n - 1)) without storing
-    // all past samples. It prevents catastrophic cancellation and maintains accuracy in a single pass.
-    //
-    // Source: Welford, B. P. (1962) ‘Note on a Method for Calculating Corrected Sums of Squares and Products’,
-    // Technometrics, 4(3), pp. 419–420. doi: 10.1080/00401706.1962.10490022.
     action_vector: Vec<i32>,
     n_evaluations: i32,
     value: f64,
@@ -47,34 +56,44 @@ pub struct Arm {
 
 impl Arm {
     pub fn new(action_vector: &[i32]) -> Self {
+        Self::with_statistics(action_vector, 0, 0.0, 0.0)
+    }
+
+    // Builds an arm from the statistics of rewards that have been observed before, e.g. to warm
+    // start an optimization with the results of an earlier one.
+    pub fn from_statistics(
+        action_vector: &[i32],
+        value: f64,
+        value_std_dev: f64,
+        n_evaluations: i32,
+    ) -> Self {
+        assert!(
+            n_evaluations >= 0,
+            "n_evaluations must not be negative. ({})",
+            n_evaluations
+        );
+        let corr_ssq = value_std_dev.powi(2) * (n_evaluations - 1).max(0) as f64;
+        Self::with_statistics(action_vector, n_evaluations, value, corr_ssq)
+    }
+
+    pub(crate) fn with_statistics(
+        action_vector: &[i32],
+        n_evaluations: i32,
+        value: f64,
+        corr_ssq: f64,
+    ) -> Self {
         Self {
             action_vector: action_vector.to_vec(),
-            n_evaluations: 0,
-            value: 0.0,
-            corr_ssq: 0.0,
+            n_evaluations,
+            value,
+            corr_ssq,
         }
     }
 
-    pub(crate) fn pull<F: OptimizationFn>(&mut self, opt_fn: &F) -> f64 {
-        let g = opt_fn.evaluate(&self.action_vector);
-
-        // Update Arm according to Welford's algorithm (see above)
-        self.n_evaluations += 1;
-        let delta = g - self.value;
-        self.value += delta / self.n_evaluations as f64;
-        self.corr_ssq += delta * (g - self.value);
-
-        g
-    }
-
     pub fn get_n_evaluations(&self) -> i32 {
         self.n_evaluations
     }
 
-    pub(crate) fn get_function_value<F: OptimizationFn>(&self, opt_fn: &F) -> f64 {
-        opt_fn.evaluate(&self.action_vector)
-    }
-
     pub fn get_action_vector(&self) -> &[i32] {
         &self.action_vector
     }
@@ -86,6 +105,11 @@ impl Arm {
         self.value
     }
 
+    // The corrected sum of squares of the rewards, see ArmStore.
+    pub(crate) fn corr_ssq(&self) -> f64 {
+        self.corr_ssq
+    }
+
     pub fn get_value_std_dev(&self) -> f64 {
         if self.n_evaluations <= 1 {
             return 0.0;
@@ -123,80 +147,57 @@ impl Hash for Arm {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use std::cell::RefCell;
-    use std::rc::Rc;
 
     // Mock optimization function for testing
-    fn mock_opti_function(_vec: &[i32]) -> f64 {
-        5.0
+    fn mock_opti_function(vec: &[i32]) -> f64 {
+        vec.iter().map(|&x| x as f64).sum()
     }
 
     #[test]
-    fn test_arm_new() {
-        let arm = Arm::new(&vec![1, 2]);
-        assert_eq!(arm.get_n_evaluations(), 0);
-        assert_eq!(arm.get_function_value(&mock_opti_function), 5.0);
+    fn test_evaluate_batch() {
+        let action_vectors: Vec<&[i32]> = vec![&[1, 2], &[3, 4]];
+        assert_eq!(
+            mock_opti_function.evaluate_batch(&action_vectors, &[0, 1]),
+            vec![3.0, 7.0]
+        );
     }
 
     #[test]
-    fn test_arm_pull() {
-        let mut arm = Arm::new(&vec![1, 2]);
-        let reward = arm.pull(&mock_opti_function);
-
-        assert_eq!(reward, 5.0);
-        assert_eq!(arm.get_n_evaluations(), 1);
-        assert_eq!(arm.get_value(), 5.0);
-        assert_eq!(arm.get_value_std_dev(), 0.0);
+    fn test_arm_new() {
+        let arm = Arm::new(&vec![1, 2]);
+        assert_eq!(arm.get_n_evaluations(), 0);
+        assert_eq!(arm.get_action_vector(), &[1, 2]);
     }
 
     #[test]
-    fn test_arm_pull_multiple() {
-        let mut arm = Arm::new(&vec![1, 2]);
-        arm.pull(&mock_opti_function);
-        arm.pull(&mock_opti_function);
-
-        assert_eq!(arm.get_n_evaluations(), 2);
-        assert_eq!(arm.get_value(), 5.0); // Since reward is always 5.0
-        assert_eq!(arm.get_value_std_dev(), 0.0) // Since reward is always 5.0
+    fn test_arm_with_statistics() {
+        // Statistics of the rewards [0, 2, 4]
+        let arm = Arm::with_statistics(&[1, 2], 3, 2.0, 8.0);
+        assert_eq!(arm.get_n_evaluations(), 3);
+        assert_eq!(arm.get_value(), 2.0);
+        assert!((arm.get_value_std_dev() - 2.0).abs() < 1e-10);
     }
 
     #[test]
-    fn test_arm_variance_non_constant_rewards() {
-        let values = vec![0.0, 2.0, 4.0];
-        let index = Rc::new(RefCell::new(0));
-
-        let variable_fn = {
-            let values = values.clone();
-            let index = Rc::clone(&index);
-
-            move |_: &[i32]| {
-                let i = *index.borrow();
-                let val = values[i];
-                *index.borrow_mut() += 1;
-                val
-            }
-        };
-
-        let mut arm = Arm::new(&vec![0]);
-        arm.pull(&variable_fn);
-        arm.pull(&variable_fn);
-        arm.pull(&variable_fn);
-
-        // Verify expected sample std_dev of [0, 2, 4]
+    fn test_arm_from_statistics() {
+        let arm = Arm::from_statistics(&[1, 2], 2.0, 2.0, 3);
+        assert_eq!(arm.get_n_evaluations(), 3);
+        assert_eq!(arm.get_value(), 2.0);
         assert!((arm.get_value_std_dev() - 2.0).abs() < 1e-10);
+
+        // A single evaluation has no spread
+        let arm = Arm::from_statistics(&[1, 2], 2.0, 2.0, 1);
+        assert_eq!(arm.get_value_std_dev(), 0.0);
     }
 
     #[test]
     fn test_arm_clone() {
-        let arm = Arm::new(&vec![1, 2]);
+        let arm = Arm::with_statistics(&[1, 2], 2, 5.0, 0.0);
         let cloned_arm = arm.clone();
 
         assert_eq!(arm.get_n_evaluations(), cloned_arm.get_n_evaluations());
-        assert_eq!(
-            arm.get_function_value(&mock_opti_function),
-            cloned_arm.get_function_value(&mock_opti_function)
-        );
         assert_eq!(arm.get_action_vector(), cloned_arm.get_action_vector());
+        assert_eq!(arm.get_value(), cloned_arm.get_value());
         assert_eq!(arm.get_value_std_dev(), cloned_arm.get_value_std_dev());
     }
 
@@ -217,15 +218,4 @@ mod tests {
         let arm = Arm::new(&vec![1, 2]);
         assert_eq!(arm.get_value_std_dev(), 0.0);
     }
-
-    #[test]
-    fn test_clone_after_pulls() {
-        let mut arm = Arm::new(&vec![1, 2]);
-        arm.pull(&mock_opti_function);
-        arm.pull(&mock_opti_function);
-        let cloned_arm = arm.clone();
-        assert_eq!(arm.get_n_evaluations(), cloned_arm.get_n_evaluations());
-        assert_eq!(arm.get_value(), cloned_arm.get_value());
-        assert_eq!(arm.get_value_std_dev(), cloned_arm.get_value_std_dev());
-    }
 }
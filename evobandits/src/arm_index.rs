@@ -0,0 +1,234 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::collections::HashMap;
+use std::hash::{BuildHasherDefault, Hasher};
+
+const NO_SLOT: u32 = u32::MAX;
+const SEED: u64 = 0x51_7c_c1_b7_27_22_0a_95;
+
+// Hashes an action vector with a fast, non-cryptographic hash (as in FxHash), followed by a
+// final mixing step, so that all bits of the hash are usable by the table.
+fn hash_action_vector(action_vector: &[i32]) -> u64 {
+    let mut hash: u64 = 0;
+    for &action in action_vector {
+        hash = (hash.rotate_left(5) ^ action as u32 as u64).wrapping_mul(SEED);
+    }
+    hash ^= hash >> 33;
+    hash = hash.wrapping_mul(0xff51_afd7_ed55_8ccd);
+    hash ^ (hash >> 33)
+}
+
+// The keys of the table are hashes already, so they are used as they are.
+#[derive(Debug, Default, Clone, Copy)]
+struct IdentityHasher(u64);
+
+impl Hasher for IdentityHasher {
+    fn finish(&self) -> u64 {
+        self.0
+    }
+
+    fn write(&mut self, bytes: &[u8]) {
+        for &byte in bytes {
+            self.0 = (self.0 << 8) | byte as u64;
+        }
+    }
+
+    fn write_u64(&mut self, value: u64) {
+        self.0 = value;
+    }
+}
+
+// Interns action vectors, and maps each of them to its arm index.
+//
+// All keys are stored in one flat buffer (with a stride of the action vector's dimension), in the
+// order of their insertion, so the slot of a key doubles as its arm index. The table maps the hash
+// of a key to its slot, and keys with the same hash are chained through `next`. The index can be
+// probed with a borrowed slice, so a lookup does not allocate, and inserting a key only appends to
+// the buffers.
+#[derive(Debug, Clone, Default)]
+pub struct ArmIndex {
+    dimension: usize,
+    keys: Vec<i32>,
+    next: Vec<u32>,
+    table: HashMap<u64, u32, BuildHasherDefault<IdentityHasher>>,
+}
+
+impl ArmIndex {
+    pub fn new() -> Self {
+        Default::default()
+    }
+
+    pub fn with_capacity(dimension: usize, capacity: usize) -> Self {
+        ArmIndex {
+            dimension,
+            keys: Vec::with_capacity(dimension * capacity),
+            next: Vec::with_capacity(capacity),
+            table: HashMap::with_capacity_and_hasher(capacity, Default::default()),
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.next.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.next.is_empty()
+    }
+
+    pub fn dimension(&self) -> usize {
+        self.dimension
+    }
+
+    // The action vector of the arm with the given index.
+    pub fn action_vector(&self, arm_index: i32) -> &[i32] {
+        let start = arm_index as usize * self.dimension;
+        &self.keys[start..start + self.dimension]
+    }
+
+    // All action vectors in the order of their arm indexes, as one flat buffer.
+    pub fn action_vectors(&self) -> &[i32] {
+        &self.keys
+    }
+
+    fn find_slot(&self, hash: u64, action_vector: &[i32]) -> Option<u32> {
+        if action_vector.len() != self.dimension {
+            return None;
+        }
+
+        let mut slot = *self.table.get(&hash)?;
+        while slot != NO_SLOT {
+            if self.action_vector(slot as i32) == action_vector {
+                return Some(slot);
+            }
+            slot = self.next[slot as usize];
+        }
+        None
+    }
+
+    pub fn get(&self, action_vector: &[i32]) -> Option<i32> {
+        let hash = hash_action_vector(action_vector);
+        self.find_slot(hash, action_vector).map(|slot| slot as i32)
+    }
+
+    // Appends the action vector, if it is not in the index yet. Returns true if it was appended,
+    // and the arm index of the action vector is `len() - 1` in this case.
+    pub fn insert(&mut self, action_vector: &[i32]) -> bool {
+        let hash = hash_action_vector(action_vector);
+        self.insert_with_hash(hash, action_vector)
+    }
+
+    fn insert_with_hash(&mut self, hash: u64, action_vector: &[i32]) -> bool {
+        if self.is_empty() {
+            self.dimension = action_vector.len();
+        }
+        assert_eq!(
+            action_vector.len(),
+            self.dimension,
+            "All action vectors in the ArmIndex must have the same dimension."
+        );
+
+        if self.find_slot(hash, action_vector).is_some() {
+            return false;
+        }
+
+        let slot = self.len() as u32;
+        let head = self.table.insert(hash, slot).unwrap_or(NO_SLOT);
+        self.keys.extend_from_slice(action_vector);
+        self.next.push(head);
+        true
+    }
+}
+
+impl PartialEq for ArmIndex {
+    // Two indexes are equal if they hold the same action vectors under the same arm indexes.
+    fn eq(&self, other: &Self) -> bool {
+        self.len() == other.len() && self.keys == other.keys
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_arm_index_insert_and_get() {
+        let mut index = ArmIndex::new();
+        assert!(index.is_empty());
+
+        assert!(index.insert(&[1, 2]));
+        assert!(index.insert(&[2, 1]));
+
+        assert_eq!(index.len(), 2);
+        assert_eq!(index.dimension(), 2);
+        assert_eq!(index.get(&[1, 2]), Some(0));
+        assert_eq!(index.get(&[2, 1]), Some(1));
+        assert_eq!(index.get(&[1, 1]), None);
+        assert_eq!(index.get(&[1, 2, 3]), None);
+        assert_eq!(index.action_vector(1), &[2, 1]);
+        assert_eq!(index.action_vectors(), &[1, 2, 2, 1]);
+    }
+
+    #[test]
+    fn test_arm_index_insert_existing() {
+        let mut index = ArmIndex::new();
+        assert!(index.insert(&[1, 2]));
+        assert!(!index.insert(&[1, 2]));
+
+        assert_eq!(index.len(), 1);
+        assert_eq!(index.get(&[1, 2]), Some(0));
+    }
+
+    #[test]
+    fn test_arm_index_hash_collisions() {
+        // Force all keys into a single chain by sharing one hash
+        let mut index = ArmIndex::new();
+        for action_vector in [[0, 0], [0, 1], [1, 0]].iter() {
+            assert!(index.insert_with_hash(42, action_vector));
+        }
+        assert!(!index.insert_with_hash(42, &[0, 1]));
+
+        assert_eq!(index.len(), 3);
+        assert_eq!(index.find_slot(42, &[0, 0]), Some(0));
+        assert_eq!(index.find_slot(42, &[0, 1]), Some(1));
+        assert_eq!(index.find_slot(42, &[1, 0]), Some(2));
+        assert_eq!(index.find_slot(42, &[1, 1]), None);
+    }
+
+    #[test]
+    #[should_panic = "dimension"]
+    fn test_arm_index_panics_on_dimension_mismatch() {
+        let mut index = ArmIndex::new();
+        index.insert(&[1, 2]);
+        index.insert(&[1, 2, 3]);
+    }
+
+    #[test]
+    fn test_arm_index_eq() {
+        let mut index = ArmIndex::new();
+        index.insert(&[1, 2]);
+        index.insert(&[2, 1]);
+
+        let mut other = ArmIndex::with_capacity(2, 8);
+        other.insert(&[1, 2]);
+        other.insert(&[2, 1]);
+        assert_eq!(index, other);
+
+        // The same action vectors under different arm indexes
+        let mut reversed = ArmIndex::new();
+        reversed.insert(&[2, 1]);
+        reversed.insert(&[1, 2]);
+        assert_ne!(index, reversed);
+    }
+}
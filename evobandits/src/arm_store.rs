@@ -0,0 +1,290 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use crate::arm::Arm;
+use crate::arm_index::ArmIndex;
+use crate::snapshot::{invalid_data, SnapshotReader, SnapshotWriter};
+use std::io;
+
+// Stores all arms of an optimization as a structure of arrays.
+//
+// The action vectors live in the contiguous buffer of the ArmIndex, which also maps them to their
+// arm index. The statistics of the arms are kept in parallel arrays, so an arm is only an index
+// into the store, and no arm owns a heap allocation of its own.
+//
+// Tracks the running mean (`value`) and corrected sum of squares (`corr_ssq`) of observed rewards
+// using Welford’s one‐pass algorithm. On each new reward `g`, we incrementally update:
+//   let delta = g - value;
+//   value += delta / n;
+//   corr_ssq += delta * (g - value);
+// `delta` is the difference between the incoming reward x and the current mean (value),
+// i.e. the instantaneous error used to update both the mean and the corrected sum of squares.
+//
+// This yields a numerically stable estimate of the variance (corr_ssq / (n - 1)) without storing
+// all past samples. It prevents catastrophic cancellation and maintains accuracy in a single pass.
+//
+// Source: Welford, B. P. (1962) ‘Note on a Method for Calculating Corrected Sums of Squares and Products’,
+// Technometrics, 4(3), pp. 419–420. doi: 10.1080/00401706.1962.10490022.
+#[derive(Debug, PartialEq, Clone, Default)]
+pub(crate) struct ArmStore {
+    action_vectors: ArmIndex,
+    n_evaluations: Vec<i32>,
+    value: Vec<f64>,
+    corr_ssq: Vec<f64>,
+}
+
+impl ArmStore {
+    pub fn new() -> Self {
+        Default::default()
+    }
+
+    pub fn len(&self) -> usize {
+        self.n_evaluations.len()
+    }
+
+    pub fn get_arm_index(&self, action_vector: &[i32]) -> Option<i32> {
+        self.action_vectors.get(action_vector)
+    }
+
+    // Adds a new arm without evaluations, and returns its index.
+    pub fn push(&mut self, action_vector: &[i32]) -> i32 {
+        assert!(
+            self.action_vectors.insert(action_vector),
+            "The arm {:?} is already in the ArmStore.",
+            action_vector
+        );
+        self.n_evaluations.push(0);
+        self.value.push(0.0);
+        self.corr_ssq.push(0.0);
+        self.len() as i32 - 1
+    }
+
+    pub fn update(&mut self, arm_index: i32, g: f64) {
+        // Update the arm according to Welford's algorithm (see above)
+        let i = arm_index as usize;
+        self.n_evaluations[i] += 1;
+        let delta = g - self.value[i];
+        self.value[i] += delta / self.n_evaluations[i] as f64;
+        self.corr_ssq[i] += delta * (g - self.value[i]);
+    }
+
+    // Merges the statistics of rewards that have been observed elsewhere into the arm, as if the
+    // rewards had been applied with `update` (see Chan et al. for the pairwise update).
+    pub fn merge(&mut self, arm_index: i32, n_evaluations: i32, value: f64, corr_ssq: f64) {
+        let i = arm_index as usize;
+        let n_a = self.n_evaluations[i] as f64;
+        let n_b = n_evaluations as f64;
+        let n = n_a + n_b;
+        let delta = value - self.value[i];
+        self.n_evaluations[i] += n_evaluations;
+        self.value[i] += delta * n_b / n;
+        self.corr_ssq[i] += corr_ssq + delta * delta * n_a * n_b / n;
+    }
+
+    // Replaces the statistics of the arm with statistics that have been observed elsewhere.
+    pub fn replace(&mut self, arm_index: i32, n_evaluations: i32, value: f64, corr_ssq: f64) {
+        let i = arm_index as usize;
+        self.n_evaluations[i] = n_evaluations;
+        self.value[i] = value;
+        self.corr_ssq[i] = corr_ssq;
+    }
+
+    pub fn dimension(&self) -> usize {
+        self.action_vectors.dimension()
+    }
+
+    pub fn action_vector(&self, arm_index: i32) -> &[i32] {
+        self.action_vectors.action_vector(arm_index)
+    }
+
+    pub fn get_n_evaluations(&self, arm_index: i32) -> i32 {
+        self.n_evaluations[arm_index as usize]
+    }
+
+    pub fn get_value(&self, arm_index: i32) -> f64 {
+        self.value[arm_index as usize]
+    }
+
+    pub fn get_value_std_dev(&self, arm_index: i32) -> f64 {
+        let i = arm_index as usize;
+        if self.n_evaluations[i] <= 1 {
+            return 0.0;
+        }
+        (self.corr_ssq[i] / (self.n_evaluations[i] - 1) as f64).sqrt()
+    }
+
+    // Copies the arm out of the store, e.g. to return it as a result.
+    pub fn get_arm(&self, arm_index: i32) -> Arm {
+        let i = arm_index as usize;
+        Arm::with_statistics(
+            self.action_vector(arm_index),
+            self.n_evaluations[i],
+            self.value[i],
+            self.corr_ssq[i],
+        )
+    }
+
+    pub fn write_snapshot(&self, writer: &mut SnapshotWriter) {
+        writer.write_usize(self.action_vectors.dimension());
+        writer.write_i32s(self.action_vectors.action_vectors());
+        writer.write_i32s(&self.n_evaluations);
+        writer.write_f64s(&self.value);
+        writer.write_f64s(&self.corr_ssq);
+    }
+
+    pub fn read_snapshot(reader: &mut SnapshotReader) -> io::Result<Self> {
+        let dimension = reader.read_usize()?;
+        let keys = reader.read_i32s()?;
+        let n_evaluations = reader.read_i32s()?;
+        let value = reader.read_f64s()?;
+        let corr_ssq = reader.read_f64s()?;
+
+        let len = n_evaluations.len();
+        if value.len() != len
+            || corr_ssq.len() != len
+            || keys.len() != len * dimension
+            || (dimension == 0 && len > 0)
+            || value.iter().any(|value| value.is_nan())
+        {
+            return Err(invalid_data("Snapshot contains invalid arms."));
+        }
+
+        // Re-inserting the action vectors in order restores their arm indexes
+        let mut action_vectors = ArmIndex::with_capacity(dimension, len);
+        for action_vector in keys.chunks(dimension.max(1)) {
+            if !action_vectors.insert(action_vector) {
+                return Err(invalid_data("Snapshot contains duplicate arms."));
+            }
+        }
+
+        Ok(Self {
+            action_vectors,
+            n_evaluations,
+            value,
+            corr_ssq,
+        })
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_arm_store_push() {
+        let mut store = ArmStore::new();
+        assert_eq!(store.push(&[1, 2]), 0);
+        assert_eq!(store.push(&[2, 1]), 1);
+
+        assert_eq!(store.len(), 2);
+        assert_eq!(store.get_arm_index(&[2, 1]), Some(1));
+        assert_eq!(store.get_arm_index(&[1, 1]), None);
+        assert_eq!(store.action_vector(1), &[2, 1]);
+        assert_eq!(store.get_n_evaluations(1), 0);
+        assert_eq!(store.get_arm(0), Arm::new(&[1, 2]));
+    }
+
+    #[test]
+    #[should_panic = "already in the ArmStore"]
+    fn test_arm_store_push_existing() {
+        let mut store = ArmStore::new();
+        store.push(&[1, 2]);
+        store.push(&[1, 2]);
+    }
+
+    #[test]
+    fn test_arm_store_update() {
+        let mut store = ArmStore::new();
+        let arm_index = store.push(&[1, 2]);
+        store.update(arm_index, 5.0);
+
+        let arm = store.get_arm(arm_index);
+        assert_eq!(arm.get_n_evaluations(), 1);
+        assert_eq!(arm.get_value(), 5.0);
+        assert_eq!(arm.get_value_std_dev(), 0.0);
+
+        store.update(arm_index, 5.0);
+        let arm = store.get_arm(arm_index);
+        assert_eq!(arm.get_n_evaluations(), 2);
+        assert_eq!(arm.get_value(), 5.0);
+        assert_eq!(arm.get_value_std_dev(), 0.0);
+    }
+
+    #[test]
+    fn test_arm_store_merge() {
+        let rewards = [1.0, 4.0, 2.0, 8.0, 5.0];
+        let mut store = ArmStore::new();
+        let updated = store.push(&[1]);
+        for &g in &rewards {
+            store.update(updated, g);
+        }
+
+        // Merging the statistics of two halves matches updating with all rewards
+        let mut other = ArmStore::new();
+        let (first, second) = (other.push(&[1]), other.push(&[2]));
+        for &g in &rewards[..2] {
+            other.update(first, g);
+        }
+        for &g in &rewards[2..] {
+            other.update(second, g);
+        }
+        let merged = other.get_arm(second);
+        other.merge(
+            first,
+            merged.get_n_evaluations(),
+            merged.get_value(),
+            other.corr_ssq[second as usize],
+        );
+
+        assert_eq!(other.get_n_evaluations(first), 5);
+        assert!((other.get_value(first) - store.get_value(updated)).abs() < 1e-12);
+        assert!((other.corr_ssq[0] - store.corr_ssq[0]).abs() < 1e-12);
+    }
+
+    #[test]
+    fn test_arm_store_snapshot() {
+        let mut store = ArmStore::new();
+        for action_vector in [[1, 2], [2, 1], [3, 3]] {
+            let arm_index = store.push(&action_vector);
+            store.update(arm_index, arm_index as f64);
+        }
+
+        let mut writer = SnapshotWriter::new(b"TEST", 1);
+        store.write_snapshot(&mut writer);
+        let bytes = writer.into_bytes();
+
+        let mut reader = SnapshotReader::new(&bytes, b"TEST", 1).unwrap();
+        let restored = ArmStore::read_snapshot(&mut reader).unwrap();
+        reader.finish().unwrap();
+
+        assert_eq!(restored, store);
+        assert_eq!(restored.get_arm_index(&[3, 3]), Some(2));
+        assert_eq!(restored.get_value(1), 1.0);
+    }
+
+    #[test]
+    fn test_arm_store_variance_non_constant_rewards() {
+        let mut store = ArmStore::new();
+        let arm_index = store.push(&[0]);
+        for g in [0.0, 2.0, 4.0] {
+            store.update(arm_index, g);
+        }
+
+        // Verify expected sample std_dev of [0, 2, 4]
+        let arm = store.get_arm(arm_index);
+        assert_eq!(arm.get_value(), 2.0);
+        assert!((arm.get_value_std_dev() - 2.0).abs() < 1e-10);
+        assert_eq!(store.get_value_std_dev(arm_index), arm.get_value_std_dev());
+    }
+}
@@ -0,0 +1,323 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::collections::{BTreeMap, HashMap};
+use std::mem::size_of;
+use std::sync::Mutex;
+
+use crate::arm::OptimizationFn;
+
+// The estimated memory of a cache entry besides its action vector: the key, the reward, the
+// recency and the bookkeeping of both maps.
+const ENTRY_OVERHEAD: usize = 96;
+
+// A cached reward is looked up by the action vector, and the seed of the pull unless the
+// objective is deterministic.
+type CacheKey = (Box<[i32]>, Option<u64>);
+
+// Counters of an EvaluationCache.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct CacheStats {
+    pub hits: u64,
+    pub misses: u64,
+    pub evictions: u64,
+    pub entries: usize,
+    pub bytes: usize,
+}
+
+#[derive(Debug, Default)]
+struct LruState {
+    // The reward of each entry, and the tick at which it has been used last
+    entries: HashMap<CacheKey, (f64, u64)>,
+    // The entries by the tick at which they have been used last, least recently used first
+    recency: BTreeMap<u64, CacheKey>,
+    tick: u64,
+    stats: CacheStats,
+}
+
+impl LruState {
+    fn touch(&mut self, key: &CacheKey) -> Option<f64> {
+        let tick = self.tick;
+        let (reward, last_used) = self.entries.get_mut(key)?;
+        let key = self.recency.remove(last_used).unwrap();
+        *last_used = tick;
+        self.recency.insert(tick, key);
+        self.tick += 1;
+        Some(*reward)
+    }
+
+    fn evict_least_recently_used(&mut self) {
+        let (_tick, key) = self.recency.pop_first().unwrap();
+        self.entries.remove(&key);
+        self.stats.entries -= 1;
+        self.stats.bytes -= entry_bytes(&key);
+        self.stats.evictions += 1;
+    }
+}
+
+fn entry_bytes(key: &CacheKey) -> usize {
+    key.0.len() * size_of::<i32>() + ENTRY_OVERHEAD
+}
+
+// Caches the rewards of an objective, bounded by the number of entries and by their estimated
+// memory. Once a bound is reached, the least recently used entries are evicted. The rewards are
+// cached by action vector and seed of the pull, so a stochastic objective is only served a reward
+// for the same pull. For a deterministic objective, the seed is ignored. The cache can be shared
+// by the worker threads of a ParallelOptimizationFn.
+#[derive(Debug)]
+pub struct EvaluationCache {
+    max_entries: Option<usize>,
+    max_bytes: Option<usize>,
+    deterministic: bool,
+    state: Mutex<LruState>,
+}
+
+impl EvaluationCache {
+    pub fn new(max_entries: Option<usize>, max_bytes: Option<usize>, deterministic: bool) -> Self {
+        if let Some(max_entries) = max_entries {
+            assert!(
+                max_entries >= 1,
+                "max_entries must be at least 1. ({})",
+                max_entries
+            );
+        }
+        Self {
+            max_entries,
+            max_bytes,
+            deterministic,
+            state: Mutex::new(LruState::default()),
+        }
+    }
+
+    fn get(&self, key: &CacheKey) -> Option<f64> {
+        let mut state = self.state.lock().unwrap();
+        let reward = state.touch(key);
+        match reward {
+            Some(_) => state.stats.hits += 1,
+            None => state.stats.misses += 1,
+        }
+        reward
+    }
+
+    fn insert(&self, key: CacheKey, reward: f64) {
+        let bytes = entry_bytes(&key);
+        if self.max_bytes.is_some_and(|max_bytes| bytes > max_bytes) {
+            return;
+        }
+
+        let mut state = self.state.lock().unwrap();
+        if state.touch(&key).is_some() {
+            return;
+        }
+        while !state.entries.is_empty()
+            && (self
+                .max_entries
+                .is_some_and(|max_entries| state.stats.entries >= max_entries)
+                || self
+                    .max_bytes
+                    .is_some_and(|max_bytes| state.stats.bytes + bytes > max_bytes))
+        {
+            state.evict_least_recently_used();
+        }
+
+        let tick = state.tick;
+        state.tick += 1;
+        state.recency.insert(tick, key.clone());
+        state.entries.insert(key, (reward, tick));
+        state.stats.entries += 1;
+        state.stats.bytes += bytes;
+    }
+
+    fn key(&self, action_vector: &[i32], seed: Option<u64>) -> CacheKey {
+        let seed = if self.deterministic { None } else { seed };
+        (action_vector.into(), seed)
+    }
+
+    pub fn stats(&self) -> CacheStats {
+        self.state.lock().unwrap().stats
+    }
+}
+
+// Wraps an objective to serve the rewards of pulls that have been evaluated before from a cache.
+//
+// With a deterministic objective, repeated pulls of an arm (e.g. of the population in each
+// generation) are served from the cache, instead of repeating an expensive evaluation for the
+// same reward. The results are identical to an optimization without the cache.
+pub struct CachedOptimizationFn<'a, F> {
+    opti_function: F,
+    cache: &'a EvaluationCache,
+}
+
+impl<'a, F: OptimizationFn> CachedOptimizationFn<'a, F> {
+    pub fn new(opti_function: F, cache: &'a EvaluationCache) -> Self {
+        Self {
+            opti_function,
+            cache,
+        }
+    }
+}
+
+impl<F: OptimizationFn> OptimizationFn for CachedOptimizationFn<'_, F> {
+    fn evaluate(&self, action_vector: &[i32]) -> f64 {
+        let key = self.cache.key(action_vector, None);
+        self.cache.get(&key).unwrap_or_else(|| {
+            let reward = self.opti_function.evaluate(action_vector);
+            self.cache.insert(key, reward);
+            reward
+        })
+    }
+
+    fn evaluate_seeded(&self, action_vector: &[i32], seed: u64) -> f64 {
+        let key = self.cache.key(action_vector, Some(seed));
+        self.cache.get(&key).unwrap_or_else(|| {
+            let reward = self.opti_function.evaluate_seeded(action_vector, seed);
+            self.cache.insert(key, reward);
+            reward
+        })
+    }
+
+    // Looks up all pulls first, and evaluates the others in a single batch, e.g. on worker threads.
+    fn evaluate_batch(&self, action_vectors: &[&[i32]], seeds: &[u64]) -> Vec<f64> {
+        let mut rewards: Vec<Option<f64>> = Vec::with_capacity(action_vectors.len());
+        let mut misses: Vec<usize> = Vec::new();
+        for (index, (action_vector, &seed)) in action_vectors.iter().zip(seeds).enumerate() {
+            let reward = self.cache.get(&self.cache.key(action_vector, Some(seed)));
+            if reward.is_none() {
+                misses.push(index);
+            }
+            rewards.push(reward);
+        }
+
+        if !misses.is_empty() {
+            let miss_action_vectors: Vec<&[i32]> =
+                misses.iter().map(|&index| action_vectors[index]).collect();
+            let miss_seeds: Vec<u64> = misses.iter().map(|&index| seeds[index]).collect();
+            let miss_rewards = self
+                .opti_function
+                .evaluate_batch(&miss_action_vectors, &miss_seeds);
+            for (index, reward) in misses.into_iter().zip(miss_rewards) {
+                self.cache.insert(
+                    self.cache.key(action_vectors[index], Some(seeds[index])),
+                    reward,
+                );
+                rewards[index] = Some(reward);
+            }
+        }
+
+        rewards.into_iter().map(Option::unwrap).collect()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::evobandits::GMAB;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    #[test]
+    fn test_cache_evicts_least_recently_used() {
+        let cache = EvaluationCache::new(Some(2), None, false);
+        cache.insert((vec![1].into(), None), 1.0);
+        cache.insert((vec![2].into(), None), 2.0);
+        assert_eq!(cache.get(&(vec![1].into(), None)), Some(1.0));
+
+        // [2] is the least recently used entry
+        cache.insert((vec![3].into(), None), 3.0);
+        assert_eq!(cache.get(&(vec![2].into(), None)), None);
+        assert_eq!(cache.get(&(vec![1].into(), None)), Some(1.0));
+        assert_eq!(cache.get(&(vec![3].into(), None)), Some(3.0));
+
+        let stats = cache.stats();
+        assert_eq!((stats.hits, stats.misses, stats.evictions), (3, 1, 1));
+        assert_eq!(stats.entries, 2);
+        assert_eq!(stats.bytes, 2 * (size_of::<i32>() + ENTRY_OVERHEAD));
+    }
+
+    #[test]
+    fn test_cache_max_bytes() {
+        let cache = EvaluationCache::new(None, Some(ENTRY_OVERHEAD + 8), false);
+        cache.insert((vec![1, 1].into(), None), 1.0);
+        cache.insert((vec![2, 2].into(), None), 2.0);
+        assert_eq!(cache.stats().entries, 1);
+        assert_eq!(cache.get(&(vec![2, 2].into(), None)), Some(2.0));
+
+        // Entries larger than the cache are not stored
+        cache.insert((vec![3, 3, 3].into(), None), 3.0);
+        assert_eq!(cache.get(&(vec![2, 2].into(), None)), Some(2.0));
+        assert_eq!(cache.stats().evictions, 1);
+    }
+
+    #[test]
+    fn test_cached_opti_function() {
+        let n_calls = AtomicUsize::new(0);
+        let opti_function = |vec: &[i32]| {
+            n_calls.fetch_add(1, Ordering::Relaxed);
+            vec[0] as f64
+        };
+        let action_vectors: Vec<&[i32]> = vec![&[1], &[2], &[1]];
+
+        // With seeds, only the same pull is served from the cache
+        let cache = EvaluationCache::new(None, None, false);
+        let cached_fn = CachedOptimizationFn::new(&opti_function, &cache);
+        assert_eq!(
+            cached_fn.evaluate_batch(&action_vectors, &[10, 20, 30]),
+            vec![1.0, 2.0, 1.0]
+        );
+        assert_eq!(cached_fn.evaluate_seeded(&[1], 10), 1.0);
+        assert_eq!(n_calls.load(Ordering::Relaxed), 3);
+
+        // A deterministic objective is evaluated once per action vector
+        let cache = EvaluationCache::new(None, None, true);
+        let cached_fn = CachedOptimizationFn::new(&opti_function, &cache);
+        assert_eq!(
+            cached_fn.evaluate_batch(&action_vectors[..2], &[10, 20]),
+            vec![1.0, 2.0]
+        );
+        assert_eq!(cached_fn.evaluate_seeded(&[1], 30), 1.0);
+        assert_eq!(cached_fn.evaluate(&[2]), 2.0);
+        assert_eq!(n_calls.load(Ordering::Relaxed), 5);
+        let stats = cache.stats();
+        assert_eq!((stats.hits, stats.misses), (2, 2));
+    }
+
+    #[test]
+    fn test_cached_optimization_reproduces_results() {
+        fn opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+        let bounds = vec![(-10, 10); 2];
+        let expected = GMAB::new(Default::default()).optimize(
+            opti_function,
+            bounds.clone(),
+            1000,
+            3,
+            Some(42),
+        );
+
+        let n_calls = AtomicUsize::new(0);
+        let counted_fn = |vec: &[i32]| {
+            n_calls.fetch_add(1, Ordering::Relaxed);
+            opti_function(vec)
+        };
+        let cache = EvaluationCache::new(Some(100), None, true);
+        let cached_fn = CachedOptimizationFn::new(counted_fn, &cache);
+        let result = GMAB::new(Default::default()).optimize(cached_fn, bounds, 1000, 3, Some(42));
+
+        assert_eq!(result, expected);
+        let stats = cache.stats();
+        assert_eq!(stats.hits + stats.misses, 1000);
+        assert_eq!(stats.misses as usize, n_calls.load(Ordering::Relaxed));
+        assert!(stats.hits > 0);
+    }
+}
@@ -13,276 +13,1043 @@
 // limitations under the License.
 
 use crate::arm::{Arm, OptimizationFn};
+use crate::arm_store::ArmStore;
 use crate::genetic::GeneticAlgorithm;
+use crate::profile::{Phase, Profile};
+use crate::pull_count_index::{PullCountIndex, TreePosition};
+use crate::pull_log::{PullLog, SharedPullLog};
+use crate::seeded::pull_seed;
+use crate::snapshot::{invalid_data, write_atomically, Checkpoint, SnapshotReader, SnapshotWriter};
 use crate::sorted_multi_map::{FloatKey, SortedMultiMap};
+use crate::stopping::{is_separated, EarlyStop, StopReason, StoppingRules};
 use rand::prelude::SliceRandom;
-use rand::rngs::StdRng;
 use rand::{RngCore, SeedableRng};
-use std::collections::HashMap;
+use rand_chacha::ChaCha12Rng;
+use std::collections::{HashMap, VecDeque};
+use std::fs;
+use std::io;
+use std::path::Path;
+use std::time::Instant;
+
+const SNAPSHOT_MAGIC: &[u8] = b"EVOBGMAB";
+const SNAPSHOT_VERSION: u32 = 1;
+
+// The state of an optimization after a generation, as `step` reports it.
+#[derive(Debug, PartialEq, Clone)]
+pub struct Progress {
+    pub used_trials: usize,
+    // The arm that `best` would return first
+    pub best_arm: Arm,
+    // The number of arms that have been evaluated
+    pub n_arms: usize,
+}
 
 #[derive(Debug, PartialEq, Clone)]
 pub struct GMAB {
     sample_average_tree: SortedMultiMap<FloatKey, i32>,
-    arm_memory: Vec<Arm>,
-    lookup_table: HashMap<Vec<i32>, i32>,
+    pull_count_index: PullCountIndex,
+    max_number_pulls: i32,
+    arm_store: ArmStore,
     genetic_algorithm: GeneticAlgorithm,
+    common_random_numbers: bool,
+    // Whether `warm_start` has been called since the last `start`, which then keeps the arms
+    warm_started: bool,
+    // State of the ask/tell interface, which `optimize` drives as well
+    seed: u64,
+    // The generator behind StdRng, whose state can be saved and restored
+    rng: Option<ChaCha12Rng>,
+    pending_pulls: VecDeque<i32>,
+    // The arm and the seed of each asked pull, by ticket
+    in_flight: HashMap<u64, (i32, u64)>,
+    n_pulls: u64,
+    // The number of pulls of each arm since `start`, by arm index
+    run_pulls: Vec<u32>,
+    used_trials: usize,
+    // The best arm after the last generation, and the number of generations since it changed
+    best_arm: Option<i32>,
+    stale_generations: usize,
+    early_stop: Option<EarlyStop>,
+    // The counters and timers of the hot path, if profiling is enabled
+    profile: Option<Profile>,
+    // The log that every pull is recorded to, if any
+    pull_log: Option<SharedPullLog>,
 }
 
 impl GMAB {
     pub fn new(genetic_algorithm: GeneticAlgorithm) -> GMAB {
-        let arm_memory: Vec<Arm> = Vec::new();
-        let lookup_table: HashMap<Vec<i32>, i32> = HashMap::new();
         let sample_average_tree: SortedMultiMap<FloatKey, i32> = SortedMultiMap::new();
 
         GMAB {
             sample_average_tree,
-            arm_memory,
-            lookup_table,
+            pull_count_index: PullCountIndex::new(),
+            max_number_pulls: 0,
+            arm_store: ArmStore::new(),
             genetic_algorithm,
+            common_random_numbers: false,
+            warm_started: false,
+            seed: 0,
+            rng: None,
+            pending_pulls: VecDeque::new(),
+            in_flight: HashMap::new(),
+            n_pulls: 0,
+            run_pulls: Vec::new(),
+            used_trials: 0,
+            best_arm: None,
+            stale_generations: 0,
+            early_stop: None,
+            profile: None,
+            pull_log: None,
         }
     }
 
-    fn get_arm_index(&self, individual: &Arm) -> i32 {
-        match self
-            .lookup_table
-            .get(&individual.get_action_vector().to_vec())
-        {
-            Some(&index) => index,
-            None => -1,
-        }
+    // Enables common random numbers: the k-th pull of every arm gets the same seed, instead of a
+    // seed for each pull of the run. Stochastic objectives that draw their noise from the seed
+    // then evaluate all arms under the same conditions, so the differences between the means of
+    // arms have a much smaller variance than with independent noise, and close competitors are
+    // told apart with fewer pulls.
+    pub fn set_common_random_numbers(&mut self, enabled: bool) {
+        self.common_random_numbers = enabled;
     }
 
-    fn max_number_pulls(&self) -> i32 {
-        let mut max_number_pulls = 0;
-        for arm in &self.arm_memory {
-            if arm.get_n_evaluations() > max_number_pulls {
-                max_number_pulls = arm.get_n_evaluations();
-            }
-        }
-        max_number_pulls
+    pub fn get_common_random_numbers(&self) -> bool {
+        self.common_random_numbers
     }
 
-    fn find_best_ucb(&self, simulations_used: usize) -> i32 {
-        let arm_index_ucb_norm_min: i32 = *self.sample_average_tree.iter().next().unwrap().1;
-        let ucb_norm_min: f64 = self.arm_memory[arm_index_ucb_norm_min as usize].get_value();
+    pub fn get_genetic_algorithm(&self) -> &GeneticAlgorithm {
+        &self.genetic_algorithm
+    }
 
-        let max_number_pulls = self.max_number_pulls();
+    // Enables profiling of the hot path from now on, with counters and timers that start at zero,
+    // or disables it.
+    pub fn set_profiling(&mut self, enabled: bool) {
+        self.profile = enabled.then(Profile::default);
+    }
 
-        let mut ucb_norm_max: f64 = ucb_norm_min;
+    // The counters and timers since profiling has been enabled, or None if it is disabled.
+    pub fn profile(&self) -> Option<Profile> {
+        self.profile
+    }
 
-        for (_ucb_norm, arm_index) in self.sample_average_tree.iter() {
-            ucb_norm_max = f64::max(
-                ucb_norm_max,
-                self.arm_memory[*arm_index as usize].get_value(),
+    // Records every pull from now on to the pull log, e.g. for audits, or stops recording if None.
+    // Copies of the GMAB, e.g. islands, record to the same log, in the order the pulls are made.
+    pub fn set_pull_log(&mut self, pull_log: Option<PullLog>) {
+        if let Some(pull_log) = &pull_log {
+            assert!(
+                self.arm_store.len() == 0 || self.arm_store.dimension() == pull_log.dimension(),
+                "The dimension of the pull log ({}) must match the arms ({}).",
+                pull_log.dimension(),
+                self.arm_store.dimension()
             );
+        }
+        self.pull_log = pull_log.map(SharedPullLog::new);
+    }
 
-            // checks if we are still in the non dominated-set (current mean <= mean_max_pulls)
-            if self.arm_memory[*arm_index as usize].get_n_evaluations() == max_number_pulls {
-                break;
-            }
+    // Stops recording pulls, and returns the pull log, unless a copy of the GMAB still records to
+    // it. Flush the returned log to write all recorded pulls.
+    pub fn take_pull_log(&mut self) -> Option<PullLog> {
+        self.pull_log.take().and_then(SharedPullLog::into_inner)
+    }
+
+    // Records the pulls of this GMAB with the island id, e.g. of an island of `optimize_islands`.
+    pub(crate) fn set_pull_log_island(&mut self, island: u32) {
+        if let Some(pull_log) = self.pull_log.as_mut() {
+            pull_log.island = island;
+        }
+    }
+
+    fn record_pull(&self, arm_index: i32, reward: f64, seed: u64) {
+        if let Some(pull_log) = &self.pull_log {
+            pull_log
+                .record(
+                    arm_index,
+                    self.arm_store.action_vector(arm_index),
+                    reward,
+                    seed,
+                )
+                .unwrap_or_else(|err| panic!("Failed to record a pull: {}", err));
+        }
+    }
+
+    // Starts a timer for a phase, only if profiling is enabled.
+    fn start_timer(&self) -> Option<Instant> {
+        self.profile.map(|_| Instant::now())
+    }
+
+    fn stop_timer(&mut self, phase: Phase, timer: Option<Instant>) {
+        if let (Some(profile), Some(started)) = (self.profile.as_mut(), timer) {
+            profile.add_time(phase, started);
+        }
+    }
+
+    // Finds the arm with the lowest UCB value. Arms in `excluded` are skipped, as if they had been
+    // removed from the tree, e.g. the best arms that have been selected already. At least one arm
+    // must be left.
+    fn find_best_ucb(&self, simulations_used: usize, excluded: &[i32]) -> i32 {
+        let arm_index_ucb_norm_min: i32 = self
+            .sample_average_tree
+            .iter()
+            .map(|(_key, arm_index)| *arm_index)
+            .find(|arm_index| !excluded.contains(arm_index))
+            .unwrap();
+        let ucb_norm_min: f64 = self.arm_store.get_value(arm_index_ucb_norm_min);
+
+        // the non-dominated set ends with the first arm (in tree order) with the most pulls,
+        // or covers the whole tree if that arm has already been removed from the tree
+        let last_non_dominated = self
+            .pull_count_index
+            .first_with(self.max_number_pulls, excluded)
+            .or_else(|| self.pull_count_index.last(excluded))
+            .unwrap();
+
+        // the tree is sorted by mean, so the last arm of the non-dominated set has the largest mean
+        let ucb_norm_max: f64 =
+            f64::max(ucb_norm_min, self.arm_store.get_value(last_non_dominated.1));
+
+        if ucb_norm_max == ucb_norm_min {
+            return last_non_dominated.1;
         }
 
-        // find the solution of non-dominated set with the lowest associated UCB value
-        let mut best_arm_index: i32 = 0;
+        // find the solution of non-dominated set with the lowest associated UCB value. Arms with
+        // the same number of pulls share the penalty term, so only the arm with the lowest mean
+        // of each group (the head) can have the lowest UCB value.
+        let mut best_arm: Option<&TreePosition> = None;
         let mut best_ucb_value: f64 = f64::MAX;
 
-        for (_ucb_norm, arm_index) in self.sample_average_tree.iter() {
-            if ucb_norm_max == ucb_norm_min {
-                best_arm_index = *arm_index;
+        for (n_evaluations, head) in self.pull_count_index.group_heads(excluded) {
+            // checks if we are still in the non dominated-set (current mean <= mean_max_pulls)
+            if head > last_non_dominated {
+                continue;
             }
 
             // transform sample mean to interval [0,1]
-            let transformed_sample_mean: f64 = (self.arm_memory[*arm_index as usize].get_value()
-                - ucb_norm_min)
-                / (ucb_norm_max - ucb_norm_min);
-            let penalty_term: f64 = (2.0 * (simulations_used as f64).ln()
-                / self.arm_memory[*arm_index as usize].get_n_evaluations() as f64)
-                .sqrt();
+            let transformed_sample_mean: f64 =
+                (self.arm_store.get_value(head.1) - ucb_norm_min) / (ucb_norm_max - ucb_norm_min);
+            let penalty_term: f64 =
+                (2.0 * (simulations_used as f64).ln() / n_evaluations as f64).sqrt();
             let ucb_value: f64 = transformed_sample_mean + penalty_term;
 
-            // new best solution found
-            if ucb_value < best_ucb_value {
-                best_arm_index = *arm_index;
+            // new best solution found, ties are resolved in favor of the first arm in tree order
+            if ucb_value < best_ucb_value
+                || (ucb_value == best_ucb_value && best_arm.is_some_and(|best| head < best))
+            {
+                best_arm = Some(head);
                 best_ucb_value = ucb_value;
             }
+        }
 
-            // checks if we are still in the non dominated-set (current mean <= mean_max_pulls)
-            if self.arm_memory[*arm_index as usize].get_n_evaluations() == max_number_pulls {
-                break;
+        best_arm.map_or(0, |best| best.1)
+    }
+
+    fn tree_delete(&mut self, arm_index: i32) {
+        self.sample_average_tree.delete(
+            &FloatKey::new(self.arm_store.get_value(arm_index)),
+            &arm_index,
+        );
+        self.pull_count_index.delete(arm_index);
+    }
+
+    // Inserts an arm with evaluations into the tree, e.g. after its statistics have been merged.
+    fn tree_insert(&mut self, arm_index: i32) {
+        let key = FloatKey::new(self.arm_store.get_value(arm_index));
+        let n_evaluations = self.arm_store.get_n_evaluations(arm_index);
+        self.sample_average_tree.insert(key, arm_index);
+        self.pull_count_index.insert(arm_index, key, n_evaluations);
+        self.max_number_pulls = self.max_number_pulls.max(n_evaluations);
+    }
+
+    fn update_arm(&mut self, arm_index: i32, reward: f64) {
+        let old_key = FloatKey::new(self.arm_store.get_value(arm_index));
+        // arms without evaluations have not been inserted into the tree yet, and arms outside of
+        // the bounds of the run have been removed from it
+        let in_tree = self.pull_count_index.contains(arm_index);
+
+        self.arm_store.update(arm_index, reward);
+        let key = FloatKey::new(self.arm_store.get_value(arm_index));
+        let n_evaluations = self.arm_store.get_n_evaluations(arm_index);
+
+        if in_tree {
+            self.sample_average_tree
+                .update_key(&old_key, key, arm_index);
+        } else {
+            self.sample_average_tree.insert(key, arm_index);
+        }
+        self.pull_count_index.insert(arm_index, key, n_evaluations);
+        self.max_number_pulls = self.max_number_pulls.max(n_evaluations);
+        self.used_trials += 1;
+
+        if let Some(profile) = self.profile.as_mut() {
+            if n_evaluations > 1 {
+                profile.repulls += 1;
+            } else {
+                profile.new_arm_pulls += 1;
             }
+            profile.tree_reinserts += u64::from(in_tree && old_key != key);
         }
+    }
 
-        best_arm_index
+    // Counts a pull of the arm, and returns its seed: derived from the number of the pull in the
+    // run, or with common random numbers, from the number of pulls of the arm before it.
+    fn next_pull_seed(&mut self, pull: u64, arm_index: i32) -> u64 {
+        let i = arm_index as usize;
+        if self.run_pulls.len() <= i {
+            self.run_pulls.resize(i + 1, 0);
+        }
+        let arm_pull = self.run_pulls[i] as u64;
+        self.run_pulls[i] += 1;
+
+        if self.common_random_numbers {
+            pull_seed(self.seed, arm_pull)
+        } else {
+            pull_seed(self.seed, pull)
+        }
     }
 
-    fn sample_and_update<F: OptimizationFn>(
+    // Evaluates all arms at once, each with the seed of its pull, then applies the rewards in a
+    // fixed order. The pulls are numbered consecutively, starting with `first_pull`.
+    fn pull_arms<F: OptimizationFn>(
         &mut self,
-        arm_index: i32,
-        mut individual: Arm,
+        arm_indexes: &[i32],
+        first_pull: u64,
         opti_function: &F,
     ) {
-        if arm_index >= 0 {
-            self.sample_average_tree.delete(
-                &FloatKey::new(self.arm_memory[arm_index as usize].get_value()),
-                &arm_index,
-            );
-            self.arm_memory[arm_index as usize].pull(opti_function);
-            self.sample_average_tree.insert(
-                FloatKey::new(self.arm_memory[arm_index as usize].get_value()),
-                arm_index,
-            );
-        } else {
-            individual.pull(opti_function);
-            self.arm_memory.push(individual.clone());
-            self.lookup_table.insert(
-                individual.get_action_vector().to_vec(),
-                self.arm_memory.len() as i32 - 1,
-            );
-            self.sample_average_tree.insert(
-                FloatKey::new(individual.get_value()),
-                self.arm_memory.len() as i32 - 1,
-            );
+        let seeds: Vec<u64> = (first_pull..)
+            .zip(arm_indexes)
+            .map(|(pull, &arm_index)| self.next_pull_seed(pull, arm_index))
+            .collect();
+        let action_vectors: Vec<&[i32]> = arm_indexes
+            .iter()
+            .map(|&arm_index| self.arm_store.action_vector(arm_index))
+            .collect();
+        let timer = self.start_timer();
+        let rewards = opti_function.evaluate_batch(&action_vectors, &seeds);
+        self.stop_timer(Phase::Evaluation, timer);
+
+        let timer = self.start_timer();
+        for ((&arm_index, reward), seed) in arm_indexes.iter().zip(rewards).zip(seeds) {
+            self.record_pull(arm_index, reward, seed);
+            self.update_arm(arm_index, reward);
+        }
+        self.stop_timer(Phase::Update, timer);
+    }
+
+    // Adds the initial population to the arm store, and queues one pull of each of its arms. The
+    // population starts with the best arms that have been evaluated before, e.g. after a warm
+    // start, and is filled up with random individuals.
+    fn queue_initial_population(&mut self, seed: u64) {
+        let population_size = self.genetic_algorithm.population_size;
+        let mut population: Vec<i32> = self
+            .sample_average_tree
+            .iter()
+            .take(population_size)
+            .map(|(_key, arm_index)| *arm_index)
+            .collect();
+
+        let initial_population = self.genetic_algorithm.generate_new_population(seed);
+        for individual in initial_population.chunks_exact(self.genetic_algorithm.dimension) {
+            if population.len() >= population_size {
+                break;
+            }
+            let arm_index = self
+                .arm_store
+                .get_arm_index(individual)
+                .unwrap_or_else(|| self.arm_store.push(individual));
+            if !population.contains(&arm_index) {
+                population.push(arm_index);
+            }
         }
+        self.pending_pulls.extend(population);
     }
 
-    fn initialize_population<F: OptimizationFn>(&mut self, seed: u64, opti_function: &F) {
-        let mut initial_population = self.genetic_algorithm.generate_new_population(seed);
+    // Runs selection, crossover and mutation, and queues the pulls of the next generation: the
+    // mutated individuals that are not in the current population, followed by the population. New
+    // individuals are added to the arm store, so each pending pull is the index of a distinct arm,
+    // and the pulls can be evaluated in any order.
+    fn queue_next_generation(&mut self) {
+        let dimension = self.genetic_algorithm.dimension;
+        let rng = self
+            .rng
+            .as_mut()
+            .expect("GMAB must be started with bounds before asking for pulls.");
+
+        // get first self.population_size elements from sorted tree, and shuffle them
+        let mut population: Vec<i32> = self
+            .sample_average_tree
+            .iter()
+            .take(self.genetic_algorithm.population_size)
+            .map(|(_key, arm_index)| *arm_index)
+            .collect();
+        population.shuffle(rng);
+        let crossover_seed = rng.next_u64();
+        let mutation_seed = rng.next_u64();
+
+        let mut individuals: Vec<i32> = Vec::with_capacity(population.len() * dimension);
+        for &arm_index in &population {
+            individuals.extend_from_slice(self.arm_store.action_vector(arm_index));
+        }
+
+        let crossover_pop = self
+            .genetic_algorithm
+            .crossover(crossover_seed, &individuals);
 
-        for (index, individual) in initial_population.iter_mut().enumerate() {
-            individual.pull(opti_function);
-            self.arm_memory.push(individual.clone());
-            self.lookup_table
-                .insert(individual.get_action_vector().to_vec(), index as i32);
-            self.sample_average_tree
-                .insert(FloatKey::new(individual.get_value()), index as i32);
+        // mutate automatically removes duplicates
+        let mutated_pop = self.genetic_algorithm.mutate(mutation_seed, &crossover_pop);
+
+        for individual in mutated_pop.chunks_exact(dimension) {
+            let arm_index = match self.arm_store.get_arm_index(individual) {
+                // check if arm is in current population
+                Some(arm_index) if population.contains(&arm_index) => {
+                    if let Some(profile) = self.profile.as_mut() {
+                        profile.duplicate_offspring += 1;
+                    }
+                    continue;
+                }
+                Some(arm_index) => arm_index,
+                None => self.arm_store.push(individual),
+            };
+            self.pending_pulls.push_back(arm_index);
         }
+        self.pending_pulls.extend(population);
     }
 
-    fn extract_best_arms(&mut self, used_trials: usize, mut n_best: usize) -> Vec<Arm> {
-        let mut best_arms: Vec<Arm> = Vec::new();
-        while n_best > 0 {
-            // Return early if there are no more arms to extract
-            if self.sample_average_tree.is_empty() {
-                println!(
-                    "Population ({}) is smaller than n_best ({}). Returning all arms instead.",
-                    best_arms.len(),
-                    n_best
-                );
-                break;
-            }
+    // Takes up to `n` pending pulls of the current generation, and returns the number of the first
+    // pull with them. Once a generation has been handed out, the next generation is bred from the
+    // arms that have been evaluated so far, which requires at least a full population of them.
+    // Otherwise, no pulls are returned until more rewards are told.
+    fn take_pending_pulls(&mut self, n: usize) -> (u64, Vec<i32>) {
+        if self.pending_pulls.is_empty()
+            && self.sample_average_tree.len() >= self.genetic_algorithm.population_size
+        {
+            let timer = self.start_timer();
+            self.queue_next_generation();
+            self.stop_timer(Phase::Breeding, timer);
+        }
 
-            // Find the next best arm, and remove it from SAT to continue extraction
-            let best_arm_index = self.find_best_ucb(used_trials);
-            let best_arm = self.arm_memory[best_arm_index as usize].clone();
+        let n = n.min(self.pending_pulls.len());
+        let first_pull = self.n_pulls;
+        self.n_pulls += n as u64;
+        (first_pull, self.pending_pulls.drain(..n).collect())
+    }
 
-            self.sample_average_tree
-                .delete(&FloatKey::new(best_arm.get_value()), &best_arm_index);
+    // Selects the best arms one after the other, each by its UCB value among the arms that have
+    // not been selected yet. The tree is left unchanged, so the optimization can continue.
+    pub(crate) fn extract_best_arms(&self, used_trials: usize, n_best: usize) -> Vec<Arm> {
+        let n_arms = self.sample_average_tree.len();
+        if n_arms < n_best {
+            println!(
+                "Population ({}) is smaller than n_best ({}). Returning all arms instead.",
+                n_arms, n_best
+            );
+        }
 
-            best_arms.push(best_arm);
-            n_best -= 1;
+        let mut best_arm_indexes: Vec<i32> = Vec::with_capacity(n_best.min(n_arms));
+        while best_arm_indexes.len() < n_best.min(n_arms) {
+            let best_arm_index = self.find_best_ucb(used_trials, &best_arm_indexes);
+            best_arm_indexes.push(best_arm_index);
         }
 
-        best_arms
+        best_arm_indexes
+            .into_iter()
+            .map(|arm_index| self.arm_store.get_arm(arm_index))
+            .collect()
     }
 
-    pub fn optimize<F: OptimizationFn>(
-        &mut self,
-        opti_function: F,
-        bounds: Vec<(i32, i32)>,
-        n_trials: usize,
-        n_best: usize,
-        seed: Option<u64>,
-    ) -> Vec<Arm> {
+    // Starts a new optimization, that is driven by `ask` and `tell`: sets the bounds, checks the
+    // algorithm configuration, and queues the pulls of the initial population. The arms of an
+    // earlier run are forgotten, so a run only depends on its seed, unless `warm_start` has been
+    // called since: then, all arms are kept if they lie within the bounds.
+    pub fn start(&mut self, bounds: Vec<(i32, i32)>, seed: Option<u64>) {
         // Unwrap seed or fall back to system entropy
         let seed = seed.unwrap_or_else(|| rand::rng().next_u64());
-        let mut rng: StdRng = SeedableRng::seed_from_u64(seed);
+        let mut rng = ChaCha12Rng::seed_from_u64(seed);
+
+        if !self.warm_started {
+            self.sample_average_tree = SortedMultiMap::new();
+            self.pull_count_index = PullCountIndex::new();
+            self.max_number_pulls = 0;
+            self.arm_store = ArmStore::new();
+        }
+        self.warm_started = false;
 
         // Set the bounds and check the algorithm configuration
+        assert!(
+            self.arm_store.len() == 0 || self.arm_store.dimension() == bounds.len(),
+            "The dimension of the bounds ({}) must match the arms that have been evaluated before ({}).",
+            bounds.len(),
+            self.arm_store.dimension()
+        );
         self.genetic_algorithm.set_bounds(bounds);
         self.genetic_algorithm.validate();
 
+        // Arms outside of the bounds can neither be bred nor returned
+        let out_of_bounds: Vec<i32> = self
+            .sample_average_tree
+            .iter()
+            .map(|(_key, arm_index)| *arm_index)
+            .filter(|&arm_index| {
+                !self
+                    .genetic_algorithm
+                    .contains(self.arm_store.action_vector(arm_index))
+            })
+            .collect();
+        for arm_index in out_of_bounds {
+            self.tree_delete(arm_index);
+        }
+
+        self.pending_pulls.clear();
+        self.in_flight.clear();
+        self.n_pulls = 0;
+        self.run_pulls.clear();
+        self.used_trials = 0;
+        self.best_arm = None;
+        self.stale_generations = 0;
+        self.early_stop = None;
+        self.seed = seed;
+
+        let next_seed = rng.next_u64();
+        self.rng = Some(rng);
+        self.queue_initial_population(next_seed);
+    }
+
+    // Adds the statistics of arms that have been evaluated before, e.g. in the previous run of a
+    // recurring optimization, so the next optimization starts from them: the best of them seed
+    // the initial population of `start`. The number of evaluations of each prior arm is scaled by
+    // `weight` (at least one evaluation is kept), to discount old rewards against new ones, while
+    // its mean and standard deviation are kept. Prior arms are merged into the arms that have
+    // been evaluated already, which are kept by the next `start` as well.
+    pub fn warm_start(&mut self, prior_arms: &[Arm], weight: f64) {
+        assert!(
+            weight > 0.0 && weight <= 1.0,
+            "weight must be larger than 0.0 and at most 1.0. ({})",
+            weight
+        );
+        self.warm_started = true;
+
+        for arm in prior_arms {
+            let n_evaluations = arm.get_n_evaluations();
+            if n_evaluations == 0 {
+                continue;
+            }
+            let n_weighted = ((n_evaluations as f64 * weight).round() as i32).max(1);
+            let corr_ssq = arm.get_value_std_dev().powi(2) * (n_weighted - 1) as f64;
+
+            let action_vector = arm.get_action_vector();
+            let arm_index = self
+                .arm_store
+                .get_arm_index(action_vector)
+                .unwrap_or_else(|| self.arm_store.push(action_vector));
+            self.tree_delete(arm_index);
+            self.arm_store
+                .merge(arm_index, n_weighted, arm.get_value(), corr_ssq);
+            self.tree_insert(arm_index);
+        }
+    }
+
+    // Adds the statistics of an arm that has been evaluated by another GMAB, e.g. a migrant from
+    // another island. Unlike `warm_start`, the statistics are not merged, but replace those of the
+    // arm if they are based on more evaluations. Statistics that are passed back and forth between
+    // GMABs are therefore never counted twice.
+    pub(crate) fn absorb(&mut self, arm: &Arm) {
+        let action_vector = arm.get_action_vector();
+        let arm_index = match self.arm_store.get_arm_index(action_vector) {
+            Some(arm_index)
+                if self.arm_store.get_n_evaluations(arm_index) >= arm.get_n_evaluations() =>
+            {
+                return
+            }
+            Some(arm_index) => arm_index,
+            None => self.arm_store.push(action_vector),
+        };
+        self.tree_delete(arm_index);
+        self.arm_store.replace(
+            arm_index,
+            arm.get_n_evaluations(),
+            arm.get_value(),
+            arm.corr_ssq(),
+        );
+        self.tree_insert(arm_index);
+    }
+
+    // Absorbs all arms of another GMAB, and counts its trials as used, e.g. to merge the islands
+    // of an optimization before the best arms are extracted.
+    pub(crate) fn absorb_island(&mut self, other: &GMAB) {
+        for arm in other.arms() {
+            self.absorb(&arm);
+        }
+        self.used_trials += other.used_trials;
+        if let Some(profile) = other.profile {
+            self.absorb_profile(&profile);
+        }
+    }
+
+    // Adds the counters and timers of another profile, if profiling is enabled.
+    pub(crate) fn absorb_profile(&mut self, other: &Profile) {
+        if let Some(profile) = self.profile.as_mut() {
+            profile.merge(other);
+        }
+    }
+
+    // The arms with the lowest means, i.e. the arms that the next generation is bred from first.
+    pub(crate) fn top_arms(&self, n: usize) -> Vec<Arm> {
+        self.sample_average_tree
+            .iter()
+            .take(n)
+            .map(|(_key, arm_index)| self.arm_store.get_arm(*arm_index))
+            .collect()
+    }
+
+    // All arms that have been evaluated, e.g. to warm start the next optimization with them.
+    pub fn arms(&self) -> Vec<Arm> {
+        (0..self.arm_store.len() as i32)
+            .filter(|&arm_index| self.arm_store.get_n_evaluations(arm_index) > 0)
+            .map(|arm_index| self.arm_store.get_arm(arm_index))
+            .collect()
+    }
+
+    // Hands out up to `n` pulls of the current generation, each as a ticket and the action vector
+    // to evaluate. Fewer pulls are returned at the end of a generation, and none while the next
+    // generation cannot be bred yet, i.e. before the initial population has been told. The tickets
+    // are the numbers of the pulls since `start`.
+    pub fn ask(&mut self, n: usize) -> Vec<(u64, Vec<i32>)> {
+        assert!(
+            self.rng.is_some(),
+            "GMAB must be started with bounds before asking for pulls."
+        );
+
+        let (first_pull, pulls) = self.take_pending_pulls(n);
+        let mut asked = Vec::with_capacity(pulls.len());
+        for (ticket, arm_index) in (first_pull..).zip(pulls) {
+            let seed = self.next_pull_seed(ticket, arm_index);
+            self.in_flight.insert(ticket, (arm_index, seed));
+            asked.push((ticket, self.arm_store.action_vector(arm_index).to_vec()));
+        }
+        asked
+    }
+
+    // The seed of an asked pull, as `optimize` passes it to `OptimizationFn::evaluate_seeded`.
+    pub fn pull_seed(&self, ticket: u64) -> u64 {
+        self.in_flight
+            .get(&ticket)
+            .map(|&(_arm_index, seed)| seed)
+            .unwrap_or_else(|| panic!("Unknown or already told ticket ({}).", ticket))
+    }
+
+    // Applies the reward of an asked pull, in any order and at any time after it was asked.
+    pub fn tell(&mut self, ticket: u64, reward: f64) {
+        let (arm_index, seed) = self
+            .in_flight
+            .remove(&ticket)
+            .unwrap_or_else(|| panic!("Unknown or already told ticket ({}).", ticket));
+        self.record_pull(arm_index, reward, seed);
+        self.update_arm(arm_index, reward);
+    }
+
+    // The number of pulls that have been asked, but not told yet.
+    pub fn n_in_flight(&self) -> usize {
+        self.in_flight.len()
+    }
+
+    // The number of rewards that have been told, or evaluated by `optimize`.
+    pub fn used_trials(&self) -> usize {
+        self.used_trials
+    }
+
+    // The arm that `best` would return first, found without copying the tree, or None before any
+    // arm has been evaluated.
+    pub fn best_arm(&self) -> Option<Arm> {
+        if self.sample_average_tree.is_empty() {
+            return None;
+        }
+        Some(
+            self.arm_store
+                .get_arm(self.find_best_ucb(self.used_trials, &[])),
+        )
+    }
+
+    // The best arms so far, found without copying or changing the tree, so the optimization can
+    // continue.
+    pub fn best(&self, n_best: usize) -> Vec<Arm> {
+        assert!(n_best >= 1, "n_best must be at least 1. ({})", n_best);
+        self.extract_best_arms(self.used_trials, n_best)
+    }
+
+    // Checks that the budget allows to evaluate the initial population, and to return results.
+    pub fn validate_budget(&self, n_trials: usize, n_best: usize) {
         assert!(
             n_trials >= self.genetic_algorithm.population_size,
             "n_trials must be at least population_size ({})",
             self.genetic_algorithm.population_size
         );
         assert!(n_best >= 1, "n_best must be at least 1. ({})", n_best);
+    }
 
-        // Initialize the Population for the Optimization
-        let next_seed = rng.next_u64();
-        self.initialize_population(next_seed, &opti_function);
+    // Encodes the state of the GMAB as a snapshot: the algorithm configuration, the arms, the state
+    // of the random number generator and of the ask/tell interface. The sorted indexes over the
+    // arms are not stored, since they are rebuilt from the arms when the snapshot is loaded.
+    pub fn to_bytes(&self) -> Vec<u8> {
+        let mut writer = SnapshotWriter::new(SNAPSHOT_MAGIC, SNAPSHOT_VERSION);
+
+        let ga = &self.genetic_algorithm;
+        writer.write_usize(ga.population_size);
+        writer.write_f64(ga.mutation_rate);
+        writer.write_f64(ga.crossover_rate);
+        writer.write_f64(ga.mutation_span);
+        writer.write_usize(ga.dimension);
+        writer.write_i32s(&ga.lower_bound);
+        writer.write_i32s(&ga.upper_bound);
+        writer.write_u32(self.common_random_numbers as u32);
+
+        writer.write_u64(self.seed);
+        match &self.rng {
+            Some(rng) => {
+                writer.write_u32(1);
+                writer.write_bytes(&rng.get_seed());
+                writer.write_u64(rng.get_stream());
+                writer.write_u128(rng.get_word_pos());
+            }
+            None => writer.write_u32(0),
+        }
 
-        // Run Optimization
-        let verbose = false;
-        let mut used_trials: usize = self.genetic_algorithm.population_size;
-        loop {
-            let mut current_indexes: Vec<i32> = Vec::new();
-            let mut population: Vec<Arm> = Vec::new();
+        self.arm_store.write_snapshot(&mut writer);
+
+        let pending_pulls: Vec<i32> = self.pending_pulls.iter().copied().collect();
+        writer.write_i32s(&pending_pulls);
+        let mut in_flight: Vec<(u64, (i32, u64))> = self
+            .in_flight
+            .iter()
+            .map(|(&ticket, &pull)| (ticket, pull))
+            .collect();
+        in_flight.sort_unstable();
+        writer.write_usize(in_flight.len());
+        for (ticket, (arm_index, seed)) in in_flight {
+            writer.write_u64(ticket);
+            writer.write_u32(arm_index as u32);
+            writer.write_u64(seed);
+        }
+        writer.write_u64(self.n_pulls);
+        let run_pulls: Vec<i32> = self.run_pulls.iter().map(|&n| n as i32).collect();
+        writer.write_i32s(&run_pulls);
+        writer.write_usize(self.used_trials);
+        writer.write_u32(self.best_arm.map_or(u32::MAX, |arm_index| arm_index as u32));
+        writer.write_usize(self.stale_generations);
+
+        writer.into_bytes()
+    }
 
-            // get first self.population_size elements from sorted tree and use value to get arm
-            self.sample_average_tree
-                .iter()
-                .take(self.genetic_algorithm.population_size)
-                .for_each(|(_key, arm_index)| {
-                    population.push(self.arm_memory[*arm_index as usize].clone());
-                    current_indexes.push(*arm_index);
-                });
+    // Decodes a snapshot that has been encoded with `to_bytes`.
+    pub fn from_bytes(bytes: &[u8]) -> io::Result<GMAB> {
+        let mut reader = SnapshotReader::new(bytes, SNAPSHOT_MAGIC, SNAPSHOT_VERSION)?;
+
+        let genetic_algorithm = GeneticAlgorithm {
+            population_size: reader.read_usize()?,
+            mutation_rate: reader.read_f64()?,
+            crossover_rate: reader.read_f64()?,
+            mutation_span: reader.read_f64()?,
+            dimension: reader.read_usize()?,
+            lower_bound: reader.read_i32s()?,
+            upper_bound: reader.read_i32s()?,
+        };
+        let mut gmab = GMAB::new(genetic_algorithm);
+        gmab.common_random_numbers = reader.read_u32()? != 0;
+
+        gmab.seed = reader.read_u64()?;
+        gmab.rng = match reader.read_u32()? {
+            0 => None,
+            1 => {
+                let seed = reader.read_bytes(32)?.try_into().unwrap();
+                let mut rng = ChaCha12Rng::from_seed(seed);
+                rng.set_stream(reader.read_u64()?);
+                rng.set_word_pos(reader.read_u128()?);
+                Some(rng)
+            }
+            _ => {
+                return Err(invalid_data(
+                    "Snapshot contains an invalid generator state.",
+                ))
+            }
+        };
 
-            // shuffle population
-            population.shuffle(&mut rng);
+        gmab.arm_store = ArmStore::read_snapshot(&mut reader)?;
+        let n_arms = gmab.arm_store.len();
+        let is_arm = |arm_index: i32| arm_index >= 0 && (arm_index as usize) < n_arms;
+
+        let pending_pulls = reader.read_i32s()?;
+        if !pending_pulls.iter().all(|&arm_index| is_arm(arm_index)) {
+            return Err(invalid_data("Snapshot contains pulls of unknown arms."));
+        }
+        gmab.pending_pulls = pending_pulls.into();
+        for _ in 0..reader.read_usize()? {
+            let ticket = reader.read_u64()?;
+            let arm_index = reader.read_u32()? as i32;
+            let seed = reader.read_u64()?;
+            if !is_arm(arm_index) {
+                return Err(invalid_data("Snapshot contains pulls of unknown arms."));
+            }
+            gmab.in_flight.insert(ticket, (arm_index, seed));
+        }
+        gmab.n_pulls = reader.read_u64()?;
+        let run_pulls = reader.read_i32s()?;
+        if run_pulls.len() > n_arms || run_pulls.iter().any(|&n| n < 0) {
+            return Err(invalid_data("Snapshot contains invalid pull counts."));
+        }
+        gmab.run_pulls = run_pulls.into_iter().map(|n| n as u32).collect();
+        gmab.used_trials = reader.read_usize()?;
+        gmab.best_arm = match reader.read_u32()? {
+            u32::MAX => None,
+            arm_index if is_arm(arm_index as i32) => Some(arm_index as i32),
+            _ => return Err(invalid_data("Snapshot contains an unknown best arm.")),
+        };
+        gmab.stale_generations = reader.read_usize()?;
+        reader.finish()?;
+
+        // Rebuild the sorted indexes from the arms that have been evaluated, and lie within the
+        // bounds of a started GMAB (see `start`)
+        for arm_index in 0..n_arms as i32 {
+            let n_evaluations = gmab.arm_store.get_n_evaluations(arm_index);
+            let in_bounds = gmab.rng.is_none()
+                || gmab
+                    .genetic_algorithm
+                    .contains(gmab.arm_store.action_vector(arm_index));
+            if n_evaluations > 0 && in_bounds {
+                let key = FloatKey::new(gmab.arm_store.get_value(arm_index));
+                gmab.sample_average_tree.insert(key, arm_index);
+                gmab.pull_count_index.insert(arm_index, key, n_evaluations);
+                gmab.max_number_pulls = gmab.max_number_pulls.max(n_evaluations);
+            }
+        }
 
-            let next_seed = rng.next_u64();
-            let crossover_pop = self.genetic_algorithm.crossover(next_seed, &population);
+        Ok(gmab)
+    }
 
-            // mutate automatically removes duplicates
-            let next_seed = rng.next_u64();
-            let mutated_pop = self.genetic_algorithm.mutate(next_seed, &crossover_pop);
+    // Saves a snapshot of the GMAB to a file, which is replaced atomically.
+    pub fn save(&self, path: impl AsRef<Path>) -> io::Result<()> {
+        write_atomically(path.as_ref(), &self.to_bytes())
+    }
 
-            for individual in mutated_pop {
-                if used_trials >= n_trials {
-                    return self.extract_best_arms(used_trials, n_best);
-                }
+    // Loads a GMAB from a snapshot file, e.g. to resume an interrupted optimization.
+    pub fn load(path: impl AsRef<Path>) -> io::Result<GMAB> {
+        GMAB::from_bytes(&fs::read(path)?)
+    }
 
-                let arm_index = self.get_arm_index(&individual);
+    fn save_checkpoint(&self, checkpoint: &Checkpoint) {
+        self.save(&checkpoint.path).unwrap_or_else(|err| {
+            panic!(
+                "Failed to save a snapshot to {}: {}",
+                checkpoint.path.display(),
+                err
+            )
+        });
+    }
 
-                // check if arm is in current population
-                if current_indexes.contains(&arm_index) {
-                    continue;
-                }
+    pub fn optimize<F: OptimizationFn>(
+        &mut self,
+        opti_function: F,
+        bounds: Vec<(i32, i32)>,
+        n_trials: usize,
+        n_best: usize,
+        seed: Option<u64>,
+    ) -> Vec<Arm> {
+        self.start(bounds, seed);
+        self.resume(
+            opti_function,
+            n_trials,
+            n_best,
+            None,
+            &StoppingRules::default(),
+        )
+    }
 
-                self.sample_and_update(arm_index, individual.clone(), &opti_function);
-                used_trials += 1;
+    // Evaluates the pending pulls of the current generation, or breeds and evaluates the next
+    // generation, without using more than `n_trials` trials in total.
+    fn run_generation<F: OptimizationFn>(&mut self, opti_function: &F, n_trials: usize) {
+        let (first_pull, pending_pulls) = self.take_pending_pulls(n_trials - self.used_trials);
+        assert!(
+            !pending_pulls.is_empty(),
+            "GMAB cannot breed a generation, while {} pulls are in flight.",
+            self.in_flight.len()
+        );
+        self.pull_arms(&pending_pulls, first_pull, opti_function);
+
+        let timer = self.start_timer();
+        self.track_best_arm();
+        self.stop_timer(Phase::Selection, timer);
+        if let Some(profile) = self.profile.as_mut() {
+            profile.generations += 1;
+        }
+    }
+
+    // Runs the next generation of a started GMAB, without using more than `n_trials` trials in
+    // total, and reports the progress, e.g. to show it or to decide whether to continue. Only the
+    // best arm is copied for the report. Stepping until all trials have been used yields the same
+    // arms as `resume`.
+    pub fn step<F: OptimizationFn>(&mut self, opti_function: &F, n_trials: usize) -> Progress {
+        assert!(
+            self.rng.is_some(),
+            "GMAB must be started with bounds before stepping."
+        );
+        assert!(
+            self.used_trials < n_trials,
+            "All trials have been used already. ({})",
+            n_trials
+        );
+        self.validate_budget(n_trials, 1);
+
+        self.run_generation(opti_function, n_trials);
+        Progress {
+            used_trials: self.used_trials,
+            best_arm: self.best_arm().unwrap(),
+            n_arms: self.sample_average_tree.len(),
+        }
+    }
+
+    // Runs up to `n_generations` generations of a started GMAB, until `n_trials` trials have been
+    // used, e.g. between two migrations of an island.
+    pub(crate) fn run_generations<F: OptimizationFn>(
+        &mut self,
+        opti_function: &F,
+        n_generations: usize,
+        n_trials: usize,
+    ) {
+        for _ in 0..n_generations {
+            if self.used_trials >= n_trials {
+                break;
             }
+            self.run_generation(opti_function, n_trials);
+        }
+    }
+
+    // Tracks the best arm after a generation, for the patience rule.
+    fn track_best_arm(&mut self) {
+        let best_arm = self.find_best_ucb(self.used_trials, &[]);
+        if self.best_arm == Some(best_arm) {
+            self.stale_generations += 1;
+        } else {
+            self.best_arm = Some(best_arm);
+            self.stale_generations = 0;
+        }
+    }
+
+    // Finds the arm that would be returned after the best arm.
+    fn find_runner_up(&self, best_arm: i32) -> Option<i32> {
+        if self.sample_average_tree.len() < 2 {
+            return None;
+        }
+        Some(self.find_best_ucb(self.used_trials, &[best_arm]))
+    }
+
+    // Returns the first stopping rule that applies to the arms evaluated so far. No rule applies
+    // before the initial population has been evaluated.
+    fn check_stopping_rules(
+        &self,
+        stopping: &StoppingRules,
+        started: Instant,
+    ) -> Option<StopReason> {
+        let best_arm = self.best_arm?;
+
+        if stopping
+            .deadline
+            .is_some_and(|deadline| started.elapsed() >= deadline)
+        {
+            return Some(StopReason::Deadline);
+        }
+        if stopping
+            .target_value
+            .is_some_and(|target_value| self.arm_store.get_value(best_arm) <= target_value)
+        {
+            return Some(StopReason::TargetValue);
+        }
+        if stopping
+            .patience
+            .is_some_and(|patience| self.stale_generations >= patience)
+        {
+            return Some(StopReason::Patience);
+        }
+        if let Some(confidence) = stopping.confidence {
+            if let Some(runner_up) = self.find_runner_up(best_arm) {
+                let statistics = |arm_index: i32| {
+                    (
+                        self.arm_store.get_value(arm_index),
+                        self.arm_store.get_value_std_dev(arm_index),
+                        self.arm_store.get_n_evaluations(arm_index),
+                    )
+                };
+                if is_separated(statistics(best_arm), statistics(runner_up), confidence) {
+                    return Some(StopReason::Confidence);
+                }
+            }
+        }
+        None
+    }
+
+    // The rule that stopped the last optimization early, and the number of trials it saved, or
+    // None if the optimization used all trials.
+    pub fn early_stop(&self) -> Option<EarlyStop> {
+        self.early_stop
+    }
+
+    // Continues the optimization of a started GMAB until `n_trials` trials have been used, e.g.
+    // of a GMAB that has been loaded from a snapshot, or until one of the stopping rules applies.
+    // The rules are checked between generations, the deadline counts from the call to `resume`.
+    // The results are the same as if the optimization had not been interrupted.
+    pub fn resume<F: OptimizationFn>(
+        &mut self,
+        opti_function: F,
+        n_trials: usize,
+        n_best: usize,
+        checkpoint: Option<&Checkpoint>,
+        stopping: &StoppingRules,
+    ) -> Vec<Arm> {
+        assert!(
+            self.rng.is_some(),
+            "GMAB must be started with bounds before resuming."
+        );
+        self.validate_budget(n_trials, n_best);
 
-            for individual in population {
-                if used_trials >= n_trials {
-                    return self.extract_best_arms(used_trials, n_best);
+        // Run Optimization, one generation (starting with the initial population) at a time
+        let verbose = false;
+        let started = Instant::now();
+        let mut last_snapshot = (self.used_trials, started);
+        self.early_stop = None;
+        loop {
+            let stop_reason = self.check_stopping_rules(stopping, started);
+            if self.used_trials >= n_trials || stop_reason.is_some() {
+                if let Some(checkpoint) = checkpoint {
+                    self.save_checkpoint(checkpoint);
                 }
+                self.early_stop =
+                    stop_reason
+                        .filter(|_| self.used_trials < n_trials)
+                        .map(|reason| EarlyStop {
+                            reason,
+                            saved_trials: n_trials - self.used_trials,
+                        });
+                return self.extract_best_arms(self.used_trials, n_best);
+            }
+
+            self.run_generation(&opti_function, n_trials);
 
-                let arm_index = self.get_arm_index(&individual);
-                self.sample_and_update(arm_index, individual.clone(), &opti_function);
-                used_trials += 1;
+            if let Some(checkpoint) = checkpoint {
+                let (used_trials, time) = last_snapshot;
+                if checkpoint.is_due(self.used_trials - used_trials, time.elapsed()) {
+                    self.save_checkpoint(checkpoint);
+                    last_snapshot = (self.used_trials, Instant::now());
+                }
             }
 
             if verbose {
-                let best_arm_index = self.find_best_ucb(used_trials);
-                print!(
-                    "x: {:?}",
-                    self.arm_memory[best_arm_index as usize].get_action_vector()
-                );
+                let best_arm_index = self.find_best_ucb(self.used_trials, &[]);
+                print!("x: {:?}", self.arm_store.action_vector(best_arm_index));
                 // get averaged function value over 50 simulations
                 let mut sum = 0.0;
                 for _ in 0..50 {
-                    sum +=
-                        self.arm_memory[best_arm_index as usize].get_function_value(&opti_function);
+                    sum += opti_function.evaluate(self.arm_store.action_vector(best_arm_index));
                 }
                 print!(" f(x): {:.3}", sum / 50.0);
 
-                print!(" n: {}", used_trials);
+                print!(" n: {}", self.used_trials);
                 // print number of pulls of best arm
                 println!(
                     " n(x): {}",
-                    self.arm_memory[best_arm_index as usize].get_n_evaluations()
+                    self.arm_store.get_n_evaluations(best_arm_index)
                 );
             }
         }
@@ -292,12 +1059,25 @@ impl GMAB {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use crate::parallel::ParallelOptimizationFn;
+    use crate::seeded::SeededOptimizationFn;
+    use rand::rngs::StdRng;
+    use rand::Rng;
     use std::cell::RefCell;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+    use std::time::Duration;
 
     fn mock_opti_function(_vec: &[i32]) -> f64 {
         0.0
     }
 
+    // Evaluates the initial population of a GMAB with bounds, once for each arm
+    fn initialize_population<F: OptimizationFn>(gmab: &mut GMAB, seed: u64, opti_function: &F) {
+        gmab.queue_initial_population(seed);
+        let (first_pull, pending_pulls) = gmab.take_pending_pulls(usize::MAX);
+        gmab.pull_arms(&pending_pulls, first_pull, opti_function);
+    }
+
     #[test]
     fn test_gmab_new() {
         let ga = GeneticAlgorithm {
@@ -310,11 +1090,10 @@ mod tests {
             upper_bound: vec![10, 10],
         };
         let mut gmab = GMAB::new(ga);
-        gmab.initialize_population(0, &mock_opti_function);
+        initialize_population(&mut gmab, 0, &mock_opti_function);
 
         assert_eq!(gmab.genetic_algorithm.population_size, 10);
-        assert_eq!(gmab.arm_memory.len(), 10);
-        assert_eq!(gmab.lookup_table.len(), 10);
+        assert_eq!(gmab.arm_store.len(), 10);
 
         // check if there are 10  elements in sample_average_tree
         let mut count = 0;
@@ -336,11 +1115,9 @@ mod tests {
             upper_bound: vec![10, 10],
         };
         let mut gmab = GMAB::new(ga);
-        let arm = Arm::new(&vec![1, 2]);
-        gmab.arm_memory.push(arm.clone());
-        gmab.lookup_table
-            .insert(arm.get_action_vector().to_vec(), 0);
-        assert_eq!(gmab.get_arm_index(&arm), 0);
+        gmab.arm_store.push(&[1, 2]);
+        assert_eq!(gmab.arm_store.get_arm_index(&[1, 2]), Some(0));
+        assert_eq!(gmab.arm_store.get_arm_index(&[2, 1]), None);
     }
 
     #[test]
@@ -355,8 +1132,8 @@ mod tests {
             upper_bound: vec![10, 10],
         };
         let mut gmab = GMAB::new(ga);
-        gmab.initialize_population(0, &mock_opti_function);
-        assert_eq!(gmab.max_number_pulls(), 1);
+        initialize_population(&mut gmab, 0, &mock_opti_function);
+        assert_eq!(gmab.max_number_pulls, 1);
     }
 
     #[test]
@@ -371,8 +1148,8 @@ mod tests {
             upper_bound: vec![10, 10],
         };
         let mut gmab = GMAB::new(ga);
-        gmab.initialize_population(0, &mock_opti_function);
-        assert_eq!(gmab.find_best_ucb(100), 0);
+        initialize_population(&mut gmab, 0, &mock_opti_function);
+        assert_eq!(gmab.find_best_ucb(100, &[]), 0);
     }
 
     #[test]
@@ -388,24 +1165,79 @@ mod tests {
         };
         let mut gmab = GMAB::new(ga);
 
-        let arm = Arm::new(&vec![1, 2]);
-        gmab.arm_memory.push(arm.clone());
-        gmab.lookup_table
-            .insert(arm.get_action_vector().to_vec(), 0);
+        let arm_index = gmab.arm_store.push(&[1, 2]);
+        gmab.update_arm(arm_index, mock_opti_function(&[1, 2]));
 
-        let arm2 = Arm::new(&vec![1, 2]);
-        gmab.arm_memory.push(arm2.clone());
-        gmab.lookup_table
-            .insert(arm2.get_action_vector().to_vec(), 1);
+        let arm_index = gmab.arm_store.push(&[2, 1]);
+        gmab.update_arm(arm_index, mock_opti_function(&[2, 1]));
 
-        gmab.sample_and_update(0, arm.clone(), &mock_opti_function);
-        gmab.sample_and_update(1, arm2.clone(), &mock_opti_function);
+        assert_eq!(gmab.find_best_ucb(100, &[]), 0);
+    }
 
-        assert_eq!(gmab.find_best_ucb(100), 0);
+    #[test]
+    fn test_gmab_find_best_ucb_matches_full_scan() {
+        // Reference: scan the non-dominated set of the sample average tree arm by arm
+        fn full_scan(gmab: &GMAB, simulations_used: usize) -> i32 {
+            let max_number_pulls = (0..gmab.arm_store.len() as i32)
+                .map(|arm_index| gmab.arm_store.get_n_evaluations(arm_index))
+                .max()
+                .unwrap();
+            let non_dominated: Vec<i32> = gmab
+                .sample_average_tree
+                .iter()
+                .map(|(_key, arm_index)| *arm_index)
+                .scan(false, |done, arm_index| {
+                    if *done {
+                        return None;
+                    }
+                    *done = gmab.arm_store.get_n_evaluations(arm_index) == max_number_pulls;
+                    Some(arm_index)
+                })
+                .collect();
+
+            let value = |arm_index: i32| gmab.arm_store.get_value(arm_index);
+            let ucb_norm_min = value(non_dominated[0]);
+            let ucb_norm_max = value(*non_dominated.last().unwrap());
+            if ucb_norm_max == ucb_norm_min {
+                return *non_dominated.last().unwrap();
+            }
+
+            let mut best_arm_index = 0;
+            let mut best_ucb_value = f64::MAX;
+            for arm_index in non_dominated {
+                let n_evaluations = gmab.arm_store.get_n_evaluations(arm_index);
+                let ucb_value = (value(arm_index) - ucb_norm_min) / (ucb_norm_max - ucb_norm_min)
+                    + (2.0 * (simulations_used as f64).ln() / n_evaluations as f64).sqrt();
+                if ucb_value < best_ucb_value {
+                    best_arm_index = arm_index;
+                    best_ucb_value = ucb_value;
+                }
+            }
+            best_arm_index
+        }
+
+        // Quantised rewards with noise lead to many arms with equal means
+        let calls = RefCell::new(0u64);
+        let mock_opti_function = |vec: &[i32]| {
+            *calls.borrow_mut() += 1;
+            let noise = (*calls.borrow() * 7919 % 13) as f64;
+            (vec.iter().map(|&x| (x - 5).abs()).sum::<i32>() as f64 + noise).round()
+        };
+
+        let bounds = vec![(0, 10), (0, 10)];
+        let mut gmab = GMAB::new(Default::default());
+        gmab.optimize(mock_opti_function, bounds, 2000, 1, Some(42));
+
+        // Compare while extracting arms from the tree
+        while !gmab.sample_average_tree.is_empty() {
+            let best_arm_index = gmab.find_best_ucb(2000, &[]);
+            assert_eq!(best_arm_index, full_scan(&gmab, 2000));
+            gmab.tree_delete(best_arm_index);
+        }
     }
 
     #[test]
-    fn test_gmab_sample_and_update_with_existing() {
+    fn test_gmab_update_arm_with_existing() {
         let ga = GeneticAlgorithm {
             population_size: 10,
             mutation_rate: 0.5,
@@ -416,21 +1248,15 @@ mod tests {
             upper_bound: vec![10, 10],
         };
         let mut gmab = GMAB::new(ga);
-        gmab.initialize_population(0, &mock_opti_function);
-
-        let arm = Arm::new(&vec![1, 2]);
-        gmab.arm_memory.push(arm.clone());
-        gmab.lookup_table
-            .insert(arm.get_action_vector().to_vec(), 0);
+        initialize_population(&mut gmab, 0, &mock_opti_function);
 
-        gmab.sample_and_update(0, arm.clone(), &mock_opti_function);
+        let action_vector = gmab.arm_store.action_vector(0).to_vec();
+        gmab.update_arm(0, mock_opti_function(&action_vector));
 
-        assert_eq!(gmab.arm_memory[0].get_n_evaluations(), 2);
-        assert_eq!(gmab.arm_memory[0].get_value(), 0.0);
-        assert_eq!(
-            gmab.lookup_table.get(&arm.get_action_vector().to_vec()),
-            Some(&0)
-        );
+        assert_eq!(gmab.arm_store.get_n_evaluations(0), 2);
+        assert_eq!(gmab.arm_store.get_value(0), 0.0);
+        assert_eq!(gmab.arm_store.get_arm_index(&action_vector), Some(0));
+        assert_eq!(gmab.arm_store.len(), 10);
     }
 
     #[test]
@@ -491,6 +1317,513 @@ mod tests {
         assert_eq!(n_trials, *used_trials.borrow_mut());
     }
 
+    #[test]
+    fn test_parallel_gmab_adheres_to_n_trials() {
+        // Mock opti_function that keeps track of used simulations across worker threads
+        let used_trials = AtomicUsize::new(0);
+        let mock_opti_function = |_: &[i32]| {
+            used_trials.fetch_add(1, Ordering::Relaxed);
+            0.0
+        };
+
+        // Run the optimization, then check if used_trials matches n_trials
+        let n_trials = 1000;
+        let bounds = vec![(1, 100), (1, 100)];
+        let mut gmab = GMAB::new(Default::default());
+        let parallel_fn = ParallelOptimizationFn::new(mock_opti_function, 4);
+        gmab.optimize(parallel_fn, bounds, n_trials, 1, None);
+
+        assert_eq!(n_trials, used_trials.load(Ordering::Relaxed));
+    }
+
+    #[test]
+    fn test_parallel_reproduces_serial_results() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64 - 50.0).powi(2)).sum()
+        }
+
+        let bounds = vec![(1, 100), (1, 100), (1, 100)];
+        let mut serial = GMAB::new(Default::default());
+        let serial_result = serial.optimize(mock_opti_function, bounds.clone(), 2000, 5, Some(42));
+
+        let mut parallel = GMAB::new(Default::default());
+        let parallel_fn = ParallelOptimizationFn::new(mock_opti_function, 4);
+        let parallel_result = parallel.optimize(parallel_fn, bounds, 2000, 5, Some(42));
+
+        assert_eq!(serial, parallel);
+        for (s, p) in serial_result.iter().zip(parallel_result.iter()) {
+            assert_eq!(s.get_action_vector(), p.get_action_vector());
+            assert_eq!(s.get_n_evaluations(), p.get_n_evaluations());
+            assert_eq!(s.get_value(), p.get_value());
+        }
+    }
+
+    #[test]
+    fn test_ask_tell_reproduces_optimize() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64 - 50.0).powi(2)).sum()
+        }
+
+        let bounds = vec![(1, 100), (1, 100), (1, 100)];
+        let mut optimized = GMAB::new(Default::default());
+        let expected = optimized.optimize(mock_opti_function, bounds.clone(), 2000, 5, Some(42));
+
+        // Drive the GMAB one generation at a time, as optimize does
+        let mut gmab = GMAB::new(Default::default());
+        gmab.start(bounds, Some(42));
+        while gmab.used_trials() < 2000 {
+            let pulls = gmab.ask(2000 - gmab.used_trials());
+            for (ticket, action_vector) in pulls {
+                gmab.tell(ticket, mock_opti_function(&action_vector));
+            }
+        }
+        let result = gmab.best(5);
+
+        assert_eq!(result, expected);
+        assert_eq!(gmab.best(5), expected);
+    }
+
+    #[test]
+    fn test_ask_tell_with_pulls_in_flight() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| x as f64).sum()
+        }
+
+        let population_size = 10;
+        let ga = GeneticAlgorithm {
+            population_size,
+            ..Default::default()
+        };
+        let mut gmab = GMAB::new(ga);
+        gmab.start(vec![(1, 100), (1, 100)], Some(0));
+
+        // The initial population is handed out first, then nothing until it has been told
+        let initial = gmab.ask(4);
+        assert_eq!(initial.len(), 4);
+        let mut initial = [initial, gmab.ask(100)].concat();
+        assert_eq!(initial.len(), population_size);
+        assert!(gmab.ask(100).is_empty());
+        assert_eq!(gmab.n_in_flight(), population_size);
+
+        // Tell in reverse order, then keep two generations in flight at once
+        initial.reverse();
+        for (ticket, action_vector) in initial {
+            gmab.tell(ticket, mock_opti_function(&action_vector));
+        }
+        let first = gmab.ask(100);
+        let second = gmab.ask(100);
+        assert!(!first.is_empty() && !second.is_empty());
+
+        let tickets: Vec<u64> = first.iter().chain(&second).map(|pull| pull.0).collect();
+        assert!(tickets.windows(2).all(|pair| pair[0] < pair[1]));
+
+        for (ticket, action_vector) in second.into_iter().chain(first) {
+            gmab.tell(ticket, mock_opti_function(&action_vector));
+        }
+        assert_eq!(gmab.n_in_flight(), 0);
+        assert_eq!(gmab.used_trials(), tickets.len() + population_size);
+        assert_eq!(gmab.best(1).len(), 1);
+    }
+
+    #[test]
+    #[should_panic = "started"]
+    fn test_ask_before_start() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.ask(1);
+    }
+
+    #[test]
+    #[should_panic = "ticket"]
+    fn test_tell_twice() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.start(vec![(1, 100), (1, 100)], Some(0));
+        let (ticket, _) = gmab.ask(1).remove(0);
+        gmab.tell(ticket, 0.0);
+        gmab.tell(ticket, 0.0);
+    }
+
+    fn seeded_noisy_opti_function(vec: &[i32], seed: u64) -> f64 {
+        let noise: f64 = StdRng::seed_from_u64(seed).random_range(-5.0..5.0);
+        vec.iter().map(|&x| (x as f64 - 50.0).powi(2)).sum::<f64>() + noise
+    }
+
+    #[test]
+    fn test_parallel_reproduces_serial_results_with_seeds() {
+        let bounds = vec![(1, 100), (1, 100), (1, 100)];
+        let mut serial = GMAB::new(Default::default());
+        let serial_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let serial_result = serial.optimize(serial_fn, bounds.clone(), 2000, 5, Some(42));
+
+        let mut parallel = GMAB::new(Default::default());
+        let parallel_fn =
+            ParallelOptimizationFn::new(SeededOptimizationFn::new(seeded_noisy_opti_function), 4);
+        let parallel_result = parallel.optimize(parallel_fn, bounds, 2000, 5, Some(42));
+
+        assert_eq!(serial, parallel);
+        for (s, p) in serial_result.iter().zip(parallel_result.iter()) {
+            assert_eq!(s.get_action_vector(), p.get_action_vector());
+            assert_eq!(s.get_n_evaluations(), p.get_n_evaluations());
+            assert_eq!(s.get_value(), p.get_value());
+        }
+    }
+
+    #[test]
+    fn test_ask_tell_reproduces_optimize_with_seeds() {
+        let bounds = vec![(1, 100), (1, 100), (1, 100)];
+        let mut optimized = GMAB::new(Default::default());
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected = optimized.optimize(seeded_fn, bounds.clone(), 2000, 5, Some(42));
+
+        // The seed of each pull is available from its ticket
+        let mut gmab = GMAB::new(Default::default());
+        gmab.start(bounds, Some(42));
+        while gmab.used_trials() < 2000 {
+            for (ticket, action_vector) in gmab.ask(2000 - gmab.used_trials()) {
+                let seed = gmab.pull_seed(ticket);
+                gmab.tell(ticket, seeded_noisy_opti_function(&action_vector, seed));
+            }
+        }
+
+        let result = gmab.best(5);
+        assert_eq!(result, expected);
+        for (r, e) in result.iter().zip(expected.iter()) {
+            assert_eq!(r.get_value(), e.get_value());
+        }
+    }
+
+    #[test]
+    fn test_common_random_numbers() {
+        let ga = GeneticAlgorithm {
+            population_size: 4,
+            ..Default::default()
+        };
+        let mut gmab = GMAB::new(ga);
+        gmab.set_common_random_numbers(true);
+        gmab.start(vec![(1, 100), (1, 100)], Some(42));
+
+        // The first pull of each arm gets the same seed
+        let pulls = gmab.ask(4);
+        for (ticket, _) in &pulls {
+            assert_eq!(gmab.pull_seed(*ticket), pull_seed(42, 0));
+        }
+        for (ticket, action_vector) in pulls {
+            let seed = gmab.pull_seed(ticket);
+            gmab.tell(ticket, seeded_noisy_opti_function(&action_vector, seed));
+        }
+
+        // The population is pulled again in the next generation, with the seed of a second pull
+        let population: Vec<i32> = gmab
+            .sample_average_tree
+            .iter()
+            .map(|(_key, arm_index)| *arm_index)
+            .collect();
+        for (ticket, action_vector) in gmab.ask(usize::MAX) {
+            let arm_index = gmab.arm_store.get_arm_index(&action_vector).unwrap();
+            let arm_pull = if population.contains(&arm_index) {
+                1
+            } else {
+                0
+            };
+            assert_eq!(gmab.pull_seed(ticket), pull_seed(42, arm_pull));
+        }
+    }
+
+    #[test]
+    fn test_ask_tell_reproduces_optimize_with_common_random_numbers() {
+        let bounds = vec![(1, 100), (1, 100), (1, 100)];
+        let mut optimized = GMAB::new(Default::default());
+        optimized.set_common_random_numbers(true);
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected = optimized.optimize(seeded_fn, bounds.clone(), 2000, 5, Some(42));
+
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_common_random_numbers(true);
+        gmab.start(bounds, Some(42));
+        while gmab.used_trials() < 2000 {
+            let pulls = gmab.ask(7.min(2000 - gmab.used_trials()));
+            for (ticket, action_vector) in pulls.into_iter().rev() {
+                let seed = gmab.pull_seed(ticket);
+                gmab.tell(ticket, seeded_noisy_opti_function(&action_vector, seed));
+            }
+        }
+
+        let result = gmab.best(5);
+        assert_eq!(result, expected);
+        for (r, e) in result.iter().zip(expected.iter()) {
+            assert_eq!(r.get_value(), e.get_value());
+        }
+    }
+
+    #[test]
+    fn test_warm_start() {
+        let prior_arms = vec![
+            Arm::from_statistics(&[1, 1], 3.0, 1.0, 10),
+            Arm::from_statistics(&[2, 2], 1.0, 1.0, 10),
+            Arm::from_statistics(&[3, 3], 2.0, 0.0, 1),
+            Arm::from_statistics(&[50, 50], 0.0, 0.0, 10),
+        ];
+        let ga = GeneticAlgorithm {
+            population_size: 4,
+            ..Default::default()
+        };
+        let mut gmab = GMAB::new(ga);
+        gmab.warm_start(&prior_arms, 0.5);
+        assert_eq!(gmab.arms().len(), 4);
+        assert_eq!(gmab.arms()[0].get_n_evaluations(), 5);
+        assert_eq!(gmab.arms()[2].get_n_evaluations(), 1);
+
+        // The best prior arms within the bounds seed the initial population
+        gmab.start(vec![(1, 10), (1, 10)], Some(42));
+        let population: Vec<Vec<i32>> = gmab.ask(4).into_iter().map(|(_, av)| av).collect();
+        assert_eq!(population[..3], [vec![2, 2], vec![3, 3], vec![1, 1]]);
+        assert!(!population.contains(&vec![50, 50]));
+
+        // Rewards are merged into the prior statistics
+        gmab.tell(0, 4.0);
+        let best = gmab.best(4);
+        let arm = best.iter().find(|arm| arm.get_action_vector() == [2, 2]);
+        assert_eq!(arm.unwrap().get_n_evaluations(), 6);
+        assert_eq!(arm.unwrap().get_value(), 1.5);
+        assert!(best.iter().all(|arm| arm.get_action_vector() != [50, 50]));
+    }
+
+    #[test]
+    fn test_warm_start_saves_trials() {
+        fn opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| ((x - 42) as f64).powi(2)).sum()
+        }
+        let bounds = vec![(0, 100), (0, 100), (0, 100)];
+
+        let mut prior = GMAB::new(Default::default());
+        let expected = prior.optimize(opti_function, bounds.clone(), 5000, 1, Some(0));
+
+        // A tenth of the budget suffices to return to the prior optimum
+        let mut gmab = GMAB::new(Default::default());
+        gmab.warm_start(&prior.arms(), 0.1);
+        let result = gmab.optimize(opti_function, bounds, 500, 1, Some(1));
+        assert!(result[0].get_value() <= expected[0].get_value());
+    }
+
+    #[test]
+    fn test_restart_forgets_arms() {
+        let bounds = vec![(-10, 10); 2];
+        let seeded_fn = || SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected =
+            GMAB::new(Default::default()).optimize(seeded_fn(), bounds.clone(), 500, 3, Some(42));
+
+        // A reused GMAB reproduces a fresh run, unless the arms are carried over explicitly
+        let mut gmab = GMAB::new(Default::default());
+        gmab.optimize(seeded_fn(), bounds.clone(), 500, 3, Some(7));
+        let result = gmab.optimize(seeded_fn(), bounds.clone(), 500, 3, Some(42));
+        assert_eq!(result, expected);
+
+        let n_arms = gmab.arms().len();
+        gmab.warm_start(&[], 1.0);
+        gmab.start(bounds, Some(42));
+        assert_eq!(gmab.arms().len(), n_arms);
+    }
+
+    #[test]
+    #[should_panic = "weight"]
+    fn test_warm_start_invalid_weight() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.warm_start(&[Arm::from_statistics(&[1], 0.0, 0.0, 1)], 0.0);
+    }
+
+    #[test]
+    #[should_panic = "dimension of the bounds"]
+    fn test_warm_start_with_other_dimension() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.warm_start(&[Arm::from_statistics(&[1], 0.0, 0.0, 1)], 1.0);
+        gmab.start(vec![(1, 100), (1, 100)], Some(42));
+    }
+
+    // A directory for the snapshots of a test, which is emptied first
+    fn snapshot_dir(name: &str) -> std::path::PathBuf {
+        let dir = std::env::temp_dir().join(format!("evobandits-{}-{}", name, std::process::id()));
+        let _ = fs::remove_dir_all(&dir);
+        fs::create_dir_all(&dir).unwrap();
+        dir
+    }
+
+    #[test]
+    fn test_snapshot_round_trip() {
+        let mut gmab = GMAB::new(Default::default());
+        assert_eq!(GMAB::from_bytes(&gmab.to_bytes()).unwrap(), gmab);
+
+        // Stop in the middle of a generation, with pulls pending and in flight
+        gmab.set_common_random_numbers(true);
+        gmab.start(vec![(1, 100), (1, 100)], Some(42));
+        while gmab.used_trials() < 50 {
+            for (ticket, action_vector) in gmab.ask(7) {
+                let seed = gmab.pull_seed(ticket);
+                gmab.tell(ticket, seeded_noisy_opti_function(&action_vector, seed));
+            }
+        }
+        gmab.ask(3);
+
+        let dir = snapshot_dir("round-trip");
+        let path = dir.join("gmab.bin");
+        gmab.save(&path).unwrap();
+        let mut loaded = GMAB::load(&path).unwrap();
+        assert_eq!(loaded, gmab);
+
+        // Both continue identically
+        assert_eq!(loaded.ask(10), gmab.ask(10));
+        fs::remove_dir_all(&dir).unwrap();
+    }
+
+    #[test]
+    fn test_load_invalid_snapshot() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.start(vec![(1, 100), (1, 100)], Some(42));
+        let bytes = gmab.to_bytes();
+
+        assert!(GMAB::from_bytes(&bytes[..bytes.len() - 1]).is_err());
+        assert!(GMAB::from_bytes(b"not a snapshot").is_err());
+
+        let dir = snapshot_dir("invalid");
+        assert!(GMAB::load(dir.join("missing.bin")).is_err());
+        fs::remove_dir_all(&dir).unwrap();
+    }
+
+    #[test]
+    fn test_resume_reproduces_uninterrupted_run() {
+        let bounds = vec![(1, 100), (1, 100), (1, 100)];
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected =
+            GMAB::new(Default::default()).optimize(seeded_fn, bounds.clone(), 2000, 5, Some(42));
+
+        // Interrupt the run after 1234 evaluations, with a snapshot every 100 trials
+        let dir = snapshot_dir("resume");
+        let checkpoint = Checkpoint::new(dir.join("gmab.bin"), Some(100), None);
+        let n_calls = AtomicUsize::new(0);
+        let interrupted = std::panic::catch_unwind(|| {
+            let seeded_fn = SeededOptimizationFn::new(|vec: &[i32], seed: u64| {
+                if n_calls.fetch_add(1, Ordering::SeqCst) == 1234 {
+                    panic!("interrupted");
+                }
+                seeded_noisy_opti_function(vec, seed)
+            });
+            let mut gmab = GMAB::new(Default::default());
+            gmab.start(bounds, Some(42));
+            gmab.resume(
+                seeded_fn,
+                2000,
+                5,
+                Some(&checkpoint),
+                &StoppingRules::default(),
+            )
+        });
+        assert!(interrupted.is_err());
+
+        let mut gmab = GMAB::load(&checkpoint.path).unwrap();
+        assert!(gmab.used_trials() >= 1100 && gmab.used_trials() < 1234);
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let result = gmab.resume(
+            seeded_fn,
+            2000,
+            5,
+            Some(&checkpoint),
+            &StoppingRules::default(),
+        );
+
+        assert_eq!(result, expected);
+        for (r, e) in result.iter().zip(expected.iter()) {
+            assert_eq!(r.get_value(), e.get_value());
+        }
+
+        // The final snapshot has used up the budget
+        assert_eq!(GMAB::load(&checkpoint.path).unwrap().used_trials(), 2000);
+        fs::remove_dir_all(&dir).unwrap();
+    }
+
+    #[test]
+    #[should_panic = "GMAB must be started"]
+    fn test_resume_before_start() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.resume(mock_opti_function, 100, 1, None, &StoppingRules::default());
+    }
+
+    fn optimize_with_stopping_rules(stopping: &StoppingRules) -> (GMAB, Vec<Arm>) {
+        let mut gmab = GMAB::new(Default::default());
+        let bounds = vec![(-10, 10); 2];
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        gmab.start(bounds, Some(42));
+        let result = gmab.resume(seeded_fn, 10000, 1, None, stopping);
+        (gmab, result)
+    }
+
+    #[test]
+    fn test_stopping_rules() {
+        // Without rules, the whole budget is used
+        let (gmab, _) = optimize_with_stopping_rules(&StoppingRules::default());
+        assert_eq!(gmab.used_trials(), 10000);
+        assert_eq!(gmab.early_stop(), None);
+
+        let rules = [
+            (
+                StoppingRules::new(Some(3), None, None, None),
+                StopReason::Patience,
+            ),
+            (
+                StoppingRules::new(None, Some(1.0), None, None),
+                StopReason::Confidence,
+            ),
+            (
+                StoppingRules::new(None, None, Some(Duration::ZERO), None),
+                StopReason::Deadline,
+            ),
+            (
+                StoppingRules::new(None, None, None, Some(f64::INFINITY)),
+                StopReason::TargetValue,
+            ),
+        ];
+        for (stopping, reason) in rules {
+            let (gmab, result) = optimize_with_stopping_rules(&stopping);
+            let early_stop = gmab.early_stop().unwrap();
+            assert_eq!(early_stop.reason, reason);
+            assert_eq!(early_stop.saved_trials, 10000 - gmab.used_trials());
+            assert!(early_stop.saved_trials > 0);
+            assert_eq!(result.len(), 1);
+        }
+    }
+
+    #[test]
+    fn test_stopping_rules_keep_results() {
+        // Until a rule applies, the optimization is the same as without rules
+        let (gmab, result) =
+            optimize_with_stopping_rules(&StoppingRules::new(Some(5), None, None, None));
+        let used_trials = gmab.used_trials();
+
+        let mut gmab = GMAB::new(Default::default());
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected = gmab.optimize(seeded_fn, vec![(-10, 10); 2], used_trials, 1, Some(42));
+        assert_eq!(result, expected);
+        assert_eq!(result[0].get_value(), expected[0].get_value());
+    }
+
+    #[test]
+    fn test_resume_after_early_stop() {
+        // A snapshot of an optimization that stopped early stops again right away
+        let dir = snapshot_dir("early_stop");
+        let checkpoint = Checkpoint::new(dir.join("gmab.bin"), None, None);
+        let stopping = StoppingRules::new(Some(3), None, None, None);
+        let bounds = vec![(-10, 10); 2];
+        let mut gmab = GMAB::new(Default::default());
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        gmab.start(bounds, Some(42));
+        let result = gmab.resume(seeded_fn, 10000, 1, Some(&checkpoint), &stopping);
+
+        let mut restored = GMAB::load(&checkpoint.path).unwrap();
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let resumed = restored.resume(seeded_fn, 10000, 1, None, &stopping);
+        assert_eq!(restored.used_trials(), gmab.used_trials());
+        assert_eq!(restored.early_stop(), gmab.early_stop());
+        assert_eq!(resumed, result);
+        fs::remove_dir_all(&dir).unwrap();
+    }
+
     #[test]
     #[should_panic = "n_trials"]
     fn test_panic_on_invalid_n_trials() {
@@ -516,6 +1849,191 @@ mod tests {
         gmab.optimize(mock_opti_function, bounds, 20, n_best, None);
     }
 
+    #[test]
+    fn test_profile() {
+        fn opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+        let bounds = vec![(-10, 10); 2];
+        let expected = GMAB::new(Default::default()).optimize(
+            opti_function,
+            bounds.clone(),
+            1000,
+            3,
+            Some(42),
+        );
+
+        // Profiling is disabled by default, and does not change the results
+        let mut gmab = GMAB::new(Default::default());
+        assert_eq!(gmab.profile(), None);
+        gmab.set_profiling(true);
+        let result = gmab.optimize(opti_function, bounds, 1000, 3, Some(42));
+        assert_eq!(result, expected);
+
+        let profile = gmab.profile().unwrap();
+        assert_eq!(profile.used_trials(), 1000);
+        assert_eq!(profile.new_arm_pulls as usize, gmab.arms().len());
+        assert!(profile.repulls > 0 && profile.duplicate_offspring > 0);
+        assert!(profile.tree_reinserts <= profile.repulls);
+        // Each generation pulls the offspring and the population, at most 40 arms
+        assert!(profile.generations >= 1000 / 40);
+        assert!(profile.evaluation_ns > 0 && profile.breeding_ns > 0);
+
+        // Pulls that are told are counted as well, after the counters have been reset
+        gmab.set_profiling(true);
+        gmab.start(vec![(-10, 10); 2], Some(1));
+        for (ticket, action_vector) in gmab.ask(20) {
+            gmab.tell(ticket, opti_function(&action_vector));
+        }
+        assert_eq!(gmab.profile().unwrap().used_trials(), 20);
+
+        gmab.set_profiling(false);
+        assert_eq!(gmab.profile(), None);
+    }
+
+    #[test]
+    fn test_step_reproduces_optimize() {
+        let bounds = vec![(-10, 10); 2];
+        let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected = GMAB::new(Default::default()).optimize(
+            SeededOptimizationFn::new(seeded_noisy_opti_function),
+            bounds.clone(),
+            1000,
+            3,
+            Some(42),
+        );
+
+        let mut gmab = GMAB::new(Default::default());
+        gmab.start(bounds, Some(42));
+        let mut progress = Vec::new();
+        while gmab.used_trials() < 1000 {
+            progress.push(gmab.step(&seeded_fn, 1000));
+        }
+        assert_eq!(gmab.best(3), expected);
+
+        // Each step reports one generation
+        assert_eq!(progress[0].used_trials, 20);
+        assert_eq!(progress.last().unwrap().used_trials, 1000);
+        assert!(progress
+            .windows(2)
+            .all(|pair| pair[0].used_trials < pair[1].used_trials
+                && pair[0].n_arms <= pair[1].n_arms));
+        assert_eq!(progress.last().unwrap().best_arm, expected[0]);
+        assert_eq!(progress.last().unwrap().n_arms, gmab.arms().len());
+    }
+
+    #[test]
+    #[should_panic(expected = "All trials have been used already")]
+    fn test_step_after_last_trial() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.start(vec![(-10, 10); 2], Some(42));
+        gmab.step(&mock_opti_function, 20);
+        gmab.step(&mock_opti_function, 20);
+    }
+
+    #[test]
+    fn test_pull_log() {
+        let dir =
+            std::env::temp_dir().join(format!("evobandits_gmab_pulls_{}", std::process::id()));
+        let bounds = vec![(-10, 10); 2];
+        let seeded_fn = || SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected =
+            GMAB::new(Default::default()).optimize(seeded_fn(), bounds.clone(), 500, 3, Some(42));
+
+        // Recording the pulls does not change the results
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_pull_log(Some(PullLog::create(&dir, 2).unwrap()));
+        let result = gmab.optimize(seeded_fn(), bounds, 500, 3, Some(42));
+        assert_eq!(result, expected);
+
+        let mut pull_log = gmab.take_pull_log().unwrap();
+        pull_log.flush().unwrap();
+        assert_eq!(pull_log.len(), 500);
+        assert_eq!(gmab.take_pull_log().map(|log| log.len()), None);
+
+        // The logged rewards of an arm add up to its mean
+        let column = |file: &str| std::fs::read(dir.join(file)).unwrap();
+        let rewards: Vec<f64> = column(crate::pull_log::REWARD_FILE)
+            .chunks_exact(8)
+            .map(|bytes| f64::from_le_bytes(bytes.try_into().unwrap()))
+            .collect();
+        let action_vectors: Vec<i32> = column(crate::pull_log::ACTION_VECTOR_FILE)
+            .chunks_exact(4)
+            .map(|bytes| i32::from_le_bytes(bytes.try_into().unwrap()))
+            .collect();
+        let best = &result[0];
+        let best_rewards: Vec<f64> = action_vectors
+            .chunks_exact(2)
+            .zip(&rewards)
+            .filter(|(action_vector, _)| *action_vector == best.get_action_vector())
+            .map(|(_, &reward)| reward)
+            .collect();
+        assert_eq!(best_rewards.len() as i32, best.get_n_evaluations());
+        let mean = best_rewards.iter().sum::<f64>() / best_rewards.len() as f64;
+        assert!((mean - best.get_value()).abs() < 1e-9);
+        std::fs::remove_dir_all(&dir).unwrap();
+    }
+
+    // Checks that the tree and the pull count index hold exactly the arms with evaluations.
+    fn assert_indexes_match(gmab: &GMAB) {
+        let evaluated: Vec<i32> = (0..gmab.arm_store.len() as i32)
+            .filter(|&arm_index| gmab.arm_store.get_n_evaluations(arm_index) > 0)
+            .collect();
+        let mut in_tree: Vec<i32> = gmab
+            .sample_average_tree
+            .iter()
+            .map(|(key, arm_index)| {
+                assert_eq!(*key, FloatKey::new(gmab.arm_store.get_value(*arm_index)));
+                *arm_index
+            })
+            .collect();
+        in_tree.sort();
+        assert_eq!(in_tree, evaluated);
+
+        for arm_index in 0..gmab.arm_store.len() as i32 {
+            assert_eq!(
+                gmab.pull_count_index.contains(arm_index),
+                evaluated.contains(&arm_index),
+                "Arm {} is indexed by its pull count, but not in the tree, or vice versa.",
+                arm_index
+            );
+        }
+    }
+
+    #[test]
+    fn test_resume_after_results() {
+        let bounds = vec![(-10, 10); 2];
+        let seeded_fn = || SeededOptimizationFn::new(seeded_noisy_opti_function);
+        let expected =
+            GMAB::new(Default::default()).optimize(seeded_fn(), bounds.clone(), 1000, 3, Some(42));
+
+        // Returning the results of the first 500 trials keeps the tree intact for the rest
+        let mut gmab = GMAB::new(Default::default());
+        gmab.optimize(seeded_fn(), bounds, 500, 3, Some(42));
+        assert_indexes_match(&gmab);
+        let result = gmab.resume(seeded_fn(), 1000, 3, None, &StoppingRules::default());
+        assert_indexes_match(&gmab);
+        assert_eq!(result, expected);
+        assert_eq!(gmab.best(3), expected);
+    }
+
+    #[test]
+    fn test_gmab_best_arm() {
+        fn opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        let mut gmab = GMAB::new(Default::default());
+        gmab.start(vec![(-10, 10); 2], Some(42));
+        assert_eq!(gmab.best_arm(), None);
+
+        gmab.run_generations(&opti_function, usize::MAX, 500);
+        let best_arm = gmab.best_arm().unwrap();
+        let expected = gmab.best(1).remove(0);
+        assert_eq!(best_arm, expected);
+        assert_eq!(best_arm.get_n_evaluations(), expected.get_n_evaluations());
+    }
+
     #[test]
     fn test_gmab_extract_n_best_arms() {
         // Mock a GMAB instance with 20 unique arms (distinct action vector and reward, one pull each)
@@ -535,10 +2053,12 @@ mod tests {
             ..Default::default()
         };
         let mut gmab = GMAB::new(ga);
-        gmab.initialize_population(0, &mock_opti_function);
+        initialize_population(&mut gmab, 0, &mock_opti_function);
 
         // Copy and sort all arms
-        let mut sorted_arms = gmab.arm_memory.clone();
+        let mut sorted_arms: Vec<Arm> = (0..gmab.arm_store.len() as i32)
+            .map(|arm_index| gmab.arm_store.get_arm(arm_index))
+            .collect();
         sorted_arms.sort_by(|a, b| a.get_value().partial_cmp(&b.get_value()).unwrap());
 
         // Get n_best arms
@@ -576,10 +2096,12 @@ mod tests {
             ..Default::default()
         };
         let mut gmab = GMAB::new(ga);
-        gmab.initialize_population(0, &mock_opti_function);
+        initialize_population(&mut gmab, 0, &mock_opti_function);
 
         // Copy and sort all arms
-        let mut sorted_arms = gmab.arm_memory.clone();
+        let mut sorted_arms: Vec<Arm> = (0..gmab.arm_store.len() as i32)
+            .map(|arm_index| gmab.arm_store.get_arm(arm_index))
+            .collect();
         sorted_arms.sort_by(|a, b| a.get_value().partial_cmp(&b.get_value()).unwrap());
 
         // Try to get more best arms than available
@@ -12,13 +12,11 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
-use std::collections::HashSet;
-
 use rand::rngs::StdRng;
 use rand::{Rng, SeedableRng};
 use rand_distr::{Distribution, Normal};
 
-use crate::arm::Arm;
+use crate::arm_index::ArmIndex;
 
 pub const POPULATION_SIZE_DEFAULT: usize = 20;
 pub const MUTATION_RATE_DEFAULT: f64 = 0.25;
@@ -43,6 +41,15 @@ impl GeneticAlgorithm {
         self.upper_bound = bounds.iter().map(|&(_, high)| high).collect::<Vec<i32>>();
     }
 
+    // Checks if the action vector lies within the bounds.
+    pub fn contains(&self, action_vector: &[i32]) -> bool {
+        action_vector.len() == self.dimension
+            && action_vector
+                .iter()
+                .zip(self.lower_bound.iter().zip(&self.upper_bound))
+                .all(|(action, (low, high))| (low..=high).contains(&action))
+    }
+
     pub fn validate(&self) {
         if self.population_size == 0 {
             panic!("population_size cannot be 0");
@@ -75,75 +82,59 @@ impl GeneticAlgorithm {
         }
     }
 
-    pub(crate) fn generate_new_population(&self, seed: u64) -> Vec<Arm> {
-        let mut individuals: Vec<Arm> = Vec::new();
+    // Populations are flat buffers of action vectors, with a stride of `dimension`.
+    pub fn generate_new_population(&self, seed: u64) -> Vec<i32> {
+        let mut individuals = ArmIndex::with_capacity(self.dimension, self.population_size);
+        let mut candidate_solution = vec![0; self.dimension];
         let mut rng: StdRng = SeedableRng::seed_from_u64(seed);
 
         while individuals.len() < self.population_size {
-            let candidate_solution: Vec<i32> = (0..self.dimension)
-                .map(|j| rng.random_range(self.lower_bound[j]..=self.upper_bound[j]))
-                .collect();
-
-            let candidate_arm = Arm::new(&candidate_solution);
-
-            if !individuals.contains(&candidate_arm) {
-                individuals.push(candidate_arm);
+            for (j, action) in candidate_solution.iter_mut().enumerate() {
+                *action = rng.random_range(self.lower_bound[j]..=self.upper_bound[j]);
             }
+            individuals.insert(&candidate_solution);
         }
-        individuals
+        individuals.action_vectors().to_vec()
     }
 
-    pub(crate) fn crossover(&self, seed: u64, population: &[Arm]) -> Vec<Arm> {
-        let mut crossover_pop: Vec<Arm> = Vec::new();
+    pub fn crossover(&self, seed: u64, population: &[i32]) -> Vec<i32> {
+        let mut crossover_pop: Vec<i32> = Vec::with_capacity(population.len());
         let population_size = self.population_size;
+        let dimension = self.dimension;
         let mut rng: StdRng = SeedableRng::seed_from_u64(seed);
 
         let step = 2;
         for i in (0..population_size - (population_size % step)).step_by(step) {
-            if rng.random::<f64>() < self.crossover_rate && self.dimension > 1 {
+            let parent_1 = &population[i * dimension..(i + 1) * dimension];
+            let parent_2 = &population[(i + 1) * dimension..(i + 2) * dimension];
+
+            if rng.random::<f64>() < self.crossover_rate && dimension > 1 {
                 // Crossover
-                let max_dim_index = self.dimension - 1;
+                let max_dim_index = dimension - 1;
                 let swap_rv = rng.random_range(1..=max_dim_index);
 
-                for j in 1..=max_dim_index {
-                    if swap_rv == j {
-                        let mut cross_vec_1: Vec<i32> =
-                            population[i].get_action_vector()[0..j].to_vec();
-                        cross_vec_1.extend_from_slice(
-                            &population[i + 1].get_action_vector()[j..=max_dim_index],
-                        );
-
-                        let mut cross_vec_2: Vec<i32> =
-                            population[i + 1].get_action_vector()[0..j].to_vec();
-                        cross_vec_2.extend_from_slice(
-                            &population[i].get_action_vector()[j..=max_dim_index],
-                        );
-
-                        let new_individual_1 = Arm::new(&cross_vec_1);
-                        let new_individual_2 = Arm::new(&cross_vec_2);
-
-                        crossover_pop.push(new_individual_1);
-                        crossover_pop.push(new_individual_2);
-                    }
-                }
+                crossover_pop.extend_from_slice(&parent_1[0..swap_rv]);
+                crossover_pop.extend_from_slice(&parent_2[swap_rv..]);
+
+                crossover_pop.extend_from_slice(&parent_2[0..swap_rv]);
+                crossover_pop.extend_from_slice(&parent_1[swap_rv..]);
             } else {
                 // No Crossover
-                crossover_pop.push(population[i].clone());
-                crossover_pop.push(population[i + 1].clone());
+                crossover_pop.extend_from_slice(parent_1);
+                crossover_pop.extend_from_slice(parent_2);
             }
         }
 
         crossover_pop
     }
 
-    pub(crate) fn mutate(&self, seed: u64, population: &[Arm]) -> Vec<Arm> {
-        let mut mutated_population = Vec::new();
-        let mut seen = HashSet::new();
+    pub fn mutate(&self, seed: u64, population: &[i32]) -> Vec<i32> {
+        let mut seen = ArmIndex::with_capacity(self.dimension, population.len() / self.dimension);
+        let mut new_action_vector = vec![0; self.dimension];
         let mut rng = StdRng::seed_from_u64(seed);
 
-        for individual in population.iter() {
-            // Clone the action vector
-            let mut new_action_vector = individual.get_action_vector().to_vec(); // Here I assumed `get_action_vector` returns a slice or Vec
+        for individual in population.chunks_exact(self.dimension) {
+            new_action_vector.copy_from_slice(individual);
 
             for (i, value) in new_action_vector.iter_mut().enumerate() {
                 if rng.random::<f64>() < self.mutation_rate {
@@ -160,14 +151,10 @@ impl GeneticAlgorithm {
                 }
             }
 
-            let new_individual = Arm::new(new_action_vector.as_slice());
-
-            if seen.insert(new_individual.clone()) {
-                mutated_population.push(new_individual);
-            }
+            seen.insert(&new_action_vector);
         }
 
-        mutated_population
+        seen.action_vectors().to_vec()
     }
 }
 
@@ -323,6 +310,17 @@ mod tests {
         ga.validate();
     }
 
+    #[test]
+    fn test_contains() {
+        let mut ga = GeneticAlgorithm::default();
+        ga.set_bounds(vec![(0, 10), (-5, 5)]);
+
+        assert!(ga.contains(&[0, 5]));
+        assert!(!ga.contains(&[11, 0]));
+        assert!(!ga.contains(&[0, -6]));
+        assert!(!ga.contains(&[0]));
+    }
+
     #[test]
     fn test_get_population_size() {
         let ga = GeneticAlgorithm {
@@ -337,6 +335,27 @@ mod tests {
         assert_eq!(ga.population_size, 10);
     }
 
+    #[test]
+    fn test_generate_new_population() {
+        let ga = GeneticAlgorithm {
+            population_size: 10,
+            dimension: 2,
+            lower_bound: vec![0, 0],
+            upper_bound: vec![3, 3],
+            ..Default::default()
+        };
+
+        let population = ga.generate_new_population(SEED);
+        assert_eq!(population.len(), ga.population_size * ga.dimension);
+
+        // All individuals are unique, and within the bounds
+        let individuals: Vec<&[i32]> = population.chunks(ga.dimension).collect();
+        for (i, individual) in individuals.iter().enumerate() {
+            assert!(!individuals[..i].contains(individual));
+            assert!(individual.iter().all(|&x| (0..=3).contains(&x)));
+        }
+    }
+
     #[test]
     fn test_mutate() {
         let ga = GeneticAlgorithm {
@@ -349,14 +368,13 @@ mod tests {
             upper_bound: vec![10, 10],
         };
 
-        let initial_population = vec![Arm::new(&vec![1, 1]), Arm::new(&vec![2, 2])];
+        let initial_population = vec![1, 1, 2, 2];
 
         let mutated_population = ga.mutate(SEED, &initial_population);
 
         // Assuming the mutation is deterministic and in the expected bounds, you'd check like this:
-        for (i, individual) in mutated_population.iter().enumerate() {
-            let init_vector = initial_population[i].get_action_vector();
-            let mut_vector = individual.get_action_vector();
+        for (i, mut_vector) in mutated_population.chunks(ga.dimension).enumerate() {
+            let init_vector = &initial_population[i * ga.dimension..(i + 1) * ga.dimension];
 
             for j in 0..ga.dimension {
                 assert!(mut_vector[j] >= ga.lower_bound[j]);
@@ -380,21 +398,16 @@ mod tests {
         };
 
         let initial_population = vec![
-            Arm::new(&vec![0, 1, 2, 3, 4, 5, 6, 7, 8, 9]),
-            Arm::new(&vec![9, 8, 7, 6, 5, 4, 3, 2, 1, 0]),
+            0, 1, 2, 3, 4, 5, 6, 7, 8, 9, // First individual
+            9, 8, 7, 6, 5, 4, 3, 2, 1, 0, // Second individual
         ];
 
         let crossover_population = ga.crossover(SEED, &initial_population);
 
         // Since the crossover rate is 100%, the two individuals should not be identical to the original individuals
-        assert_ne!(
-            crossover_population[0].get_action_vector(),
-            initial_population[0].get_action_vector()
-        );
-        assert_ne!(
-            crossover_population[1].get_action_vector(),
-            initial_population[1].get_action_vector()
-        );
+        assert_eq!(crossover_population.len(), initial_population.len());
+        assert_ne!(crossover_population[0..10], initial_population[0..10]);
+        assert_ne!(crossover_population[10..20], initial_population[10..20]);
     }
 
     #[test]
@@ -409,7 +422,7 @@ mod tests {
             upper_bound: vec![10],
         };
 
-        let initial_population = vec![Arm::new(&vec![3]), Arm::new(&vec![7])];
+        let initial_population = vec![3, 7];
 
         // This should not panic
         let crossover_population = ga.crossover(SEED, &initial_population);
@@ -418,20 +431,13 @@ mod tests {
         assert_eq!(crossover_population.len(), 2);
 
         // With dimension 1, crossover should just clone the individuals
-        assert_eq!(
-            crossover_population[0].get_action_vector(),
-            initial_population[0].get_action_vector()
-        );
-        assert_eq!(
-            crossover_population[1].get_action_vector(),
-            initial_population[1].get_action_vector()
-        );
+        assert_eq!(crossover_population, initial_population);
     }
 
     #[test]
     fn test_reproduction_with_seeding() {
         // Helper function that generates and modifies a population using a seed.
-        fn generate_population(seed: u64) -> Vec<Arm> {
+        fn generate_population(seed: u64) -> Vec<i32> {
             let ga = GeneticAlgorithm {
                 population_size: 10,
                 mutation_rate: 0.1,
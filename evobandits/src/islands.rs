@@ -0,0 +1,417 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use rand::{RngCore, SeedableRng};
+use rand_chacha::ChaCha12Rng;
+use std::thread;
+
+use crate::arm::{Arm, OptimizationFn};
+use crate::evobandits::GMAB;
+
+pub const MIGRATION_INTERVAL_DEFAULT: usize = 5;
+pub const N_MIGRANTS_DEFAULT: usize = 2;
+
+// The islands that each island receives migrants from.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum Topology {
+    // Each island receives the migrants of the previous island, and the last island those of
+    // the first one, so good arms spread slowly and the populations stay diverse.
+    Ring,
+    // Each island receives the migrants of all other islands.
+    Complete,
+}
+
+impl Topology {
+    pub fn name(&self) -> &'static str {
+        match self {
+            Topology::Ring => "ring",
+            Topology::Complete => "complete",
+        }
+    }
+
+    pub fn from_name(name: &str) -> Option<Topology> {
+        match name {
+            "ring" => Some(Topology::Ring),
+            "complete" => Some(Topology::Complete),
+            _ => None,
+        }
+    }
+
+    fn sources(&self, island: usize, n_islands: usize) -> Vec<usize> {
+        match self {
+            Topology::Ring => vec![(island + n_islands - 1) % n_islands],
+            Topology::Complete => (0..n_islands).filter(|&other| other != island).collect(),
+        }
+    }
+}
+
+// Configures an island model: the population of GMAB is split into `n_islands` islands, that
+// each run their own population with their own arms on a separate thread. Every
+// `migration_interval` generations, each island sends copies of its `n_migrants` best arms (by
+// mean, with their statistics) to the islands that receive from it in the topology. A single
+// island is the plain GMAB. The islands only evaluate on several cores at once if the objective
+// can run concurrently, e.g. a Rust objective or a Python objective that releases the GIL;
+// callbacks that hold the GIL are evaluated by one island at a time.
+#[derive(Debug, Clone, PartialEq)]
+pub struct Islands {
+    pub n_islands: usize,
+    pub migration_interval: usize,
+    pub n_migrants: usize,
+    pub topology: Topology,
+}
+
+impl Islands {
+    pub fn new(
+        n_islands: usize,
+        migration_interval: usize,
+        n_migrants: usize,
+        topology: Topology,
+    ) -> Self {
+        assert!(
+            n_islands >= 1,
+            "n_islands must be at least 1. ({})",
+            n_islands
+        );
+        assert!(
+            migration_interval >= 1,
+            "migration_interval must be at least 1. ({})",
+            migration_interval
+        );
+        Self {
+            n_islands,
+            migration_interval,
+            n_migrants,
+            topology,
+        }
+    }
+
+    // Splits the trials evenly between the islands, the first islands get the remainder.
+    fn budgets(&self, n_trials: usize) -> Vec<usize> {
+        (0..self.n_islands)
+            .map(|island| {
+                n_trials / self.n_islands + usize::from(island < n_trials % self.n_islands)
+            })
+            .collect()
+    }
+}
+
+impl Default for Islands {
+    fn default() -> Self {
+        Self::new(
+            1,
+            MIGRATION_INTERVAL_DEFAULT,
+            N_MIGRANTS_DEFAULT,
+            Topology::Ring,
+        )
+    }
+}
+
+impl GMAB {
+    // Optimizes with an island model. Each island is a copy of this GMAB, including the arms that
+    // have been evaluated before (e.g. by `warm_start`), and is started with its own seed, which
+    // is derived from `seed`. The trials are split between the islands. Between migrations, the
+    // islands evolve in parallel, and the migrations are applied in a fixed order, so the results
+    // are reproducible for objectives that only depend on the action vector and the seed of the
+    // pull. At the end, the arms of all islands are merged into this GMAB, and the best arms are
+    // extracted from all of them.
+    pub fn optimize_islands<F: OptimizationFn + Sync>(
+        &mut self,
+        opti_function: F,
+        bounds: Vec<(i32, i32)>,
+        n_trials: usize,
+        n_best: usize,
+        seed: Option<u64>,
+        islands: &Islands,
+    ) -> Vec<Arm> {
+        let budgets = islands.budgets(n_trials);
+        let population_size = self.get_genetic_algorithm().population_size;
+        assert!(
+            budgets[islands.n_islands - 1] >= population_size,
+            "n_trials must be at least n_islands ({}) * population_size ({})",
+            islands.n_islands,
+            population_size
+        );
+        assert!(n_best >= 1, "n_best must be at least 1. ({})", n_best);
+
+        // Unwrap seed or fall back to system entropy, and derive the seeds of the islands from it
+        let seed = seed.unwrap_or_else(|| rand::rng().next_u64());
+        let mut rng = ChaCha12Rng::seed_from_u64(seed);
+        let mut populations: Vec<GMAB> = (0..islands.n_islands)
+            .map(|island_id| {
+                let mut island = self.clone();
+                island.set_profiling(self.profile().is_some());
+                island.set_pull_log_island(island_id as u32);
+                island.start(bounds.clone(), Some(rng.next_u64()));
+                island
+            })
+            .collect();
+
+        let opti_function = &opti_function;
+        while populations
+            .iter()
+            .zip(&budgets)
+            .any(|(island, &budget)| island.used_trials() < budget)
+        {
+            thread::scope(|scope| {
+                let workers: Vec<_> = populations
+                    .iter_mut()
+                    .zip(&budgets)
+                    .map(|(island, &budget)| {
+                        scope.spawn(move || {
+                            island.run_generations(
+                                opti_function,
+                                islands.migration_interval,
+                                budget,
+                            )
+                        })
+                    })
+                    .collect();
+                for worker in workers {
+                    // Propagate panics from the objective, like a single population would
+                    worker
+                        .join()
+                        .unwrap_or_else(|err| std::panic::resume_unwind(err));
+                }
+            });
+            migrate(&mut populations, islands);
+        }
+
+        let mut populations = populations.into_iter();
+        let mut merged = populations.next().unwrap();
+        for island in populations {
+            merged.absorb_island(&island);
+        }
+        if let Some(profile) = self.profile() {
+            merged.absorb_profile(&profile);
+        }
+        *self = merged;
+        self.extract_best_arms(self.used_trials(), n_best)
+    }
+}
+
+// Sends copies of the best arms of each island to the islands that receive from it. All migrants
+// are selected before any of them arrive, so the order of the islands does not matter.
+fn migrate(populations: &mut [GMAB], islands: &Islands) {
+    if islands.n_islands < 2 || islands.n_migrants == 0 {
+        return;
+    }
+    let migrants: Vec<Vec<Arm>> = populations
+        .iter()
+        .map(|island| island.top_arms(islands.n_migrants))
+        .collect();
+    for (index, island) in populations.iter_mut().enumerate() {
+        for source in islands.topology.sources(index, islands.n_islands) {
+            for arm in &migrants[source] {
+                island.absorb(arm);
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::genetic::GeneticAlgorithm;
+    use crate::pull_log::PullLog;
+    use crate::seeded::SeededOptimizationFn;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    fn opti_function(vec: &[i32]) -> f64 {
+        vec.iter().map(|&x| ((x - 3) as f64).powi(2)).sum()
+    }
+
+    fn seeded_noisy_opti_function(vec: &[i32], seed: u64) -> f64 {
+        opti_function(vec) + (seed % 100) as f64 / 100.0
+    }
+
+    #[test]
+    fn test_topology_sources() {
+        assert_eq!(Topology::Ring.sources(0, 4), vec![3]);
+        assert_eq!(Topology::Ring.sources(2, 4), vec![1]);
+        assert_eq!(Topology::Complete.sources(1, 3), vec![0, 2]);
+        assert_eq!(Topology::from_name("ring"), Some(Topology::Ring));
+        assert_eq!(
+            Topology::from_name(Topology::Complete.name()),
+            Some(Topology::Complete)
+        );
+        assert_eq!(Topology::from_name("star"), None);
+    }
+
+    #[test]
+    fn test_islands_budgets() {
+        let islands = Islands::new(3, 1, 1, Topology::Ring);
+        assert_eq!(islands.budgets(1000), vec![334, 333, 333]);
+    }
+
+    #[test]
+    fn test_islands_adhere_to_n_trials() {
+        let n_calls = AtomicUsize::new(0);
+        let counted_fn = |vec: &[i32]| {
+            n_calls.fetch_add(1, Ordering::Relaxed);
+            opti_function(vec)
+        };
+        let islands = Islands::new(4, 3, 2, Topology::Ring);
+        let mut gmab = GMAB::new(GeneticAlgorithm::default());
+        let result =
+            gmab.optimize_islands(counted_fn, vec![(-10, 10); 3], 2000, 5, Some(42), &islands);
+
+        assert_eq!(n_calls.load(Ordering::Relaxed), 2000);
+        assert_eq!(gmab.used_trials(), 2000);
+        assert_eq!(gmab.profile(), None);
+        assert_eq!(result.len(), 5);
+        assert_eq!(result[0].get_action_vector(), &[3, 3, 3]);
+    }
+
+    #[test]
+    fn test_islands_reproduce_results() {
+        for topology in [Topology::Ring, Topology::Complete] {
+            let islands = Islands::new(3, 2, 2, topology);
+            let optimize = || {
+                let seeded_fn = SeededOptimizationFn::new(seeded_noisy_opti_function);
+                GMAB::new(GeneticAlgorithm::default()).optimize_islands(
+                    seeded_fn,
+                    vec![(-10, 10); 2],
+                    1500,
+                    3,
+                    Some(7),
+                    &islands,
+                )
+            };
+            assert_eq!(optimize(), optimize());
+        }
+    }
+
+    #[test]
+    fn test_islands_profile() {
+        let islands = Islands::new(3, 2, 2, Topology::Ring);
+        let mut gmab = GMAB::new(GeneticAlgorithm::default());
+        gmab.set_profiling(true);
+        gmab.optimize_islands(opti_function, vec![(-10, 10); 2], 900, 1, Some(1), &islands);
+        let profile = gmab.profile().unwrap();
+        assert_eq!(profile.used_trials(), 900);
+        assert!(profile.generations >= 3);
+    }
+
+    #[test]
+    fn test_islands_pull_log() {
+        let dir = std::env::temp_dir().join(format!("evobandits_islands_{}", std::process::id()));
+        let islands = Islands::new(3, 2, 2, Topology::Ring);
+        let mut gmab = GMAB::new(GeneticAlgorithm::default());
+        gmab.set_pull_log(Some(PullLog::create(&dir, 2).unwrap()));
+        gmab.optimize_islands(opti_function, vec![(-10, 10); 2], 900, 1, Some(1), &islands);
+
+        // The islands record to the log of the GMAB, which is returned once they are merged
+        let pull_log = gmab.take_pull_log().unwrap();
+        assert_eq!(pull_log.len(), 900);
+        drop(pull_log);
+
+        // The trials are numbered over all islands, and each pull names its island
+        let column = |file: &str| std::fs::read(dir.join(file)).unwrap();
+        let trials: Vec<u64> = column(crate::pull_log::TRIAL_FILE)
+            .chunks_exact(8)
+            .map(|bytes| u64::from_le_bytes(bytes.try_into().unwrap()))
+            .collect();
+        assert_eq!(trials, (0..900).collect::<Vec<u64>>());
+        let mut pulls_per_island = [0; 3];
+        for bytes in column(crate::pull_log::ISLAND_FILE).chunks_exact(4) {
+            pulls_per_island[u32::from_le_bytes(bytes.try_into().unwrap()) as usize] += 1;
+        }
+        assert_eq!(pulls_per_island, [300; 3]);
+        std::fs::remove_dir_all(&dir).unwrap();
+    }
+
+    #[test]
+    fn test_islands_evaluate_concurrently() {
+        // Counts how many islands are inside the objective at the same time
+        let n_running = AtomicUsize::new(0);
+        let max_running = AtomicUsize::new(0);
+        let thread_ids = std::sync::Mutex::new(std::collections::HashSet::new());
+        let blocking_fn = |vec: &[i32]| {
+            let running = n_running.fetch_add(1, Ordering::SeqCst) + 1;
+            max_running.fetch_max(running, Ordering::SeqCst);
+            thread_ids.lock().unwrap().insert(thread::current().id());
+            thread::sleep(std::time::Duration::from_micros(200));
+            n_running.fetch_sub(1, Ordering::SeqCst);
+            opti_function(vec)
+        };
+        let islands = Islands::new(3, 2, 2, Topology::Ring);
+        let mut gmab = GMAB::new(GeneticAlgorithm::default());
+        gmab.optimize_islands(blocking_fn, vec![(-10, 10); 2], 600, 1, Some(1), &islands);
+
+        assert!(thread_ids.lock().unwrap().len() >= 3);
+        assert!(
+            max_running.load(Ordering::SeqCst) > 1,
+            "The islands never evaluated concurrently. ({})",
+            max_running.load(Ordering::SeqCst)
+        );
+    }
+
+    #[test]
+    fn test_single_island_without_migration() {
+        let islands = Islands::default();
+        let mut gmab = GMAB::new(GeneticAlgorithm::default());
+        let result =
+            gmab.optimize_islands(opti_function, vec![(-10, 10); 2], 500, 1, Some(1), &islands);
+        assert_eq!(gmab.used_trials(), 500);
+        assert_eq!(result[0].get_action_vector(), &[3, 3]);
+    }
+
+    #[test]
+    fn test_migrants_keep_their_statistics() {
+        let bounds = vec![(-10, 10); 2];
+        let mut source = GMAB::new(GeneticAlgorithm::default());
+        source.optimize(opti_function, bounds.clone(), 300, 1, Some(1));
+        let mut target = GMAB::new(GeneticAlgorithm::default());
+        target.start(bounds, Some(2));
+
+        let mut populations = vec![source, target];
+        let islands = Islands::new(2, 1, 3, Topology::Ring);
+        migrate(&mut populations, &islands);
+
+        let migrants = populations[0].top_arms(3);
+        let arms = populations[1].arms();
+        for migrant in &migrants {
+            assert!(arms.contains(migrant));
+            let arm = arms.iter().find(|arm| *arm == migrant).unwrap();
+            assert_eq!(arm.get_n_evaluations(), migrant.get_n_evaluations());
+            assert_eq!(arm.get_value(), migrant.get_value());
+            assert_eq!(arm.get_value_std_dev(), migrant.get_value_std_dev());
+        }
+
+        // Arms that are sent back are not counted twice
+        migrate(&mut populations, &islands);
+        for migrant in &migrants {
+            let arm = populations[0]
+                .arms()
+                .into_iter()
+                .find(|arm| arm == migrant)
+                .unwrap();
+            assert_eq!(arm.get_n_evaluations(), migrant.get_n_evaluations());
+        }
+    }
+
+    #[test]
+    #[should_panic(expected = "n_trials must be at least n_islands")]
+    fn test_islands_invalid_n_trials() {
+        let islands = Islands::new(4, 1, 1, Topology::Ring);
+        GMAB::new(GeneticAlgorithm::default()).optimize_islands(
+            opti_function,
+            vec![(-10, 10); 2],
+            60,
+            1,
+            Some(1),
+            &islands,
+        );
+    }
+}
@@ -1,4 +1,15 @@
 pub mod arm;
+pub mod arm_index;
+mod arm_store;
+pub mod cache;
 pub mod evobandits;
 pub mod genetic;
-mod sorted_multi_map;
+pub mod islands;
+pub mod parallel;
+pub mod profile;
+mod pull_count_index;
+pub mod pull_log;
+pub mod seeded;
+pub mod snapshot;
+pub mod sorted_multi_map;
+pub mod stopping;
@@ -0,0 +1,141 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::thread;
+
+use crate::arm::OptimizationFn;
+
+// Wraps an objective to evaluate the pending pulls of each generation on a pool of worker threads.
+//
+// The workers pick the next pending pull from a shared counter, so slow and fast evaluations are
+// balanced across threads. The rewards are always returned in the order of the pending pulls, and
+// GMAB applies them in that order. For objectives that only depend on the action vector and the
+// seed of the pull (see `SeededOptimizationFn`), the results are therefore identical to an
+// optimization with the plain objective.
+pub struct ParallelOptimizationFn<F> {
+    opti_function: F,
+    n_workers: usize,
+}
+
+impl<F: OptimizationFn + Sync> ParallelOptimizationFn<F> {
+    pub fn new(opti_function: F, n_workers: usize) -> Self {
+        assert!(
+            n_workers >= 1,
+            "n_workers must be at least 1. ({})",
+            n_workers
+        );
+        Self {
+            opti_function,
+            n_workers,
+        }
+    }
+}
+
+impl<F: OptimizationFn + Sync> OptimizationFn for ParallelOptimizationFn<F> {
+    fn evaluate(&self, action_vector: &[i32]) -> f64 {
+        self.opti_function.evaluate(action_vector)
+    }
+
+    fn evaluate_seeded(&self, action_vector: &[i32], seed: u64) -> f64 {
+        self.opti_function.evaluate_seeded(action_vector, seed)
+    }
+
+    fn evaluate_batch(&self, action_vectors: &[&[i32]], seeds: &[u64]) -> Vec<f64> {
+        let n_workers = self.n_workers.min(action_vectors.len());
+        if n_workers <= 1 {
+            return self.opti_function.evaluate_batch(action_vectors, seeds);
+        }
+
+        let next_pull = AtomicUsize::new(0);
+        let mut rewards = vec![0.0; action_vectors.len()];
+
+        thread::scope(|scope| {
+            let workers: Vec<_> = (0..n_workers)
+                .map(|_| {
+                    scope.spawn(|| {
+                        let mut evaluated: Vec<(usize, f64)> = Vec::new();
+                        loop {
+                            let index = next_pull.fetch_add(1, Ordering::Relaxed);
+                            if index >= action_vectors.len() {
+                                break;
+                            }
+                            let reward = self
+                                .opti_function
+                                .evaluate_seeded(action_vectors[index], seeds[index]);
+                            evaluated.push((index, reward));
+                        }
+                        evaluated
+                    })
+                })
+                .collect();
+
+            for worker in workers {
+                // Propagate panics from the objective, like a serial evaluation would
+                let evaluated = worker
+                    .join()
+                    .unwrap_or_else(|err| std::panic::resume_unwind(err));
+                for (index, reward) in evaluated {
+                    rewards[index] = reward;
+                }
+            }
+        });
+
+        rewards
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::thread::ThreadId;
+
+    fn mock_opti_function(vec: &[i32]) -> f64 {
+        vec.iter().map(|&x| x as f64).sum()
+    }
+
+    #[test]
+    #[should_panic = "n_workers"]
+    fn test_panic_on_invalid_n_workers() {
+        ParallelOptimizationFn::new(mock_opti_function, 0);
+    }
+
+    #[test]
+    fn test_evaluate_batch_keeps_order() {
+        let parallel_fn = ParallelOptimizationFn::new(mock_opti_function, 4);
+        let action_vectors: Vec<Vec<i32>> = (0..100).map(|i| vec![i, i]).collect();
+        let action_vectors: Vec<&[i32]> = action_vectors.iter().map(|v| v.as_slice()).collect();
+
+        let seeds: Vec<u64> = (0..100).collect();
+        let rewards = parallel_fn.evaluate_batch(&action_vectors, &seeds);
+        let expected: Vec<f64> = (0..100).map(|i| 2.0 * i as f64).collect();
+        assert_eq!(rewards, expected);
+    }
+
+    #[test]
+    fn test_evaluate_batch_uses_workers() {
+        let thread_ids = std::sync::Mutex::new(std::collections::HashSet::<ThreadId>::new());
+        let opti_function = |_: &[i32]| {
+            thread_ids.lock().unwrap().insert(thread::current().id());
+            std::thread::sleep(std::time::Duration::from_millis(1));
+            0.0
+        };
+
+        let parallel_fn = ParallelOptimizationFn::new(opti_function, 4);
+        let action_vectors: Vec<&[i32]> = vec![&[0]; 40];
+        parallel_fn.evaluate_batch(&action_vectors, &[0; 40]);
+
+        assert!(thread_ids.lock().unwrap().len() > 1);
+    }
+}
@@ -0,0 +1,101 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::time::Instant;
+
+// The phases of an optimization that a Profile times.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum Phase {
+    // Selection, crossover and mutation of the next generation
+    Breeding,
+    // The calls of the objective, including any conversion of the action vectors it needs
+    Evaluation,
+    // Applying the rewards to the arms and the sorted tree
+    Update,
+    // Finding the best arm by its UCB value after each generation
+    Selection,
+}
+
+// Counters and timers of the hot path of GMAB, to tell how the time of an optimization splits
+// between the objective and the algorithm. Profiling is disabled by default, and then costs a
+// single branch per counted event.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct Profile {
+    // Pulls of arms without evaluations, and of arms that have been evaluated before. Together,
+    // they are the number of used trials.
+    pub new_arm_pulls: u64,
+    pub repulls: u64,
+    // Bred individuals that are skipped, as they are in the current population already
+    pub duplicate_offspring: u64,
+    pub generations: u64,
+    // Arms that are moved in the sorted tree, since a reward changed their mean
+    pub tree_reinserts: u64,
+    // The cumulative time per phase in nanoseconds
+    pub breeding_ns: u64,
+    pub evaluation_ns: u64,
+    pub update_ns: u64,
+    pub selection_ns: u64,
+}
+
+impl Profile {
+    pub fn used_trials(&self) -> u64 {
+        self.new_arm_pulls + self.repulls
+    }
+
+    pub(crate) fn add_time(&mut self, phase: Phase, started: Instant) {
+        let elapsed = started.elapsed().as_nanos() as u64;
+        match phase {
+            Phase::Breeding => self.breeding_ns += elapsed,
+            Phase::Evaluation => self.evaluation_ns += elapsed,
+            Phase::Update => self.update_ns += elapsed,
+            Phase::Selection => self.selection_ns += elapsed,
+        }
+    }
+
+    // Adds the counters and timers of another profile, e.g. of another island.
+    pub fn merge(&mut self, other: &Profile) {
+        self.new_arm_pulls += other.new_arm_pulls;
+        self.repulls += other.repulls;
+        self.duplicate_offspring += other.duplicate_offspring;
+        self.generations += other.generations;
+        self.tree_reinserts += other.tree_reinserts;
+        self.breeding_ns += other.breeding_ns;
+        self.evaluation_ns += other.evaluation_ns;
+        self.update_ns += other.update_ns;
+        self.selection_ns += other.selection_ns;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_profile_merge() {
+        let mut profile = Profile {
+            new_arm_pulls: 3,
+            repulls: 2,
+            generations: 1,
+            evaluation_ns: 10,
+            ..Default::default()
+        };
+        profile.merge(&profile.clone());
+        assert_eq!(profile.used_trials(), 10);
+        assert_eq!(profile.generations, 2);
+        assert_eq!(profile.evaluation_ns, 20);
+
+        profile.add_time(Phase::Update, Instant::now());
+        assert_eq!(profile.breeding_ns, 0);
+    }
+}
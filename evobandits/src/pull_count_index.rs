@@ -0,0 +1,190 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::collections::{BTreeMap, BTreeSet};
+
+use crate::sorted_multi_map::FloatKey;
+
+// Position of an arm in the sample average tree: its key, and its index, which orders arms with
+// equal keys like the SortedMultiMap does.
+pub(crate) type TreePosition = (FloatKey, i32);
+
+// Groups the arms of the sample average tree by their number of evaluations.
+//
+// Within a group, all arms share the exploration penalty of the UCB value, so the arm with the
+// lowest mean (the first in tree order) is the only candidate for the lowest UCB value. The best
+// arm can therefore be found by visiting one arm per distinct number of evaluations, instead of
+// visiting all arms of the tree.
+#[derive(Debug, PartialEq, Clone)]
+pub(crate) struct PullCountIndex {
+    groups: BTreeMap<i32, BTreeSet<TreePosition>>,
+    entries: Vec<Option<(TreePosition, i32)>>,
+}
+
+impl PullCountIndex {
+    pub fn new() -> Self {
+        PullCountIndex {
+            groups: BTreeMap::new(),
+            entries: Vec::new(),
+        }
+    }
+
+    // Must be called whenever the arm is inserted into, or moved within the sample average tree.
+    pub fn insert(&mut self, arm_index: i32, key: FloatKey, n_evaluations: i32) {
+        self.delete(arm_index);
+
+        let position = (key, arm_index);
+        self.groups
+            .entry(n_evaluations)
+            .or_default()
+            .insert(position);
+
+        let arm_index = arm_index as usize;
+        if self.entries.len() <= arm_index {
+            self.entries.resize(arm_index + 1, None);
+        }
+        self.entries[arm_index] = Some((position, n_evaluations));
+    }
+
+    // Must be called whenever the arm is deleted from the sample average tree.
+    pub fn delete(&mut self, arm_index: i32) -> bool {
+        let Some(Some((position, n_evaluations))) = self
+            .entries
+            .get_mut(arm_index as usize)
+            .map(|entry| entry.take())
+        else {
+            return false;
+        };
+
+        if let Some(group) = self.groups.get_mut(&n_evaluations) {
+            group.remove(&position);
+            if group.is_empty() {
+                self.groups.remove(&n_evaluations);
+            }
+        }
+        true
+    }
+
+    // Whether the arm is in the sample average tree.
+    pub fn contains(&self, arm_index: i32) -> bool {
+        matches!(self.entries.get(arm_index as usize), Some(Some(_)))
+    }
+
+    // The first arm in tree order with the given number of evaluations. Arms in `excluded` are
+    // skipped, as if they had been deleted, e.g. arms that have been selected already.
+    pub fn first_with(&self, n_evaluations: i32, excluded: &[i32]) -> Option<&TreePosition> {
+        self.groups
+            .get(&n_evaluations)
+            .and_then(|group| first_included(group.iter(), excluded))
+    }
+
+    // The first arm in tree order for each number of evaluations, skipping excluded arms.
+    pub fn group_heads<'a>(
+        &'a self,
+        excluded: &'a [i32],
+    ) -> impl Iterator<Item = (i32, &'a TreePosition)> + 'a {
+        self.groups
+            .iter()
+            .filter_map(move |(n_evaluations, group)| {
+                first_included(group.iter(), excluded).map(|head| (*n_evaluations, head))
+            })
+    }
+
+    // The last arm in tree order, skipping excluded arms.
+    pub fn last(&self, excluded: &[i32]) -> Option<&TreePosition> {
+        self.groups
+            .values()
+            .filter_map(|group| first_included(group.iter().rev(), excluded))
+            .max()
+    }
+}
+
+fn first_included<'a>(
+    mut positions: impl Iterator<Item = &'a TreePosition>,
+    excluded: &[i32],
+) -> Option<&'a TreePosition> {
+    positions.find(|position| !excluded.contains(&position.1))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_pull_count_index_insert() {
+        let mut index = PullCountIndex::new();
+        index.insert(0, FloatKey::new(2.0), 1);
+        index.insert(1, FloatKey::new(1.0), 1);
+        index.insert(2, FloatKey::new(3.0), 2);
+
+        assert_eq!(index.first_with(1, &[]), Some(&(FloatKey::new(1.0), 1)));
+        assert_eq!(index.first_with(2, &[]), Some(&(FloatKey::new(3.0), 2)));
+        assert_eq!(index.first_with(3, &[]), None);
+        assert_eq!(index.last(&[]), Some(&(FloatKey::new(3.0), 2)));
+
+        let heads: Vec<i32> = index.group_heads(&[]).map(|(_, head)| head.1).collect();
+        assert_eq!(heads, vec![1, 2]);
+    }
+
+    #[test]
+    fn test_pull_count_index_ties_by_arm_index() {
+        let mut index = PullCountIndex::new();
+        index.insert(1, FloatKey::new(1.0), 1);
+        index.insert(0, FloatKey::new(1.0), 1);
+
+        assert_eq!(index.first_with(1, &[]).unwrap().1, 0);
+    }
+
+    #[test]
+    fn test_pull_count_index_delete() {
+        let mut index = PullCountIndex::new();
+        index.insert(0, FloatKey::new(1.0), 1);
+        index.insert(1, FloatKey::new(2.0), 1);
+
+        assert!(index.contains(0));
+        assert!(index.delete(0));
+        assert!(!index.contains(0));
+        assert!(!index.delete(0));
+        assert!(!index.delete(5));
+        assert_eq!(index.first_with(1, &[]).unwrap().1, 1);
+    }
+
+    #[test]
+    fn test_pull_count_index_excluded() {
+        let mut index = PullCountIndex::new();
+        index.insert(0, FloatKey::new(1.0), 1);
+        index.insert(1, FloatKey::new(2.0), 1);
+        index.insert(2, FloatKey::new(3.0), 2);
+
+        // Excluded arms are skipped, as if they had been deleted
+        assert_eq!(index.first_with(1, &[0]).unwrap().1, 1);
+        assert_eq!(index.first_with(2, &[2]), None);
+        assert_eq!(index.last(&[2]).unwrap().1, 1);
+        let heads: Vec<i32> = index.group_heads(&[0, 2]).map(|(_, head)| head.1).collect();
+        assert_eq!(heads, vec![1]);
+    }
+
+    #[test]
+    fn test_pull_count_index_reinsert() {
+        let mut index = PullCountIndex::new();
+        index.insert(0, FloatKey::new(1.0), 1);
+        index.insert(1, FloatKey::new(2.0), 1);
+
+        // Move the arm to another key and number of evaluations
+        index.insert(1, FloatKey::new(0.5), 2);
+        assert_eq!(index.first_with(1, &[]).unwrap().1, 0);
+        assert_eq!(index.first_with(2, &[]), Some(&(FloatKey::new(0.5), 1)));
+        assert_eq!(index.group_heads(&[]).count(), 2);
+    }
+}
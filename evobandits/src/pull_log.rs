@@ -0,0 +1,323 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::fmt;
+use std::fs::{self, File};
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex};
+
+use crate::snapshot::{write_atomically, SnapshotWriter};
+
+const PULL_LOG_MAGIC: &[u8] = b"EVOBPULL";
+const PULL_LOG_VERSION: u32 = 1;
+
+// The number of pulls that are buffered per column, before they are appended to the files.
+pub const CHUNK_SIZE: usize = 4096;
+
+// The files of a pull log in its directory: the header, and one file per column.
+pub const META_FILE: &str = "meta";
+pub const TRIAL_FILE: &str = "trial.u64";
+pub const ISLAND_FILE: &str = "island.u32";
+pub const ARM_FILE: &str = "arm.i32";
+pub const ACTION_VECTOR_FILE: &str = "action_vector.i32";
+pub const REWARD_FILE: &str = "reward.f64";
+pub const SEED_FILE: &str = "seed.u64";
+
+// An append-only file with the little-endian values of a column, and the values that have not
+// been written yet.
+#[derive(Debug)]
+struct Column {
+    file: File,
+    buffer: Vec<u8>,
+}
+
+impl Column {
+    fn create(path: &Path, value_size: usize) -> io::Result<Self> {
+        Ok(Self {
+            file: File::create(path)?,
+            buffer: Vec::with_capacity(CHUNK_SIZE * value_size),
+        })
+    }
+
+    fn flush(&mut self) -> io::Result<()> {
+        self.file.write_all(&self.buffer)?;
+        self.buffer.clear();
+        Ok(())
+    }
+}
+
+// Records every pull of an optimization: the trial index, the island and the arm index, the
+// action vector, the reward and the seed of the pull. The trial index counts the pulls recorded
+// before in the log, over all islands, while arm indexes belong to the arm store of their island.
+// The pulls are stored in a directory with one file of fixed-width little-endian values per
+// column (the action vectors with `dimension` values per pull), so each column can be
+// memory-mapped as an array. Pulls are buffered in chunks of CHUNK_SIZE per column, so the memory
+// of the log is fixed, and the cost per pull is a copy of its values, no matter how many pulls
+// are recorded.
+//
+// The columns are appended one after another, so an interrupted flush can leave columns of
+// different lengths. The header therefore stores the number of pulls that have been written to
+// all columns, and is replaced atomically after each flush. Readers ignore any values beyond it.
+#[derive(Debug)]
+pub struct PullLog {
+    dir: PathBuf,
+    dimension: usize,
+    len: u64,
+    trials: Column,
+    islands: Column,
+    arms: Column,
+    action_vectors: Column,
+    rewards: Column,
+    seeds: Column,
+}
+
+impl PullLog {
+    // Creates an empty pull log in the directory, which replaces the pulls logged there before.
+    pub fn create(dir: impl AsRef<Path>, dimension: usize) -> io::Result<Self> {
+        let dir = dir.as_ref();
+        fs::create_dir_all(dir)?;
+        write_meta(dir, dimension, 0)?;
+
+        Ok(Self {
+            dir: dir.to_path_buf(),
+            dimension,
+            len: 0,
+            trials: Column::create(&dir.join(TRIAL_FILE), 8)?,
+            islands: Column::create(&dir.join(ISLAND_FILE), 4)?,
+            arms: Column::create(&dir.join(ARM_FILE), 4)?,
+            action_vectors: Column::create(&dir.join(ACTION_VECTOR_FILE), 4 * dimension)?,
+            rewards: Column::create(&dir.join(REWARD_FILE), 8)?,
+            seeds: Column::create(&dir.join(SEED_FILE), 8)?,
+        })
+    }
+
+    pub fn dimension(&self) -> usize {
+        self.dimension
+    }
+
+    // The number of pulls that have been recorded.
+    pub fn len(&self) -> u64 {
+        self.len
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    pub fn record(
+        &mut self,
+        island: u32,
+        arm_index: i32,
+        action_vector: &[i32],
+        reward: f64,
+        seed: u64,
+    ) -> io::Result<()> {
+        assert_eq!(
+            action_vector.len(),
+            self.dimension,
+            "The action vector must match the dimension of the pull log."
+        );
+        self.trials
+            .buffer
+            .extend_from_slice(&self.len.to_le_bytes());
+        self.islands.buffer.extend_from_slice(&island.to_le_bytes());
+        self.arms.buffer.extend_from_slice(&arm_index.to_le_bytes());
+        for value in action_vector {
+            self.action_vectors
+                .buffer
+                .extend_from_slice(&value.to_le_bytes());
+        }
+        self.rewards.buffer.extend_from_slice(&reward.to_le_bytes());
+        self.seeds.buffer.extend_from_slice(&seed.to_le_bytes());
+
+        self.len += 1;
+        if self.seeds.buffer.len() == CHUNK_SIZE * 8 {
+            self.flush()?;
+        }
+        Ok(())
+    }
+
+    // Writes the buffered pulls to the files, and then commits them in the header, so all
+    // recorded pulls can be read.
+    pub fn flush(&mut self) -> io::Result<()> {
+        for column in [
+            &mut self.trials,
+            &mut self.islands,
+            &mut self.arms,
+            &mut self.action_vectors,
+            &mut self.rewards,
+            &mut self.seeds,
+        ] {
+            column.flush()?;
+        }
+        write_meta(&self.dir, self.dimension, self.len)
+    }
+}
+
+// Replaces the header of a pull log: the dimension of the action vectors, and the number of
+// pulls that have been written to all columns.
+fn write_meta(dir: &Path, dimension: usize, len: u64) -> io::Result<()> {
+    let mut writer = SnapshotWriter::new(PULL_LOG_MAGIC, PULL_LOG_VERSION);
+    writer.write_usize(dimension);
+    writer.write_u64(len);
+    write_atomically(&dir.join(META_FILE), &writer.into_bytes())
+}
+
+impl Drop for PullLog {
+    fn drop(&mut self) {
+        // Errors can't be reported here, `flush` reports them before the log is dropped
+        let _ = self.flush();
+    }
+}
+
+// A pull log that is shared by the copies of a GMAB, e.g. the islands of an optimization, which
+// record their pulls with their own island id. Copies are equal if they share the same log, and
+// record with the same island id.
+#[derive(Clone)]
+pub(crate) struct SharedPullLog {
+    pull_log: Arc<Mutex<PullLog>>,
+    pub island: u32,
+}
+
+impl SharedPullLog {
+    pub fn new(pull_log: PullLog) -> Self {
+        Self {
+            pull_log: Arc::new(Mutex::new(pull_log)),
+            island: 0,
+        }
+    }
+
+    pub fn record(
+        &self,
+        arm_index: i32,
+        action_vector: &[i32],
+        reward: f64,
+        seed: u64,
+    ) -> io::Result<()> {
+        self.pull_log
+            .lock()
+            .unwrap()
+            .record(self.island, arm_index, action_vector, reward, seed)
+    }
+
+    // Returns the pull log, unless it is still shared with other copies.
+    pub fn into_inner(self) -> Option<PullLog> {
+        Arc::try_unwrap(self.pull_log)
+            .ok()
+            .map(|pull_log| pull_log.into_inner().unwrap())
+    }
+}
+
+impl fmt::Debug for SharedPullLog {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("SharedPullLog")
+            .field("island", &self.island)
+            .finish_non_exhaustive()
+    }
+}
+
+impl PartialEq for SharedPullLog {
+    fn eq(&self, other: &Self) -> bool {
+        Arc::ptr_eq(&self.pull_log, &other.pull_log) && self.island == other.island
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn log_dir(name: &str) -> std::path::PathBuf {
+        let dir = std::env::temp_dir().join(format!(
+            "evobandits_pull_log_{}_{}",
+            name,
+            std::process::id()
+        ));
+        let _ = fs::remove_dir_all(&dir);
+        dir
+    }
+
+    fn read_column(dir: &Path, file: &str) -> Vec<u8> {
+        fs::read(dir.join(file)).unwrap()
+    }
+
+    // The number of pulls that the header commits
+    fn committed(dir: &Path) -> u64 {
+        let meta = read_column(dir, META_FILE);
+        u64::from_le_bytes(meta[meta.len() - 8..].try_into().unwrap())
+    }
+
+    #[test]
+    fn test_pull_log_columns() {
+        let dir = log_dir("columns");
+        let mut pull_log = PullLog::create(&dir, 2).unwrap();
+        for trial in 0..CHUNK_SIZE as u64 + 10 {
+            let arm_index = (trial % 7) as i32;
+            let island = (trial % 2) as u32;
+            pull_log
+                .record(island, arm_index, &[arm_index, -arm_index], 0.5, trial * 3)
+                .unwrap();
+        }
+
+        // Full chunks are written and committed as they are recorded, the rest once the log is
+        // flushed
+        assert_eq!(read_column(&dir, TRIAL_FILE).len(), CHUNK_SIZE * 8);
+        assert_eq!(committed(&dir), CHUNK_SIZE as u64);
+        pull_log.flush().unwrap();
+        assert_eq!(committed(&dir), CHUNK_SIZE as u64 + 10);
+        assert_eq!(pull_log.len(), CHUNK_SIZE as u64 + 10);
+
+        let n_pulls = CHUNK_SIZE + 10;
+        let trials = read_column(&dir, TRIAL_FILE);
+        let action_vectors = read_column(&dir, ACTION_VECTOR_FILE);
+        assert_eq!(trials.len(), n_pulls * 8);
+        assert_eq!(read_column(&dir, ISLAND_FILE).len(), n_pulls * 4);
+        assert_eq!(read_column(&dir, ARM_FILE).len(), n_pulls * 4);
+        assert_eq!(action_vectors.len(), n_pulls * 2 * 4);
+        assert_eq!(read_column(&dir, REWARD_FILE).len(), n_pulls * 8);
+        assert_eq!(read_column(&dir, SEED_FILE).len(), n_pulls * 8);
+
+        let last = n_pulls - 1;
+        let trial = u64::from_le_bytes(trials[last * 8..][..8].try_into().unwrap());
+        let action = i32::from_le_bytes(
+            action_vectors[(last * 2 + 1) * 4..][..4]
+                .try_into()
+                .unwrap(),
+        );
+        assert_eq!(trial, last as u64);
+        assert_eq!(action, -((last % 7) as i32));
+
+        let meta = read_column(&dir, META_FILE);
+        assert_eq!(&meta[..8], PULL_LOG_MAGIC);
+        assert_eq!(meta.len(), 8 + 4 + 8 + 8);
+        fs::remove_dir_all(&dir).unwrap();
+    }
+
+    #[test]
+    fn test_pull_log_flushes_when_dropped() {
+        let dir = log_dir("drop");
+        let mut pull_log = PullLog::create(&dir, 1).unwrap();
+        pull_log.record(0, 0, &[1], 1.0, 2).unwrap();
+        drop(pull_log);
+        assert_eq!(read_column(&dir, SEED_FILE), 2u64.to_le_bytes());
+        assert_eq!(committed(&dir), 1);
+
+        // Creating a log replaces the pulls logged before
+        let pull_log = PullLog::create(&dir, 1).unwrap();
+        assert!(pull_log.is_empty());
+        assert!(read_column(&dir, SEED_FILE).is_empty());
+        assert_eq!(committed(&dir), 0);
+        fs::remove_dir_all(&dir).unwrap();
+    }
+}
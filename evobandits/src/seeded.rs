@@ -0,0 +1,78 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use crate::arm::OptimizationFn;
+
+// Derives the seed of a pull from the seed of the run and the number of the pull.
+//
+// The derivation is counter-based (a SplitMix64 step at the position of the pull), so the seed of
+// a pull does not depend on which pulls have been evaluated before, or on which thread.
+pub fn pull_seed(run_seed: u64, pull: u64) -> u64 {
+    let mut z = run_seed.wrapping_add(pull.wrapping_add(1).wrapping_mul(0x9e37_79b9_7f4a_7c15));
+    z = (z ^ (z >> 30)).wrapping_mul(0xbf58_476d_1ce4_e5b9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94d0_49bb_1331_11eb);
+    z ^ (z >> 31)
+}
+
+// Wraps a stochastic objective that takes the seed of each pull along with its action vector.
+//
+// The objective should draw its random numbers from a generator seeded with the given seed. Since
+// the seeds only depend on the run seed and the number of the pull, an optimization then yields
+// bit-identical results with any evaluation schedule, e.g. on a pool of worker threads.
+pub struct SeededOptimizationFn<F> {
+    opti_function: F,
+}
+
+impl<F: Fn(&[i32], u64) -> f64> SeededOptimizationFn<F> {
+    pub fn new(opti_function: F) -> Self {
+        Self { opti_function }
+    }
+}
+
+impl<F: Fn(&[i32], u64) -> f64> OptimizationFn for SeededOptimizationFn<F> {
+    // Evaluates the action vector outside of a pull, with the seed 0.
+    fn evaluate(&self, action_vector: &[i32]) -> f64 {
+        (self.opti_function)(action_vector, 0)
+    }
+
+    fn evaluate_seeded(&self, action_vector: &[i32], seed: u64) -> f64 {
+        (self.opti_function)(action_vector, seed)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_pull_seed() {
+        // Distinct for different pulls and runs, but the same for the same pull of a run
+        assert_eq!(pull_seed(42, 7), pull_seed(42, 7));
+        assert_ne!(pull_seed(42, 7), pull_seed(42, 8));
+        assert_ne!(pull_seed(42, 7), pull_seed(43, 7));
+    }
+
+    #[test]
+    fn test_seeded_evaluate_batch() {
+        let seeded_fn =
+            SeededOptimizationFn::new(|vec: &[i32], seed: u64| vec[0] as f64 + seed as f64);
+        let action_vectors: Vec<&[i32]> = vec![&[1], &[2]];
+
+        assert_eq!(
+            seeded_fn.evaluate_batch(&action_vectors, &[10, 20]),
+            vec![11.0, 22.0]
+        );
+        assert_eq!(seeded_fn.evaluate(&[1]), 1.0);
+    }
+}
@@ -0,0 +1,291 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::fs::{self, File};
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
+use std::time::Duration;
+
+pub const CHECKPOINT_INTERVAL_DEFAULT: f64 = 60.0;
+
+// Saves snapshots of a GMAB while it optimizes: after at least `every_n_trials` trials or
+// `interval` (whichever comes first) since the last snapshot, and once all trials have been used.
+// Snapshots are only taken between generations, so a resumed optimization continues at the start
+// of the next generation.
+#[derive(Debug, Clone, PartialEq)]
+pub struct Checkpoint {
+    pub path: PathBuf,
+    pub every_n_trials: Option<usize>,
+    pub interval: Option<Duration>,
+}
+
+impl Checkpoint {
+    pub fn new(
+        path: impl Into<PathBuf>,
+        every_n_trials: Option<usize>,
+        interval: Option<Duration>,
+    ) -> Self {
+        if let Some(every_n_trials) = every_n_trials {
+            assert!(
+                every_n_trials >= 1,
+                "every_n_trials must be at least 1. ({})",
+                every_n_trials
+            );
+        }
+        Self {
+            path: path.into(),
+            every_n_trials,
+            interval,
+        }
+    }
+
+    pub(crate) fn is_due(&self, n_trials: usize, elapsed: Duration) -> bool {
+        self.every_n_trials.is_some_and(|every| n_trials >= every)
+            || self.interval.is_some_and(|interval| elapsed >= interval)
+    }
+}
+
+// Writes a file atomically: the bytes are written to a temporary file next to it, which then
+// replaces the file, so a reader never sees a partially written snapshot.
+pub(crate) fn write_atomically(path: &Path, bytes: &[u8]) -> io::Result<()> {
+    let mut tmp_path = path.as_os_str().to_owned();
+    tmp_path.push(".tmp");
+    let tmp_path = PathBuf::from(tmp_path);
+
+    let mut file = File::create(&tmp_path)?;
+    file.write_all(bytes)?;
+    file.sync_all()?;
+    drop(file);
+    fs::rename(&tmp_path, path)
+}
+
+// Encodes a snapshot as a compact sequence of little-endian values.
+#[derive(Debug, Default)]
+pub(crate) struct SnapshotWriter {
+    bytes: Vec<u8>,
+}
+
+impl SnapshotWriter {
+    pub fn new(magic: &[u8], version: u32) -> Self {
+        let mut writer = Self::default();
+        writer.bytes.extend_from_slice(magic);
+        writer.write_u32(version);
+        writer
+    }
+
+    pub fn into_bytes(self) -> Vec<u8> {
+        self.bytes
+    }
+
+    pub fn write_bytes(&mut self, bytes: &[u8]) {
+        self.bytes.extend_from_slice(bytes);
+    }
+
+    pub fn write_u32(&mut self, value: u32) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn write_u64(&mut self, value: u64) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn write_u128(&mut self, value: u128) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn write_usize(&mut self, value: usize) {
+        self.write_u64(value as u64);
+    }
+
+    pub fn write_f64(&mut self, value: f64) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn write_i32s(&mut self, values: &[i32]) {
+        self.write_usize(values.len());
+        for value in values {
+            self.bytes.extend_from_slice(&value.to_le_bytes());
+        }
+    }
+
+    pub fn write_f64s(&mut self, values: &[f64]) {
+        self.write_usize(values.len());
+        for value in values {
+            self.bytes.extend_from_slice(&value.to_le_bytes());
+        }
+    }
+}
+
+pub(crate) fn invalid_data(message: &str) -> io::Error {
+    io::Error::new(io::ErrorKind::InvalidData, message.to_string())
+}
+
+// Decodes a snapshot that has been encoded with the SnapshotWriter.
+pub(crate) struct SnapshotReader<'a> {
+    bytes: &'a [u8],
+}
+
+impl<'a> SnapshotReader<'a> {
+    pub fn new(bytes: &'a [u8], magic: &[u8], version: u32) -> io::Result<Self> {
+        let mut reader = Self { bytes };
+        if reader.read_bytes(magic.len())? != magic {
+            return Err(invalid_data("Not an EvoBandits snapshot."));
+        }
+        let found = reader.read_u32()?;
+        if found != version {
+            return Err(invalid_data(&format!(
+                "Unsupported snapshot version {} (expected {}).",
+                found, version
+            )));
+        }
+        Ok(reader)
+    }
+
+    // Checks that the whole snapshot has been read.
+    pub fn finish(self) -> io::Result<()> {
+        if !self.bytes.is_empty() {
+            return Err(invalid_data("Snapshot has trailing bytes."));
+        }
+        Ok(())
+    }
+
+    pub fn read_bytes(&mut self, n: usize) -> io::Result<&'a [u8]> {
+        if self.bytes.len() < n {
+            return Err(invalid_data("Snapshot is truncated."));
+        }
+        let (head, tail) = self.bytes.split_at(n);
+        self.bytes = tail;
+        Ok(head)
+    }
+
+    fn read_array<const N: usize>(&mut self) -> io::Result<[u8; N]> {
+        Ok(self.read_bytes(N)?.try_into().unwrap())
+    }
+
+    pub fn read_u32(&mut self) -> io::Result<u32> {
+        Ok(u32::from_le_bytes(self.read_array()?))
+    }
+
+    pub fn read_u64(&mut self) -> io::Result<u64> {
+        Ok(u64::from_le_bytes(self.read_array()?))
+    }
+
+    pub fn read_u128(&mut self) -> io::Result<u128> {
+        Ok(u128::from_le_bytes(self.read_array()?))
+    }
+
+    pub fn read_usize(&mut self) -> io::Result<usize> {
+        usize::try_from(self.read_u64()?).map_err(|_| invalid_data("Snapshot is corrupted."))
+    }
+
+    pub fn read_f64(&mut self) -> io::Result<f64> {
+        Ok(f64::from_le_bytes(self.read_array()?))
+    }
+
+    // Reads the length of a sequence, and checks that the snapshot can hold it.
+    fn read_len(&mut self, item_size: usize) -> io::Result<usize> {
+        let len = self.read_usize()?;
+        if len.saturating_mul(item_size) > self.bytes.len() {
+            return Err(invalid_data("Snapshot is truncated."));
+        }
+        Ok(len)
+    }
+
+    pub fn read_i32s(&mut self) -> io::Result<Vec<i32>> {
+        let len = self.read_len(4)?;
+        let bytes = self.read_bytes(len * 4)?;
+        Ok(bytes
+            .chunks_exact(4)
+            .map(|chunk| i32::from_le_bytes(chunk.try_into().unwrap()))
+            .collect())
+    }
+
+    pub fn read_f64s(&mut self) -> io::Result<Vec<f64>> {
+        let len = self.read_len(8)?;
+        let bytes = self.read_bytes(len * 8)?;
+        Ok(bytes
+            .chunks_exact(8)
+            .map(|chunk| f64::from_le_bytes(chunk.try_into().unwrap()))
+            .collect())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const MAGIC: &[u8] = b"TEST";
+
+    #[test]
+    fn test_snapshot_round_trip() {
+        let mut writer = SnapshotWriter::new(MAGIC, 1);
+        writer.write_u64(42);
+        writer.write_u128(u128::MAX - 1);
+        writer.write_f64(-0.5);
+        writer.write_i32s(&[1, -2, 3]);
+        writer.write_f64s(&[]);
+        let bytes = writer.into_bytes();
+
+        let mut reader = SnapshotReader::new(&bytes, MAGIC, 1).unwrap();
+        assert_eq!(reader.read_u64().unwrap(), 42);
+        assert_eq!(reader.read_u128().unwrap(), u128::MAX - 1);
+        assert_eq!(reader.read_f64().unwrap(), -0.5);
+        assert_eq!(reader.read_i32s().unwrap(), vec![1, -2, 3]);
+        assert_eq!(reader.read_f64s().unwrap(), Vec::<f64>::new());
+        reader.finish().unwrap();
+    }
+
+    #[test]
+    fn test_snapshot_reader_rejects_invalid_data() {
+        let mut writer = SnapshotWriter::new(MAGIC, 1);
+        writer.write_i32s(&[1, 2, 3]);
+        let bytes = writer.into_bytes();
+
+        assert!(SnapshotReader::new(b"NOPE", MAGIC, 1).is_err());
+        assert!(SnapshotReader::new(&bytes, MAGIC, 2).is_err());
+
+        let mut truncated = SnapshotReader::new(&bytes[..bytes.len() - 1], MAGIC, 1).unwrap();
+        assert!(truncated.read_i32s().is_err());
+
+        let mut reader = SnapshotReader::new(&bytes, MAGIC, 1).unwrap();
+        reader.read_u64().unwrap();
+        assert!(reader.finish().is_err());
+    }
+
+    #[test]
+    fn test_checkpoint_is_due() {
+        let checkpoint = Checkpoint::new("snapshot", Some(100), Some(Duration::from_secs(1)));
+        assert!(!checkpoint.is_due(99, Duration::ZERO));
+        assert!(checkpoint.is_due(100, Duration::ZERO));
+        assert!(checkpoint.is_due(0, Duration::from_secs(1)));
+
+        // Without a schedule, only the final snapshot is taken
+        let checkpoint = Checkpoint::new("snapshot", None, None);
+        assert!(!checkpoint.is_due(usize::MAX, Duration::MAX));
+    }
+
+    #[test]
+    fn test_write_atomically() {
+        let dir = std::env::temp_dir().join(format!("evobandits-{}", std::process::id()));
+        fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("snapshot.bin");
+
+        write_atomically(&path, b"first").unwrap();
+        write_atomically(&path, b"second").unwrap();
+        assert_eq!(fs::read(&path).unwrap(), b"second");
+        assert!(!dir.join("snapshot.bin.tmp").exists());
+
+        fs::remove_dir_all(&dir).unwrap();
+    }
+}
@@ -13,10 +13,10 @@
 // limitations under the License.
 
 use std::cmp::Ordering;
-use std::collections::BTreeMap;
+use std::collections::BTreeSet;
 
 #[derive(Debug, PartialEq, PartialOrd, Clone, Copy)]
-pub(crate) struct FloatKey(f64);
+pub struct FloatKey(f64);
 
 impl FloatKey {
     pub fn new(value: f64) -> Self {
@@ -36,39 +36,54 @@ impl Ord for FloatKey {
     }
 }
 
+// Maps keys to multiple values, sorted by key, and by value for equal keys.
+//
+// The entries are kept as (key, value) pairs in a single sorted set, so inserting, deleting and
+// repositioning an entry takes logarithmic time, also when many values share the same key.
 #[derive(Debug, PartialEq, Clone)]
-pub(crate) struct SortedMultiMap<K: Ord, V: PartialEq> {
-    inner: BTreeMap<K, Vec<V>>,
+pub struct SortedMultiMap<K: Ord, V: Ord> {
+    inner: BTreeSet<(K, V)>,
+}
+
+impl<K: Ord + Clone, V: Ord + Clone> Default for SortedMultiMap<K, V> {
+    fn default() -> Self {
+        Self::new()
+    }
 }
 
-impl<K: Ord, V: PartialEq> SortedMultiMap<K, V> {
+impl<K: Ord + Clone, V: Ord + Clone> SortedMultiMap<K, V> {
     pub fn new() -> Self {
         SortedMultiMap {
-            inner: BTreeMap::new(),
+            inner: BTreeSet::new(),
         }
     }
 
-    pub fn insert(&mut self, key: K, value: V) {
-        self.inner.entry(key).or_insert_with(Vec::new).push(value);
+    pub fn insert(&mut self, key: K, value: V) -> bool {
+        self.inner.insert((key, value))
     }
 
     pub fn delete(&mut self, key: &K, value: &V) -> bool {
-        if let Some(values) = self.inner.get_mut(key) {
-            if let Some(pos) = values.iter().position(|v| v == value) {
-                values.remove(pos);
-                if values.is_empty() {
-                    self.inner.remove(key);
-                }
-                return true;
-            }
+        self.inner.remove(&(key.clone(), value.clone()))
+    }
+
+    // Moves the value from the old to the new key. Returns false, and leaves the map unchanged,
+    // if the value is not stored under the old key.
+    pub fn update_key(&mut self, old_key: &K, new_key: K, value: V) -> bool {
+        if *old_key == new_key {
+            return self.inner.contains(&(new_key, value));
+        }
+        if !self.inner.remove(&(old_key.clone(), value.clone())) {
+            return false;
         }
-        false
+        self.inner.insert((new_key, value))
     }
 
     pub fn iter(&self) -> impl Iterator<Item = (&K, &V)> {
-        self.inner
-            .iter()
-            .flat_map(|(key, values)| values.iter().map(move |value| (key, value)))
+        self.inner.iter().map(|(key, value)| (key, value))
+    }
+
+    pub fn len(&self) -> usize {
+        self.inner.len()
     }
 
     pub fn is_empty(&self) -> bool {
@@ -112,6 +127,33 @@ mod tests {
         assert_eq!(iter.next(), None);
     }
 
+    #[test]
+    fn test_sorted_multi_map_equal_keys_sorted_by_value() {
+        let mut map = SortedMultiMap::new();
+        map.insert(FloatKey::new(1.0), 2);
+        map.insert(FloatKey::new(1.0), 1);
+        assert!(!map.insert(FloatKey::new(1.0), 1));
+
+        let values: Vec<i32> = map.iter().map(|(_, value)| *value).collect();
+        assert_eq!(values, vec![1, 2]);
+    }
+
+    #[test]
+    fn test_sorted_multi_map_update_key() {
+        let mut map = SortedMultiMap::new();
+        map.insert(FloatKey::new(1.0), 1);
+        map.insert(FloatKey::new(1.0), 2);
+        map.insert(FloatKey::new(2.0), 3);
+
+        assert!(map.update_key(&FloatKey::new(1.0), FloatKey::new(3.0), 1));
+        assert!(map.update_key(&FloatKey::new(2.0), FloatKey::new(2.0), 3));
+        assert!(!map.update_key(&FloatKey::new(1.0), FloatKey::new(0.0), 3));
+        assert!(!map.update_key(&FloatKey::new(2.0), FloatKey::new(2.0), 1));
+
+        let entries: Vec<(f64, i32)> = map.iter().map(|(key, value)| (key.0, *value)).collect();
+        assert_eq!(entries, vec![(1.0, 2), (2.0, 3), (3.0, 1)]);
+    }
+
     #[test]
     fn test_sorted_multi_map_is_empty() {
         let mut map = SortedMultiMap::new();
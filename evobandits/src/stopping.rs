@@ -0,0 +1,139 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::time::Duration;
+
+// Rules to stop an optimization before all trials have been used, e.g. once the best arm has
+// settled on an easy problem. The rules are checked between generations, and the optimization
+// stops with the first rule that applies. Without any rule, all trials are used.
+#[derive(Debug, Clone, PartialEq, Default)]
+pub struct StoppingRules {
+    // The number of generations without a change of the best arm
+    pub patience: Option<usize>,
+    // The width of the confidence intervals (mean +- confidence * standard error) of the best arm
+    // and the runner-up, which must not overlap
+    pub confidence: Option<f64>,
+    // The wall-clock time since the optimization has been (re)started
+    pub deadline: Option<Duration>,
+    // The mean of the best arm to reach, or to fall below
+    pub target_value: Option<f64>,
+}
+
+impl StoppingRules {
+    pub fn new(
+        patience: Option<usize>,
+        confidence: Option<f64>,
+        deadline: Option<Duration>,
+        target_value: Option<f64>,
+    ) -> Self {
+        if let Some(patience) = patience {
+            assert!(patience >= 1, "patience must be at least 1. ({})", patience);
+        }
+        if let Some(confidence) = confidence {
+            assert!(
+                confidence > 0.0 && confidence.is_finite(),
+                "confidence must be a positive number. ({})",
+                confidence
+            );
+        }
+        if let Some(target_value) = target_value {
+            assert!(
+                !target_value.is_nan(),
+                "target_value must be a number. ({})",
+                target_value
+            );
+        }
+        Self {
+            patience,
+            confidence,
+            deadline,
+            target_value,
+        }
+    }
+}
+
+// The rule that stopped an optimization early.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum StopReason {
+    Patience,
+    Confidence,
+    Deadline,
+    TargetValue,
+}
+
+impl StopReason {
+    pub fn name(&self) -> &'static str {
+        match self {
+            StopReason::Patience => "patience",
+            StopReason::Confidence => "confidence",
+            StopReason::Deadline => "deadline",
+            StopReason::TargetValue => "target_value",
+        }
+    }
+}
+
+// Reports an optimization that has been stopped early: the rule that applied, and the number of
+// trials of the budget that have not been used.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct EarlyStop {
+    pub reason: StopReason,
+    pub saved_trials: usize,
+}
+
+// Checks whether the confidence intervals of two arms, given as (mean, standard deviation, number
+// of evaluations), are separated. Arms with less than two evaluations have no standard deviation
+// yet, so their intervals are unbounded.
+pub(crate) fn is_separated(best: (f64, f64, i32), runner_up: (f64, f64, i32), z: f64) -> bool {
+    let half_width = |(_mean, std_dev, n): (f64, f64, i32)| {
+        if n < 2 {
+            f64::INFINITY
+        } else {
+            z * std_dev / (n as f64).sqrt()
+        }
+    };
+    let (lower, upper) = if best.0 <= runner_up.0 {
+        (best, runner_up)
+    } else {
+        (runner_up, best)
+    };
+    lower.0 + half_width(lower) < upper.0 - half_width(upper)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_is_separated() {
+        // Intervals [0.5, 1.5] and [2.5, 3.5]
+        assert!(is_separated((1.0, 1.0, 4), (3.0, 1.0, 4), 1.0));
+        assert!(is_separated((3.0, 1.0, 4), (1.0, 1.0, 4), 1.0));
+        // Intervals [-1.0, 3.0] and [1.0, 5.0]
+        assert!(!is_separated((1.0, 1.0, 4), (3.0, 1.0, 4), 4.0));
+        // Unbounded interval with a single evaluation
+        assert!(!is_separated((1.0, 0.0, 1), (3.0, 0.0, 4), 1.0));
+    }
+
+    #[test]
+    #[should_panic(expected = "patience must be at least 1")]
+    fn test_stopping_rules_invalid_patience() {
+        StoppingRules::new(Some(0), None, None, None);
+    }
+
+    #[test]
+    #[should_panic(expected = "confidence must be a positive number")]
+    fn test_stopping_rules_invalid_confidence() {
+        StoppingRules::new(None, Some(f64::NAN), None, None);
+    }
+}
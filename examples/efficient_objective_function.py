@@ -14,7 +14,7 @@
 
 
 import numpy as np
-from evobandits import IntParam, Study
+from evobandits import Execution, IntParam, Study
 from numba import njit
 
 # Constants
@@ -69,7 +69,8 @@ if __name__ == "__main__":
 
     # Execute optimization
     study = Study(seed=42)
-    study.optimize(tp4_func, params, n_trials, n_runs=n_runs)
+    execution = Execution(parallel_runs=True, array=True)
+    study.optimize(tp4_func, params, n_trials, n_runs=n_runs, execution=execution)
     print("Best solution found during optimization: ", study.best_value)
     print("Mean result:", study.mean_value)
     print("Best configuration: ", study.best_params)
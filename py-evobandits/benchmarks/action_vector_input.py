@@ -0,0 +1,57 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the objective calls per second of GMAB.optimize with list and with array input.
+
+The objective is a NumPy function, so list input has to be converted to an array on every call,
+while array input (`array=True`) is used as it is.
+
+Usage:
+    python benchmarks/action_vector_input.py
+"""
+
+import time
+
+import numpy as np
+from evobandits import GMAB
+
+N_TRIALS = 20_000
+DIMENSIONS = [2, 10, 100, 1000]
+
+
+def sphere(action_vector: np.ndarray) -> float:
+    return float(np.sum((action_vector - 50.0) ** 2))
+
+
+def sphere_from_list(action_vector: list[int]) -> float:
+    return sphere(np.asarray(action_vector, dtype=np.int32))
+
+
+def calls_per_second(objective, dimension: int, array: bool) -> float:
+    bounds = [(0, 100)] * dimension
+    start = time.perf_counter()
+    GMAB().optimize(objective, bounds, N_TRIALS, 1, 42, array=array)
+    return N_TRIALS / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"{'dimension':>10} {'list [calls/s]':>16} {'array [calls/s]':>16} {'speedup':>8}")
+    for dimension in DIMENSIONS:
+        list_input = calls_per_second(sphere_from_list, dimension, array=False)
+        array_input = calls_per_second(sphere, dimension, array=True)
+        print(
+            f"{dimension:>10} {list_input:>16,.0f} {array_input:>16,.0f} "
+            f"{array_input / list_input:>7.2f}x"
+        )
@@ -0,0 +1,98 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares decoding action vectors param by param with the compiled ParamDecoder.
+
+Decoding param by param slices the action vector and recomputes the scale of each FloatParam
+for every trial, while the ParamDecoder computes the offsets and scales only once.
+
+Usage:
+    python benchmarks/param_decoding.py
+"""
+
+import time
+from functools import partial
+
+import numpy as np
+from evobandits.params import CategoricalParam, FloatParam, IntParam, ParamDecoder
+
+N_VECTORS = 10_000
+N_PARAMS = [5, 50]
+
+
+def make_params(n_params: int) -> dict:
+    kinds = [
+        lambda: IntParam(0, 100),
+        lambda: FloatParam(0, 1),
+        lambda: FloatParam(1e-4, 1, log=True),
+        lambda: CategoricalParam(["a", "b", "c"]),
+        lambda: FloatParam(0, 1, size=3),
+    ]
+    return {f"p{i}": kinds[i % len(kinds)]() for i in range(n_params)}
+
+
+def decode_each_param(params: dict, action_vector: list[int]) -> dict:
+    result = {}
+    idx = 0
+    for key, param in params.items():
+        result[key] = param.decode(action_vector[idx : idx + param.size])
+        idx += param.size
+    return result
+
+
+def decode_columns_each_param(params: dict, action_vectors: np.ndarray) -> dict:
+    result = {}
+    idx = 0
+    for key, param in params.items():
+        result[key] = param.decode_columns(action_vectors[:, idx : idx + param.size])
+        idx += param.size
+    return result
+
+
+def decode_rows(decode, rows: list[list[int]]) -> list[dict]:
+    return [decode(row) for row in rows]
+
+
+def seconds(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    print(f"{'params':>7} {'mode':>8} {'per param [ms]':>15} {'decoder [ms]':>13} {'speedup':>8}")
+    for n_params in N_PARAMS:
+        params = make_params(n_params)
+        decoder = ParamDecoder(params)
+        high = np.array([upper for p in params.values() for _, upper in p.bounds])
+        action_vectors = (rng.random((N_VECTORS, decoder.size)) * (high + 1)).astype(np.int32)
+        rows = action_vectors.tolist()
+
+        timings = {
+            "rows": (
+                seconds(decode_rows, partial(decode_each_param, params), rows),
+                seconds(decode_rows, decoder.decode, rows),
+            ),
+            "columns": (
+                seconds(decode_columns_each_param, params, action_vectors),
+                seconds(decoder.decode_columns, action_vectors),
+            ),
+        }
+        for mode, (per_param, compiled) in timings.items():
+            print(
+                f"{n_params:>7} {mode:>8} {per_param * 1e3:>15,.1f} {compiled * 1e3:>13,.1f} "
+                f"{per_param / compiled:>7.2f}x"
+            )
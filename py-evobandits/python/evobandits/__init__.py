@@ -16,18 +16,25 @@ import importlib.util
 
 from evobandits import logging
 from evobandits.evobandits import GMAB, Arm
+from evobandits.options import Cache, Checkpoint, Execution, StoppingRules
 from evobandits.params import CategoricalParam, FloatParam, IntParam
+from evobandits.pull_log import read_pull_log
 from evobandits.study import ALGORITHM_DEFAULT, Study
 
 __all__ = [
     "Arm",
+    "Cache",
+    "Checkpoint",
     "ALGORITHM_DEFAULT",
+    "Execution",
     "GMAB",
     "logging",
     "Study",
     "CategoricalParam",
     "FloatParam",
     "IntParam",
+    "StoppingRules",
+    "read_pull_log",
 ]
 
 if importlib.util.find_spec("sklearn") is not None:
@@ -0,0 +1,316 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import os
+from collections.abc import Callable
+from typing import Any
+
+from evobandits.evobandits import CHECKPOINT_INTERVAL_DEFAULT
+
+EXECUTORS = ("serial", "process")
+
+
+def check_bool(name: str, value: Any) -> None:
+    """
+    Validates an argument that must be a bool.
+
+    Raises:
+        TypeError: If the value is not a bool.
+    """
+    if not isinstance(value, bool):
+        raise TypeError(f"{name} must be a bool, got {type(value)}.")
+
+
+def check_path(name: str, value: Any, optional: bool = True) -> None:
+    """
+    Validates an argument that must be a path, or None if it is optional.
+
+    Raises:
+        TypeError: If the value is not a str or PathLike, and not an optional None.
+    """
+    if value is None and optional:
+        return
+    if not isinstance(value, (str, os.PathLike)):
+        raise TypeError(f"{name} must be a str or PathLike, got {type(value)}.")
+
+
+def check_number(
+    name: str,
+    value: Any,
+    description: str,
+    is_valid: Callable[[Any], bool],
+    types: type | tuple[type, ...] = (int, float),
+    optional: bool = True,
+) -> None:
+    """
+    Validates a numeric argument.
+
+    Args:
+        name: The name of the argument, for the error messages.
+        value: The value of the argument.
+        description: What the value must be, e.g. "a positive number".
+        is_valid: Whether a value of a valid type is in range.
+        types: The valid types of the value. Default are int and float.
+        optional: Indicates if None is a valid value. Default is True.
+
+    Raises:
+        TypeError: If the value is not of a valid type, and not an optional None.
+        ValueError: If the value is out of range.
+    """
+    if value is None and optional:
+        return
+    if not isinstance(value, types):
+        raise TypeError(f"{name} must be {description}, got {type(value)}.")
+    if not is_valid(value):
+        raise ValueError(f"{name} must be {description}, got {value}.")
+
+
+def check_positive_int(name: str, value: Any, optional: bool = True) -> None:
+    """
+    Validates an argument that must be an int larger than 0, see `check_number`.
+    """
+    check_number(name, value, "an int larger than 0", lambda v: v >= 1, int, optional)
+
+
+def check_option(name: str, value: Any, option_type: type) -> None:
+    """
+    Validates an optional argument that must be an option object, e.g. Execution.
+
+    Raises:
+        TypeError: If the value is neither None, nor of the option's type.
+    """
+    if value is not None and not isinstance(value, option_type):
+        raise TypeError(f"{name} must be a {option_type.__name__}, got {type(value)}.")
+
+
+class Execution:
+    """
+    How the objective of an optimization is evaluated.
+    """
+
+    def __init__(
+        self,
+        executor: str = "serial",
+        n_workers: int | None = None,
+        parallel_runs: bool = False,
+        array: bool = False,
+        vectorized: bool = False,
+    ) -> None:
+        """
+        Creates the options that control how, and where, the trials of an optimization are
+        evaluated.
+
+        Args:
+            executor: How the objective is evaluated. "serial" calls the objective in this
+                process, "process" evaluates each generation on a pool of worker processes,
+                which requires a picklable objective. Default is "serial".
+            n_workers: The number of worker processes for the "process" executor, or for
+                parallel runs. Defaults to None (the number of CPUs).
+            parallel_runs: Indicates if the runs are executed concurrently on a pool of worker
+                processes, which requires a picklable objective. The results are identical to
+                those of sequential runs. Default is False.
+            array: Indicates if action vectors are passed to the algorithm's callback as
+                read-only NumPy int32 arrays instead of lists, which requires NumPy. Parameters
+                then decode to NumPy values, e.g. an IntParam with size > 1 decodes to an array
+                that a Numba objective can use without conversion. Default is False.
+            vectorized: Indicates if the objective evaluates all trials of a generation in a single
+                call, which requires NumPy. Each parameter is then passed as a NumPy array with one
+                value (or row of values) per trial, and a seeded objective receives one seed per
+                trial. The objective must return a 1-D array with one value per trial.
+                Default is False.
+
+        Raises:
+            TypeError: If n_workers is not None and not an int, or a flag is not a bool.
+            ValueError: If executor is not one of EXECUTORS, n_workers is smaller than 1, or
+                parallel_runs or vectorized is combined with the "process" executor.
+
+        Example:
+        >>> execution = Execution("process", n_workers=4)
+        >>> execution.executor, execution.n_workers
+        ('process', 4)
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor}.")
+        check_positive_int("n_workers", n_workers)
+        check_bool("parallel_runs", parallel_runs)
+        if parallel_runs and executor != "serial":
+            raise ValueError("parallel_runs can only be combined with the 'serial' executor.")
+        check_bool("array", array)
+        check_bool("vectorized", vectorized)
+        if vectorized and executor != "serial":
+            raise ValueError("vectorized can only be combined with the 'serial' executor.")
+
+        self.executor: str = executor
+        self.n_workers: int | None = n_workers
+        self.parallel_runs: bool = parallel_runs
+        self.array: bool = array
+        self.vectorized: bool = vectorized
+
+    def __repr__(self) -> str:
+        return (
+            f"Execution(executor={self.executor!r}, n_workers={self.n_workers}, "
+            f"parallel_runs={self.parallel_runs}, array={self.array}, "
+            f"vectorized={self.vectorized})"
+        )
+
+
+class Checkpoint:
+    """
+    The file to which snapshots of an optimization are saved, so that it can be resumed.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        every: int | None = None,
+        interval: float | None = CHECKPOINT_INTERVAL_DEFAULT,
+    ) -> None:
+        """
+        Creates the options of the snapshots of an optimization. Snapshots are saved between
+        generations, once `every` trials or `interval` seconds have passed since the last one, and
+        once all trials have been used.
+
+        Args:
+            path: The file to which the snapshots are saved.
+            every: The number of trials after which a snapshot is saved. Defaults to None
+                (no limit).
+            interval: The number of seconds after which a snapshot is saved. Defaults to
+                CHECKPOINT_INTERVAL_DEFAULT.
+
+        Raises:
+            TypeError: If path is not a str or PathLike, every is not None and not an int, or
+                interval is not None and not a number.
+            ValueError: If every is smaller than 1, or interval is not a positive number.
+
+        Example:
+        >>> checkpoint = Checkpoint("study.bin", every=1000)
+        >>> print(checkpoint)
+        Checkpoint(path='study.bin', every=1000, interval=60.0)
+        """
+        check_path("path", path, optional=False)
+        check_positive_int("every", every)
+        check_number("interval", interval, "a positive number", lambda v: 0 < v < math.inf)
+
+        self.path: str | os.PathLike = path
+        self.every: int | None = every
+        self.interval: float | None = interval
+
+    def __repr__(self) -> str:
+        return f"Checkpoint(path={self.path!r}, every={self.every}, interval={self.interval})"
+
+
+class StoppingRules:
+    """
+    The rules that stop an optimization run early, before all trials have been used.
+    """
+
+    def __init__(
+        self,
+        patience: int | None = None,
+        confidence: float | None = None,
+        deadline: float | None = None,
+        target: float | None = None,
+    ) -> None:
+        """
+        Creates the rules to stop a run early. The rules are checked between generations, once the
+        initial population has been evaluated, and the run stops once any of them applies.
+
+        Args:
+            patience: The number of generations after which a run stops early if its best
+                configuration has not changed. Defaults to None (no limit).
+            confidence: The width of the confidence intervals (value +- confidence standard
+                errors) of the best configuration and the runner-up, after which a run stops early
+                if they do not overlap. Only evaluated configurations are compared, so this rule
+                suits small decision spaces, or a combination with patience. Defaults to None
+                (no limit).
+            deadline: The number of seconds after which a run stops early. Defaults to None
+                (no limit).
+            target: The value of the objective after which a run stops early, once the value of
+                its best configuration reaches it. Defaults to None (no target).
+
+        Raises:
+            TypeError: If an argument is not None and not a number, or patience not an int.
+            ValueError: If patience is smaller than 1, confidence is not positive, deadline is
+                negative, or an argument is not finite (target may be infinite, but not NaN).
+
+        Example:
+        >>> rules = StoppingRules(patience=5, deadline=60)
+        >>> print(rules)
+        StoppingRules(patience=5, confidence=None, deadline=60, target=None)
+        """
+        check_positive_int("patience", patience)
+        check_number("confidence", confidence, "a positive number", lambda v: 0 < v < math.inf)
+        check_number("deadline", deadline, "a non-negative number", lambda v: 0 <= v < math.inf)
+        check_number("target", target, "a number", lambda v: not math.isnan(v))
+
+        self.patience: int | None = patience
+        self.confidence: float | None = confidence
+        self.deadline: float | None = deadline
+        self.target: float | None = target
+
+    def __repr__(self) -> str:
+        return (
+            f"StoppingRules(patience={self.patience}, confidence={self.confidence}, "
+            f"deadline={self.deadline}, target={self.target})"
+        )
+
+
+class Cache:
+    """
+    The cache that serves repeated trials of an optimization instead of calling the objective.
+    """
+
+    def __init__(
+        self,
+        deterministic: bool = False,
+        max_size: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Creates the options of a cache for the values of the objective. Once the cache is full,
+        the least recently used values are evicted.
+
+        Args:
+            deterministic: Indicates if the objective returns the same value for the same
+                parameters, no matter the seed. Repeated trials of a configuration are then served
+                from the cache, with the same results. Otherwise, the cache is only hit by the same
+                trial, e.g. with common random numbers. Default is False.
+            max_size: The maximum number of values kept in the cache. Defaults to None
+                (unbounded).
+            max_bytes: The maximum estimated memory of the cache in bytes. Defaults to None
+                (unbounded).
+
+        Raises:
+            TypeError: If deterministic is not a bool, or a bound is not None and not an int.
+            ValueError: If a bound is smaller than 1.
+
+        Example:
+        >>> cache = Cache(deterministic=True, max_size=10000)
+        >>> print(cache)
+        Cache(deterministic=True, max_size=10000, max_bytes=None)
+        """
+        check_bool("deterministic", deterministic)
+        check_positive_int("max_size", max_size)
+        check_positive_int("max_bytes", max_bytes)
+
+        self.deterministic: bool = deterministic
+        self.max_size: int | None = max_size
+        self.max_bytes: int | None = max_bytes
+
+    def __repr__(self) -> str:
+        return (
+            f"Cache(deterministic={self.deterministic}, max_size={self.max_size}, "
+            f"max_bytes={self.max_bytes})"
+        )
@@ -1,6 +1,7 @@
 from evobandits.params.base_param import BaseParam
 from evobandits.params.categorical_param import CategoricalParam
+from evobandits.params.decoder import ParamDecoder
 from evobandits.params.float_param import FloatParam
 from evobandits.params.int_param import IntParam
 
-__all__ = ["BaseParam", "CategoricalParam", "IntParam", "FloatParam"]
+__all__ = ["BaseParam", "CategoricalParam", "IntParam", "FloatParam", "ParamDecoder"]
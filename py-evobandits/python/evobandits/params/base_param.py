@@ -14,6 +14,7 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from typing import Any
 
 
 class BaseParam(ABC):
@@ -79,3 +80,54 @@ class BaseParam(ABC):
             Returns the value directly in case of `self.size` equals 1, a list of values else.
         """
         raise NotImplementedError("Subclasses must implement the 'map_to_value' method.")
+
+    def decode_columns(self, actions: Any) -> Any:
+        """
+        Decodes the actions of many action vectors at once, e.g. for a vectorized objective.
+
+        Subclasses can override this method to decode whole columns with NumPy. By default,
+        the actions are decoded row by row with `decode`.
+
+        Args:
+            actions: A 2-D NumPy int32 array with one row of actions per action vector. The number
+            of columns matches the `size`.
+
+        Returns:
+            The decoded values, one per row. NumPy arrays are returned by subclasses that decode
+            columns with NumPy, with a second axis in case `self.size` is larger than 1.
+        """
+        return [self.decode(row.tolist()) for row in actions]
+
+    def decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from a whole action vector.
+
+        Subclasses can override this method to precompute everything that does not depend on
+        the actions, so that decoding a trial only indexes the action vector. The compiled
+        function must return the same values as `decode`.
+
+        Args:
+            start: The index of the parameter's first action in the action vector.
+
+        Returns:
+            A function that decodes the parameter from an action vector.
+        """
+        stop = start + self.size
+        return lambda action_vector: self.decode(action_vector[start:stop])
+
+    def columns_decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from many action vectors at once.
+
+        Subclasses can override this method like `decoder`. The compiled function must return
+        the same values as `decode_columns`.
+
+        Args:
+            start: The index of the parameter's first action in the action vectors.
+
+        Returns:
+            A function that decodes the parameter from a 2-D NumPy int32 array with one action
+            vector per row.
+        """
+        stop = start + self.size
+        return lambda action_vectors: self.decode_columns(action_vectors[:, start:stop])
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from collections.abc import Callable
+from typing import Any
 
 from evobandits.params.base_param import BaseParam
 
@@ -83,3 +84,59 @@ class CategoricalParam(BaseParam):
         if len(values) == 1:
             return values[0]
         return values
+
+    def decode_columns(self, actions: Any) -> Any:
+        """
+        Decodes the actions of many action vectors at once to the values of the parameter.
+
+        Args:
+            actions: A 2-D NumPy int32 array with one row of actions per action vector.
+
+        Returns:
+            The resulting choices as NumPy array. Choices of the same type are stored with a
+            matching dtype (e.g. int, float, or str), mixed types and callables as objects.
+        """
+        return self._choices_array()[actions[:, 0]]
+
+    def _choices_array(self) -> Any:
+        """
+        Returns the choices as NumPy array, to look up the choices of many actions at once.
+
+        Returns:
+            The choices with a matching dtype if they share a type (e.g. int, float, or str),
+            as objects if their types are mixed or they are callables.
+        """
+        import numpy as np
+
+        if len({type(c) for c in self.choices}) == 1 and not callable(self.choices[0]):
+            return np.asarray(self.choices)
+        choices = np.empty(len(self.choices), dtype=object)
+        choices[:] = self.choices
+        return choices
+
+    def decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from a whole action vector.
+
+        Args:
+            start: The index of the parameter's action in the action vector.
+
+        Returns:
+            A function that returns the same values as `decode`.
+        """
+        choices = tuple(self.choices)
+        return lambda action_vector: choices[action_vector[start]]
+
+    def columns_decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from many action vectors at once, with a
+        lookup table of the choices that is built only once.
+
+        Args:
+            start: The index of the parameter's action in the action vectors.
+
+        Returns:
+            A function that returns the same values as `decode_columns`.
+        """
+        choices = self._choices_array()
+        return lambda action_vectors: choices[action_vectors[:, start]]
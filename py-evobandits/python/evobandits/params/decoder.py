@@ -0,0 +1,77 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from evobandits.params.base_param import BaseParam
+
+
+class ParamDecoder:
+    """
+    Decodes action vectors into parameter values, compiled once from a parameter configuration.
+
+    The offsets of the parameters in the action vector, and everything else that does not depend
+    on the actions (e.g. the scale of a FloatParam, or the choices of a CategoricalParam), are
+    computed when the decoder is created. The decoded values are identical to decoding each
+    parameter with `BaseParam.decode` or `BaseParam.decode_columns`.
+    """
+
+    def __init__(self, params: Mapping[str, BaseParam]) -> None:
+        """
+        Compiles the decoder for a parameter configuration.
+
+        Args:
+            params: A mapping of parameter names to their configuration.
+        """
+        self.params: Mapping[str, BaseParam] = params
+
+        self._decoders: list[tuple[str, Callable[[Any], Any]]] = []
+        self._columns_decoders: list[tuple[str, Callable[[Any], Any]]] = []
+        start = 0
+        for key, param in params.items():
+            self._decoders.append((key, param.decoder(start)))
+            self._columns_decoders.append((key, param.columns_decoder(start)))
+            start += param.size
+        self.size: int = start
+
+    def __reduce__(self) -> tuple[type, tuple[Mapping[str, BaseParam]]]:
+        # The compiled functions cannot be pickled, e.g. to evaluate in worker processes, so the
+        # decoder is compiled again from its parameters.
+        return (ParamDecoder, (self.params,))
+
+    def decode(self, action_vector: Any) -> dict[str, Any]:
+        """
+        Decodes an action vector into a dictionary mapping parameter names to their values.
+
+        Args:
+            action_vector: The encoded representation of parameter values, a list or NumPy array.
+
+        Returns:
+            A dictionary of parameter names and their decoded values.
+        """
+        return {key: decoder(action_vector) for key, decoder in self._decoders}
+
+    def decode_columns(self, action_vectors: Any) -> dict[str, Any]:
+        """
+        Decodes many action vectors at once, column by column, into a dictionary mapping
+        parameter names to their values.
+
+        Args:
+            action_vectors: A 2-D NumPy int32 array with one action vector per row.
+
+        Returns:
+            A dictionary of parameter names and their decoded values, one per action vector.
+        """
+        return {key: decoder(action_vectors) for key, decoder in self._columns_decoders}
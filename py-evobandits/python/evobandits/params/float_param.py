@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import math
+from collections.abc import Callable
+from typing import Any
 
 from evobandits.params.base_param import BaseParam
 
@@ -113,3 +115,72 @@ class FloatParam(BaseParam):
         if len(values) == 1:
             return values[0]
         return values
+
+    def decode_columns(self, actions: Any) -> Any:
+        """
+        Decodes the actions of many action vectors at once to the values of the parameter.
+
+        Args:
+            actions: A 2-D NumPy int32 array with one row of actions per action vector.
+
+        Returns:
+            The resulting float values as NumPy array, of shape (n_rows,) for size 1.
+        """
+        import numpy as np
+
+        # Apply scaling, and optional log-transformation
+        values = self._low_trans + self._step_size * actions.astype(np.float64)
+        if self.log:
+            values = np.exp(values)
+
+        if self.size == 1:
+            return values[:, 0]
+        return values
+
+    def decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from a whole action vector, with the
+        offset and scale of the transformation computed only once.
+
+        Args:
+            start: The index of the parameter's first action in the action vector.
+
+        Returns:
+            A function that returns the same values as `decode`.
+        """
+        low_trans, step_size, exp = self._low_trans, self._step_size, math.exp
+        stop = start + self.size
+
+        if self.size == 1:
+            if self.log:
+                return lambda action_vector: exp(low_trans + step_size * action_vector[start])
+            return lambda action_vector: low_trans + step_size * action_vector[start]
+        if self.log:
+            return lambda action_vector: [
+                exp(low_trans + step_size * x) for x in action_vector[start:stop]
+            ]
+        return lambda action_vector: [low_trans + step_size * x for x in action_vector[start:stop]]
+
+    def columns_decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from many action vectors at once, with the
+        offset and scale of the transformation computed only once.
+
+        Args:
+            start: The index of the parameter's first action in the action vectors.
+
+        Returns:
+            A function that returns the same values as `decode_columns`.
+        """
+        import numpy as np
+
+        low_trans, step_size, log = self._low_trans, self._step_size, self.log
+        stop = start + self.size
+
+        def decode_columns(action_vectors: Any) -> Any:
+            values = low_trans + step_size * action_vectors[:, start:stop].astype(np.float64)
+            if log:
+                values = np.exp(values)
+            return values[:, 0] if stop - start == 1 else values
+
+        return decode_columns
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 
+from collections.abc import Callable
+from typing import Any
+
 from evobandits.params.base_param import BaseParam
 
 
@@ -82,3 +85,47 @@ class IntParam(BaseParam):
         if len(actions) == 1:
             return actions[0]
         return actions
+
+    def decode_columns(self, actions: Any) -> Any:
+        """
+        Decode the actions of many action vectors at once to the values of the parameter.
+
+        Args:
+            actions: A 2-D NumPy int32 array with one row of actions per action vector.
+
+        Returns:
+            The resulting integer values as NumPy array, of shape (n_rows,) for size 1.
+        """
+        if self.size == 1:
+            return actions[:, 0]
+        return actions
+
+    def decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from a whole action vector.
+
+        Args:
+            start: The index of the parameter's first action in the action vector.
+
+        Returns:
+            A function that returns the same values as `decode`.
+        """
+        if self.size == 1:
+            return lambda action_vector: action_vector[start]
+        stop = start + self.size
+        return lambda action_vector: action_vector[start:stop]
+
+    def columns_decoder(self, start: int) -> Callable[[Any], Any]:
+        """
+        Compiles a function that decodes the parameter from many action vectors at once.
+
+        Args:
+            start: The index of the parameter's first action in the action vectors.
+
+        Returns:
+            A function that returns the same values as `decode_columns`.
+        """
+        if self.size == 1:
+            return lambda action_vectors: action_vectors[:, start]
+        stop = start + self.size
+        return lambda action_vectors: action_vectors[:, start:stop]
@@ -0,0 +1,88 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+from typing import Any
+
+PULL_LOG_MAGIC = b"EVOBPULL"
+PULL_LOG_VERSION = 1
+
+# The files of the columns, and the little-endian type of their values
+COLUMNS = {
+    "trial": ("trial.u64", "<u8"),
+    "island": ("island.u32", "<u4"),
+    "arm": ("arm.i32", "<i4"),
+    "action_vector": ("action_vector.i32", "<i4"),
+    "reward": ("reward.f64", "<f8"),
+    "seed": ("seed.u64", "<u8"),
+}
+
+
+def read_pull_log(path: str | os.PathLike) -> dict[str, Any]:
+    """
+    Read the pulls that an optimization recorded with `pull_log`, which requires NumPy.
+
+    The columns are memory-mapped read-only, so they are not copied into memory, no matter how
+    many pulls have been recorded. Only the pulls that the log has committed are read: pulls that
+    are only partly written, e.g. while an optimization still records to the log, or by a flush
+    that has been interrupted, are left out.
+
+    Args:
+        path: The directory of the pull log.
+
+    Returns:
+        A dictionary with one NumPy array per column, with one value per pull in the order of the
+        pulls: "trial" (the number of pulls recorded before it), "island" (the island that made
+        the pull, 0 without islands), "arm" (the index of the pulled arm within its island),
+        "action_vector" (a row of actions per pull), "reward" (the value of the objective,
+        negated if it was maximized) and "seed" (the seed of the pull).
+
+    Raises:
+        ValueError: If the directory is not a pull log of a supported version.
+    """
+    import numpy as np
+
+    with open(os.path.join(path, "meta"), "rb") as file:
+        meta = file.read()
+    header = len(PULL_LOG_MAGIC)
+    if len(meta) != header + 20 or meta[:header] != PULL_LOG_MAGIC:
+        raise ValueError(f"{path} is not an EvoBandits pull log.")
+    version, dimension, committed = struct.unpack("<IQQ", meta[header:])
+    if version != PULL_LOG_VERSION:
+        raise ValueError(
+            f"The pull log {path} has version {version}, expected version {PULL_LOG_VERSION}."
+        )
+
+    widths = {name: dimension if name == "action_vector" else 1 for name in COLUMNS}
+    files = {name: os.path.join(path, file_name) for name, (file_name, _) in COLUMNS.items()}
+    n_pulls = min(
+        committed,
+        *(
+            os.path.getsize(files[name]) // (np.dtype(dtype).itemsize * widths[name])
+            for name, (_, dtype) in COLUMNS.items()
+        ),
+    )
+
+    columns = {}
+    for name, (_, dtype) in COLUMNS.items():
+        shape = (n_pulls, dimension) if name == "action_vector" else (n_pulls,)
+        if n_pulls == 0:
+            # Empty files can't be memory-mapped
+            column = np.empty(shape, dtype=dtype)
+            column.flags.writeable = False
+        else:
+            column = np.memmap(files[name], dtype=dtype, mode="r", shape=shape)
+        columns[name] = column
+    return columns
@@ -16,6 +16,7 @@ import numpy as np
 from sklearn.model_selection._search import BaseSearchCV
 
 from evobandits.evobandits import GMAB
+from evobandits.options import Cache
 
 
 # https://github.com/scikit-learn/scikit-learn/blob/main/sklearn/model_selection/_search.py#L433
@@ -34,6 +35,7 @@ class EvoBanditsSearchCV(BaseSearchCV):
         error_score=np.nan,
         return_train_score=True,
         n_trials=50,
+        deterministic=False,
     ):
         """
         param_distributions: dict
@@ -41,9 +43,14 @@ class EvoBanditsSearchCV(BaseSearchCV):
             all of which must be integer bounds.
         n_trials: int
             How many trials (simulation budget) EvoBandits should run internally.
+        deterministic: bool
+            Whether the cross-validation score of a candidate is always the same, e.g. with a
+            fixed `cv` and a deterministic estimator. Candidates are then only cross-validated
+            once, and repeated trials are served from a cache.
         """
         self.param_distributions = param_distributions
         self.n_trials = n_trials
+        self.deterministic = deterministic
 
         super().__init__(
             estimator=estimator,
@@ -96,7 +103,13 @@ class EvoBanditsSearchCV(BaseSearchCV):
 
         # 3) Create the EvoBandits optimizer and search for the best param configuration
         evobandits_opt = GMAB()
-        best_arms = evobandits_opt.optimize(evobandits_objective, bounds, self.n_trials, n_best=1)
+        best_arms = evobandits_opt.optimize(
+            evobandits_objective,
+            bounds,
+            self.n_trials,
+            n_best=1,
+            cache=Cache(deterministic=True) if self.deterministic else None,
+        )
         best_action_vector = best_arms[0].to_dict.get("action_vector")
 
         # 4) Evaluate the best param set again (so scikit-learn knows about it)
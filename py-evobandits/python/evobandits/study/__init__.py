@@ -1,3 +1,3 @@
-from evobandits.study.study import ALGORITHM_DEFAULT, Study
+from evobandits.study.study import ALGORITHM_DEFAULT, Progress, Study
 
-__all__ = ["Study", "ALGORITHM_DEFAULT"]
+__all__ = ["Study", "Progress", "ALGORITHM_DEFAULT"]
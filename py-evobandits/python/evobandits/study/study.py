@@ -12,26 +12,100 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import math
-from collections.abc import Callable, Mapping
-from inspect import signature
+import os
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from inspect import iscoroutinefunction, signature
 from random import Random
 from statistics import mean
+from time import perf_counter_ns
 from typing import Any, TypeAlias
 
 from evobandits import logging
-from evobandits.evobandits import GMAB
-from evobandits.params import BaseParam
+from evobandits.evobandits import GMAB, Arm
+from evobandits.options import (
+    Cache,
+    Checkpoint,
+    Execution,
+    StoppingRules,
+    check_bool,
+    check_number,
+    check_option,
+    check_path,
+    check_positive_int,
+)
+from evobandits.params import BaseParam, ParamDecoder
 
 _logger = logging.get_logger(__name__)
 
 
 ParamsType: TypeAlias = Mapping[str, BaseParam]
+PriorArmType: TypeAlias = tuple[Sequence[int], float, float, int]
 
 
 ALGORITHM_DEFAULT = GMAB()
 
 
+def _call_objective(objective: Callable, solution: dict[str, Any]) -> float:
+    """Calls the objective with a decoded solution. Defined on module level to be picklable."""
+    return objective(**solution)
+
+
+class Progress:
+    """
+    The state of an optimization after a generation, as `Study.iter_optimize` yields it.
+
+    The parameters of the best configuration are only decoded when `params` is accessed.
+    """
+
+    __slots__ = (
+        "used_trials",
+        "n_arms",
+        "value",
+        "value_std_dev",
+        "n_evaluations",
+        "action_vector",
+        "_decoder",
+        "_params",
+    )
+
+    def __init__(self, used_trials: int, best_arm: Arm, n_arms: int, decoder: ParamDecoder):
+        """
+        Initializes a Progress record.
+
+        Args:
+            used_trials: The number of trials used so far.
+            best_arm: The best arm so far, as the algorithm reports it.
+            n_arms: The number of configurations evaluated so far.
+            decoder: The decoder of the Study's parameters.
+        """
+        self.used_trials: int = used_trials
+        self.n_arms: int = n_arms
+        self.value: float = best_arm.value
+        self.value_std_dev: float = best_arm.value_std_dev
+        self.n_evaluations: int = best_arm.n_evaluations
+        self.action_vector: list[int] = best_arm.action_vector
+        self._decoder = decoder
+        self._params: dict[str, Any] | None = None
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """The decoded parameters of the best configuration so far."""
+        if self._params is None:
+            self._params = self._decoder.decode(self.action_vector)
+        return self._params
+
+    def __repr__(self) -> str:
+        return (
+            f"Progress(used_trials={self.used_trials}, value={self.value}, "
+            f"n_evaluations={self.n_evaluations}, n_arms={self.n_arms})"
+        )
+
+
 class Study:
     """
     A Study represents an optimization task.
@@ -59,8 +133,17 @@ class Study:
         # 1 for minimization, -1 for maximization to avoid repeated branching during optimization.
         self._direction: int = 1
         self._params: ParamsType
+        self._decoder: ParamDecoder | None = None
         self._objective: Callable
         self._results: list[dict[str, Any]]
+        # The raw results and direction, and the ranked results and mean value computed from them
+        self._ranking: tuple[list[dict[str, Any]], int, list[dict[str, Any]], float] | None = None
+        self._early_stops: list[dict[str, Any]] = []
+        self._cache_info: dict[str, int] | None = None
+        self._profile: dict[str, int] | None = None
+        # The time spent decoding and in the objective during a profiled run
+        self._run_profile: dict[str, int] | None = None
+        self._executor: Executor | None = None
         self._seeded_call = None
         self._rng = None
 
@@ -116,6 +199,16 @@ class Study:
             bounds.extend(param.bounds)
         return bounds
 
+    @property
+    def _param_decoder(self) -> ParamDecoder:
+        """
+        The decoder compiled from the parameter configuration saved to `self._params`. It is
+        compiled once per configuration, instead of again for each trial.
+        """
+        if self._decoder is None or self._decoder.params is not self._params:
+            self._decoder = ParamDecoder(self._params)
+        return self._decoder
+
     def _decode(self, action_vector: list[int]) -> dict[str, Any]:
         """
         Decodes an action vector into a dictionary mapping parameter names to their decoded values.
@@ -126,66 +219,183 @@ class Study:
         Returns:
             A dictionary of parameter names and their decoded values.
         """
-        result = {}
-        idx = 0
-        for key, param in self._params.items():
-            result[key] = param.decode(action_vector[idx : idx + param.size])
-            idx += param.size
-        return result
+        return self._param_decoder.decode(action_vector)
+
+    def _decode_columns(self, action_vectors: Any) -> dict[str, Any]:
+        """
+        Decodes many action vectors at once, column by column, into a dictionary mapping
+        parameter names to their decoded values.
+
+        Args:
+            action_vectors: A 2-D NumPy int32 array with one action vector per row.
 
-    def _generate_seed(self) -> int:
-        """Returns a random seed for objective evaluations."""
-        return self.rng.randint(0, 2**32 - 1)
+        Returns:
+            A dictionary of parameter names and their decoded values, one per action vector.
+        """
+        return self._param_decoder.decode_columns(action_vectors)
+
+    def _generate_seed(self, rng: Random | None = None) -> int:
+        """
+        Returns a random seed for objective evaluations.
+
+        Args:
+            rng: The generator of the run to draw the seed from. Defaults to None (the Study's
+                generator).
+        """
+        return (rng or self.rng).randint(0, 2**32 - 1)
+
+    def _trial_seed(self, pull_seed: int | None = None, rng: Random | None = None) -> int:
+        """
+        Returns the seed for a trial, drawn from the run's generator, or derived from the seed
+        of the pull that the algorithm passes on with common random numbers.
+
+        Args:
+            pull_seed: The 64-bit seed of the pull, or None.
+            rng: The generator of the run, see `_generate_seed`.
+
+        Returns:
+            A seed in the same range as those of `_generate_seed`.
+        """
+        if pull_seed is None:
+            return self._generate_seed(rng)
+        return pull_seed >> 32
 
-    def _evaluate(self, action_vector: list[int]) -> float:
+    def _evaluate(
+        self, action_vector: list[int], pull_seed: int | None = None, rng: Random | None = None
+    ) -> float:
         """
         Execute a trial with the given action vector.
 
         Args:
             action_vector: The encoded representation of parameter values.
+            pull_seed: The seed of the pull with common random numbers. Defaults to None.
+            rng: The generator of the run, see `_generate_seed`.
 
         Returns:
             The value from a single evaluation of the objective function.
         """
+        profiled = self._run_profile is not None
+        started = perf_counter_ns() if profiled else 0
         solution = self._decode(action_vector)
 
         if self.seeded_call:
-            solution.update({"seed": self._generate_seed()})
+            solution.update({"seed": self._trial_seed(pull_seed, rng)})
 
+        decoded = perf_counter_ns() if profiled else 0
         evaluation = self._direction * self._objective(**solution)
+        if profiled:
+            self._record_profile(started, decoded)
         return evaluation
 
-    def optimize(
+    def _evaluate_batch(
+        self,
+        action_vectors: list[list[int]],
+        pull_seeds: list[int] | None = None,
+        rng: Random | None = None,
+    ) -> list[float]:
+        """
+        Execute the trials of a generation with the Study's executor.
+
+        The action vectors are decoded, and seeds are drawn, in the same order as with
+        `_evaluate`, so that a seeded Study yields the same results with any executor.
+
+        Args:
+            action_vectors: The encoded representations of parameter values.
+            pull_seeds: The seeds of the pulls with common random numbers. Defaults to None.
+            rng: The generator of the run, see `_generate_seed`.
+
+        Returns:
+            The values from a single evaluation of the objective function per action vector.
+        """
+        profiled = self._run_profile is not None
+        started = perf_counter_ns() if profiled else 0
+        solutions = [self._decode(action_vector) for action_vector in action_vectors]
+
+        if self.seeded_call:
+            pull_seeds = pull_seeds or [None] * len(solutions)
+            for solution, pull_seed in zip(solutions, pull_seeds, strict=True):
+                solution.update({"seed": self._trial_seed(pull_seed, rng)})
+
+        decoded = perf_counter_ns() if profiled else 0
+        evaluations = self._executor.map(partial(_call_objective, self._objective), solutions)
+        evaluations = [self._direction * evaluation for evaluation in evaluations]
+        if profiled:
+            self._record_profile(started, decoded)
+        return evaluations
+
+    def _evaluate_vectorized(
+        self, action_vectors: Any, pull_seeds: list[int] | None = None, rng: Random | None = None
+    ) -> Any:
+        """
+        Execute the trials of a generation with a single call of a vectorized objective.
+
+        The action vectors are decoded column by column, and seeds are drawn in the same order
+        as with `_evaluate`, and passed to the objective as a vector with one seed per trial.
+
+        Args:
+            action_vectors: A 2-D NumPy int32 array with one action vector per row.
+            pull_seeds: The seeds of the pulls with common random numbers. Defaults to None.
+            rng: The generator of the run, see `_generate_seed`.
+
+        Returns:
+            A 1-D NumPy array with the values from a single evaluation per action vector.
+        """
+        import numpy as np
+
+        profiled = self._run_profile is not None
+        started = perf_counter_ns() if profiled else 0
+        solutions = self._decode_columns(action_vectors)
+
+        if self.seeded_call:
+            pull_seeds = pull_seeds or [None] * len(action_vectors)
+            seeds = [self._trial_seed(pull_seed, rng) for pull_seed in pull_seeds]
+            solutions.update({"seed": np.array(seeds, dtype=np.int64)})
+
+        decoded = perf_counter_ns() if profiled else 0
+        evaluations = np.asarray(self._objective(**solutions), dtype=np.float64)
+        if profiled:
+            self._record_profile(started, decoded)
+        if evaluations.shape != (len(action_vectors),):
+            raise ValueError(
+                f"A vectorized objective must return one value per trial, got an array of shape "
+                f"{evaluations.shape} for {len(action_vectors)} trials."
+            )
+        return self._direction * evaluations
+
+    def _record_profile(self, started: int, decoded: int) -> None:
+        """
+        Adds the time of an evaluation to the profile of the run.
+
+        Args:
+            started: The time (from `perf_counter_ns`) before the trials were decoded.
+            decoded: The time after the trials were decoded and seeded, and before the objective
+                was called.
+        """
+        self._run_profile["decode_ns"] += decoded - started
+        self._run_profile["objective_ns"] += perf_counter_ns() - decoded
+
+    def _set_up(
         self,
         objective: Callable,
         params: ParamsType,
-        n_trials: int,
-        maximize: bool = False,
-        n_best: int = 1,
-        n_runs: int = 1,
+        maximize: bool,
+        n_runs: int,
+        common_random_numbers: bool = False,
     ) -> None:
         """
-        Optimize the objective function, saving results to `study.results`.
-
-        The optimization process involves selecting suitable hyperparameter values within
-        specified bounds and running the objective function for a given number of trials.
+        Validates the arguments that all optimization methods share, and sets up the Study.
 
         Args:
             objective: The objective function to optimize.
             params: A dictionary of parameters with their bounds.
-            n_trials: The number of evaluations to perform on the objective.
-            maximize: Indicates if objective is maximized. Default is False.
-            n_best: The number of results to return per run. Default is 1.
-            n_runs: The number of times optimization is repeated. Default is 1.
+            maximize: Indicates if objective is maximized.
+            n_runs: The number of times optimization is repeated.
+            common_random_numbers: Indicates if common random numbers are used.
         """
-        if not isinstance(maximize, bool):
-            raise TypeError(f"maximize must be a bool, got {type(maximize)}.")
+        check_bool("maximize", maximize)
         self._direction = -1 if maximize else 1
 
-        if not isinstance(n_runs, int):
-            raise TypeError(f"n_runs must be an int larger than 0, got {type(n_runs)}.")
-        if n_runs < 1:
-            raise ValueError(f"n_runs must be an int larger than 0, got {n_runs}.")
+        check_positive_int("n_runs", n_runs, optional=False)
 
         if not isinstance(params, Mapping):
             raise TypeError(f"params must be a mapping, got {type(params)}.")
@@ -201,25 +411,697 @@ class Study:
                 "the Study. Please consider renaming this parameter to avoid ambiguity."
             )
         self._params = params
+        self._decoder = ParamDecoder(params)
 
         # input validation for objective, n_trials, n_best is managed by 'self.algorithm'
         self._objective = objective
+
+        check_bool("common_random_numbers", common_random_numbers)
+        if common_random_numbers and not self.seeded_call:
+            raise ValueError(
+                "common_random_numbers requires a seeded Study and an objective with a 'seed' "
+                "argument."
+            )
+
+    @contextmanager
+    def _start_executor(self, executor: str, n_workers: int | None) -> Iterator[None]:
+        """
+        Starts the executor used to evaluate the objective, and shuts it down on exit.
+
+        Args:
+            executor: The name of the executor, see `Execution`.
+            n_workers: The number of worker processes. Defaults to the number of CPUs.
+        """
+        if executor == "serial":
+            yield
+            return
+
+        with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count()) as pool:
+            self._executor = pool
+            try:
+                yield
+            finally:
+                self._executor = None
+
+    def optimize(
+        self,
+        objective: Callable,
+        params: ParamsType,
+        n_trials: int,
+        maximize: bool = False,
+        n_best: int = 1,
+        n_runs: int = 1,
+        execution: Execution | None = None,
+        checkpoint: Checkpoint | str | os.PathLike | None = None,
+        warm_start: str | os.PathLike | Sequence[PriorArmType] | None = None,
+        warm_start_weight: float = 1.0,
+        common_random_numbers: bool = False,
+        stopping: StoppingRules | None = None,
+        cache: Cache | None = None,
+        profile: bool = False,
+        pull_log: str | os.PathLike | None = None,
+    ) -> None:
+        """
+        Optimize the objective function, saving results to `study.results`.
+
+        The optimization process involves selecting suitable hyperparameter values within
+        specified bounds and running the objective function for a given number of trials.
+
+        Args:
+            objective: The objective function to optimize.
+            params: A dictionary of parameters with their bounds.
+            n_trials: The number of evaluations to perform on the objective.
+            maximize: Indicates if objective is maximized. Default is False.
+            n_best: The number of results to return per run. Default is 1.
+            n_runs: The number of times optimization is repeated. Default is 1.
+            execution: How the objective is evaluated, e.g. Execution("process", n_workers=4) to
+                evaluate each generation on a pool of worker processes,
+                Execution(parallel_runs=True) to execute the runs concurrently,
+                Execution(array=True) to pass action vectors as NumPy arrays, or
+                Execution(vectorized=True) to evaluate all trials of a generation in a single
+                call. Defaults to None (Execution(), which calls the objective in this process
+                with lists).
+            checkpoint: The file to which snapshots of the algorithm are saved while it
+                optimizes, so that an interrupted optimization can be resumed, e.g.
+                Checkpoint("study.bin", every=1000), or a path to save snapshots with the default
+                Checkpoint options. If the file exists, the optimization is resumed from it, with
+                the same results as if it had not been interrupted, given the same seed and
+                arguments. Requires n_runs=1. Defaults to None (no snapshots).
+            warm_start: The arms of an earlier optimization of the same parameters to start from,
+                either the checkpoint file of that optimization, or a sequence of
+                (action_vector, value, value_std_dev, n_evaluations) tuples. The best of them
+                seed the initial population, and their statistics are kept, so fewer trials are
+                needed to reach the same quality. Defaults to None (no warm start).
+            warm_start_weight: The weight of the evaluations of the prior arms against new ones,
+                larger than 0.0 and at most 1.0. The number of evaluations of each prior arm is
+                scaled by it, e.g. to discount results on older data. Default is 1.0.
+            common_random_numbers: Indicates if the k-th trial of every parameter configuration
+                gets the same seed, instead of a new seed for each trial, which requires a seeded
+                Study and an objective that accepts a `seed`. Configurations are then compared
+                under the same random conditions, so fewer trials are needed to tell close
+                competitors apart. Default is False.
+            stopping: The rules that stop a run early, e.g. StoppingRules(patience=5). The target
+                value is given in the sign of the objective. Defaults to None (no rules).
+            cache: The cache that serves repeated trials instead of calling the objective, e.g.
+                Cache(deterministic=True) for an objective that does not depend on the seed.
+                Defaults to None (no cache).
+            profile: Indicates if the runs are profiled, to report how their time splits between
+                the objective, decoding the parameters, and the algorithm at `study.profile`.
+                Default is False.
+            pull_log: A directory to which every trial is recorded, with its action vector,
+                value and seed, to audit or replay the optimization with `read_pull_log`. A log
+                that exists in the directory is replaced. Requires n_runs=1. Defaults to None
+                (no log).
+
+        The stopping rules are checked between generations, once the initial population has been
+        evaluated. `study.early_stops` reports which rule stopped each run, and how many trials
+        it saved. `study.cache_info` reports the hits and misses of the cache.
+        """
+        check_option("execution", execution, Execution)
+        if execution is None:
+            execution = Execution()
+        if isinstance(checkpoint, (str, os.PathLike)):
+            checkpoint = Checkpoint(checkpoint)
+        check_option("checkpoint", checkpoint, Checkpoint)
+        check_option("stopping", stopping, StoppingRules)
+        check_option("cache", cache, Cache)
+        check_bool("profile", profile)
+        check_path("pull_log", pull_log)
+        check_number(
+            "warm_start_weight",
+            warm_start_weight,
+            "a number in (0, 1]",
+            lambda v: 0 < v <= 1,
+            optional=False,
+        )
+
+        self._set_up(objective, params, maximize, n_runs, common_random_numbers)
+        if checkpoint is not None and n_runs > 1:
+            raise ValueError("checkpoint can only be used with a single run (n_runs=1).")
+        if pull_log is not None and n_runs > 1:
+            raise ValueError("pull_log can only be used with a single run (n_runs=1).")
         bounds = self._collect_bounds()
-        results = []
+        prior = None
+        if warm_start is not None:
+            prior = (self._collect_prior_arms(warm_start, bounds), float(warm_start_weight))
+        batch = execution.executor != "serial" or execution.vectorized
+        array = execution.array or execution.vectorized
+        # The algorithm minimizes, so the target is converted like the objective's values
+        if stopping is not None and stopping.target is not None:
+            stopping = StoppingRules(
+                stopping.patience,
+                stopping.confidence,
+                stopping.deadline,
+                self._direction * stopping.target,
+            )
+        run_options = {
+            "checkpoint": checkpoint,
+            "stopping": stopping,
+            "cache": cache,
+            "profile": profile,
+            "pull_log": pull_log,
+        }
 
-        for _ in range(n_runs):
-            seed = self._generate_seed()  # new entropy for each seeded run
-            algorithm = self.algorithm.clone()
-            best_arms = algorithm.optimize(self._evaluate, bounds, n_trials, n_best, seed)
+        # Draw the seeds for all runs upfront, so that runs can be executed in any order
+        seeds = [self._generate_seed() for _ in range(n_runs)]
 
-            for arm in best_arms:
-                result = arm.to_dict
-                action_vector = result.pop("action_vector")
-                result["params"] = self._decode(action_vector)
-                results.append(result)
+        if execution.parallel_runs:
+            # Only what a run needs is sent to the worker processes, not the whole Study
+            run = partial(
+                self._run_copy()._optimize_run,
+                bounds=bounds,
+                n_trials=n_trials,
+                n_best=n_best,
+                batch=batch,
+                array=array,
+                vectorized=execution.vectorized,
+                prior=prior,
+                common_random_numbers=common_random_numbers,
+                run_options=run_options,
+            )
+            with ProcessPoolExecutor(max_workers=execution.n_workers or os.cpu_count()) as pool:
+                run_results = list(pool.map(run, seeds))
+        else:
+            with self._start_executor(execution.executor, execution.n_workers):
+                run_results = [
+                    self._optimize_run(
+                        seed,
+                        bounds,
+                        n_trials,
+                        n_best,
+                        batch,
+                        array,
+                        execution.vectorized,
+                        prior,
+                        common_random_numbers,
+                        run_options,
+                    )
+                    for seed in seeds
+                ]
 
         # Save results and apply UCB ranking
-        self.results = results
+        self.results = [result for results, *_ in run_results for result in results]
+        self._early_stops = [early_stop for _, early_stop, *_ in run_results]
+        self._cache_info = self._sum_counters([cache_info for _, _, cache_info, _ in run_results])
+        self._profile = self._sum_counters([profile for *_, profile in run_results])
+        for run, early_stop in enumerate(self._early_stops):
+            if early_stop["reason"] is not None:
+                _logger.info(
+                    f"Run {run} stopped early by the '{early_stop['reason']}' rule after "
+                    f"{early_stop['used_trials']} trials, saving {early_stop['saved_trials']}."
+                )
+
+    @staticmethod
+    def _sum_counters(counters: list[dict[str, int] | None]) -> dict[str, int] | None:
+        """
+        Sums the counters of the runs, e.g. of their caches.
+
+        Args:
+            counters: The counters of each run, or None for runs without them.
+
+        Returns:
+            The sum of each counter over all runs, or None if no run has counters.
+        """
+        counters = [run_counters for run_counters in counters if run_counters is not None]
+        if not counters:
+            return None
+        return {key: sum(run_counters[key] for run_counters in counters) for key in counters[0]}
+
+    def _run_copy(self) -> "Study":
+        """
+        Copies the state of the Study that `_optimize_run` needs, i.e. the seed, the algorithm,
+        and the objective with its parameters and direction. Parallel runs send this copy to the
+        worker processes, instead of the Study with its results and generator.
+
+        Returns:
+            A Study to execute runs with, without results.
+        """
+        study = Study.__new__(Study)
+        study.seed = self.seed
+        study.algorithm = self.algorithm
+        study._direction = self._direction
+        study._params = self._params
+        study._decoder = self._decoder
+        study._objective = self._objective
+        study._seeded_call = self._seeded_call
+        study._run_profile = None
+        study._executor = None
+        study._rng = None
+        return study
+
+    def _optimize_run(
+        self,
+        seed: int,
+        bounds: list[tuple[int, int]],
+        n_trials: int,
+        n_best: int,
+        batch: bool,
+        array: bool,
+        vectorized: bool,
+        prior: tuple[list[PriorArmType], float] | None = None,
+        common_random_numbers: bool = False,
+        run_options: dict[str, Any] | None = None,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, int] | None, dict[str, int] | None]:
+        """
+        Executes a single optimization run with a clone of the Study's algorithm.
+
+        The seeds for the objective are drawn from a generator that is seeded with the run's seed
+        and passed to the callback, so that each run yields the same results, no matter in which
+        process it is executed.
+        With a checkpoint, a run that has been interrupted is resumed from its checkpoint file.
+
+        Args:
+            seed: The seed of the run.
+            bounds: The bounds of the parameter configuration.
+            n_trials: The number of evaluations to perform on the objective.
+            n_best: The number of results to return.
+            batch: Indicates if the objective is evaluated per generation with the executor.
+            array: Indicates if action vectors are passed as NumPy arrays instead of lists.
+            vectorized: Indicates if the objective evaluates a generation in a single call.
+            prior: The prior arms and their weight to warm start the algorithm with, or None.
+            common_random_numbers: Indicates if the seeds of the trials are derived from the
+                seeds of the pulls that the algorithm passes on.
+            run_options: The checkpoint, stopping rules, cache, profile and pull log options for
+                the algorithm, or None.
+
+        Returns:
+            The results (as dictionaries) of the run, how it stopped (see `early_stops`), the
+            counters of its cache, or None, and its profile (see `profile`), or None.
+        """
+        if vectorized:
+            evaluate = self._evaluate_vectorized
+        elif batch:
+            evaluate = self._evaluate_batch
+        else:
+            evaluate = self._evaluate
+        rng = Random(seed)
+        evaluate = partial(evaluate, rng=rng)
+
+        options = dict(run_options or {})
+        if common_random_numbers:
+            options["seeded"] = True
+        self._run_profile = None
+        if options.get("profile"):
+            self._run_profile = {"decode_ns": 0, "objective_ns": 0}
+
+        checkpoint = options.get("checkpoint")
+        if checkpoint is not None and os.path.exists(checkpoint.path):
+            algorithm = GMAB.load(checkpoint.path)
+            if algorithm.bounds != bounds:
+                raise ValueError(
+                    f"The checkpoint {checkpoint.path} belongs to an optimization with "
+                    f"other parameters (bounds {algorithm.bounds}, expected {bounds})."
+                )
+            # Skip the seeds of the trials before the snapshot, one per trial
+            if self.seeded_call and not common_random_numbers:
+                for _ in range(algorithm.used_trials):
+                    self._generate_seed(rng)
+            best_arms = algorithm.resume(
+                evaluate, n_trials, n_best, batch=batch, array=array, **options
+            )
+            return (
+                self._to_results(best_arms),
+                self._to_early_stop(algorithm),
+                algorithm.cache_info(),
+                self._to_profile(algorithm),
+            )
+
+        algorithm = self.algorithm.clone()
+        if common_random_numbers:
+            algorithm.common_random_numbers = True
+        if prior is not None:
+            algorithm.warm_start(*prior)
+        best_arms = algorithm.optimize(
+            evaluate, bounds, n_trials, n_best, seed, batch=batch, array=array, **options
+        )
+
+        return (
+            self._to_results(best_arms),
+            self._to_early_stop(algorithm),
+            algorithm.cache_info(),
+            self._to_profile(algorithm),
+        )
+
+    def iter_optimize(
+        self,
+        objective: Callable,
+        params: ParamsType,
+        n_trials: int,
+        maximize: bool = False,
+        n_best: int = 1,
+        execution: Execution | None = None,
+        common_random_numbers: bool = False,
+    ) -> Iterator[Progress]:
+        """
+        Optimize the objective function one generation at a time, yielding the progress after
+        each generation, e.g. to report it, or to stop once the best configuration is good enough.
+
+        The run is the same as a single run of `study.optimize`, and saves its results to
+        `study.results` once the iterator is exhausted. Breaking out of the iteration (or
+        closing the iterator) ends the run early, and saves the results found so far; the
+        'interrupted' reason at `study.early_stops` reports this.
+
+        Args:
+            objective: The objective function to optimize.
+            params: A dictionary of parameters with their bounds.
+            n_trials: The number of evaluations to perform on the objective.
+            maximize: Indicates if objective is maximized. Default is False.
+            n_best: The number of results to return. Default is 1.
+            execution: How the objective is evaluated, see `optimize`. Only the "serial"
+                executor is supported, without parallel runs. Defaults to None (Execution()).
+            common_random_numbers: Indicates if the k-th trial of every parameter configuration
+                gets the same seed, see `optimize`. Default is False.
+
+        Returns:
+            An iterator over the Progress after each generation: the number of trials used, the
+            best configuration so far with its value (in the sign of `study.results`), standard
+            deviation and number of evaluations, and the number of configurations evaluated.
+        """
+        check_option("execution", execution, Execution)
+        if execution is None:
+            execution = Execution()
+        if execution.executor != "serial" or execution.parallel_runs:
+            raise ValueError(
+                "iter_optimize only supports the 'serial' executor, without parallel runs."
+            )
+
+        self._set_up(objective, params, maximize, 1, common_random_numbers)
+        bounds = self._collect_bounds()
+        seed = self._generate_seed()
+
+        # Start the run right away, so that invalid arguments raise before the iteration
+        algorithm = self.algorithm.clone()
+        if common_random_numbers:
+            algorithm.common_random_numbers = True
+        algorithm.start(bounds, seed)
+        algorithm.validate_budget(n_trials, n_best)
+
+        step_options = {
+            "batch": execution.vectorized,
+            "array": execution.array or execution.vectorized,
+            "seeded": common_random_numbers,
+        }
+        evaluate = self._evaluate_vectorized if execution.vectorized else self._evaluate
+        evaluate = partial(evaluate, rng=Random(seed))
+        return self._iter_run(algorithm, evaluate, n_trials, n_best, step_options)
+
+    def _iter_run(
+        self,
+        algorithm: GMAB,
+        evaluate: Callable,
+        n_trials: int,
+        n_best: int,
+        step_options: dict[str, bool],
+    ) -> Iterator[Progress]:
+        """
+        Steps a started run of `iter_optimize` one generation at a time, and saves its results
+        once the iteration ends.
+
+        Args:
+            algorithm: The started clone of the Study's algorithm.
+            evaluate: The callback that evaluates the trials for the algorithm, with the
+                generator of the run.
+            n_trials: The number of evaluations to perform on the objective.
+            n_best: The number of results to return.
+            step_options: The options of the callback for the algorithm.
+
+        Yields:
+            The Progress after each generation.
+        """
+        decoder = self._param_decoder
+        try:
+            while algorithm.used_trials < n_trials:
+                used_trials, best_arm, n_arms = algorithm.step(evaluate, n_trials, **step_options)
+                yield Progress(used_trials, best_arm, n_arms, decoder)
+        except GeneratorExit:
+            # Breaking out of the iteration ends the run with the results found so far
+            pass
+
+        self.results = self._to_results(algorithm.best(n_best))
+        saved_trials = n_trials - algorithm.used_trials
+        self._early_stops = [
+            {
+                "reason": "interrupted" if saved_trials else None,
+                "used_trials": algorithm.used_trials,
+                "saved_trials": saved_trials,
+            }
+        ]
+        self._cache_info = None
+        self._profile = None
+
+    async def optimize_async(
+        self,
+        objective: Callable[..., Awaitable[float]],
+        params: ParamsType,
+        n_trials: int,
+        maximize: bool = False,
+        n_best: int = 1,
+        n_runs: int = 1,
+        max_concurrency: int | None = None,
+        common_random_numbers: bool = False,
+    ) -> None:
+        """
+        Optimize a coroutine objective function, saving results to `study.results`.
+
+        The trials of each generation are evaluated concurrently on the running event loop,
+        e.g. to wait for a simulation service or subprocesses in parallel. Their values are
+        told to the algorithm in the order in which the trials were proposed, so the results
+        (and the seeds passed to the objective) are the same as with `study.optimize`.
+
+        Args:
+            objective: The coroutine function (`async def`) to optimize.
+            params: A dictionary of parameters with their bounds.
+            n_trials: The number of evaluations to perform on the objective.
+            maximize: Indicates if objective is maximized. Default is False.
+            n_best: The number of results to return per run. Default is 1.
+            n_runs: The number of times optimization is repeated. Default is 1.
+            max_concurrency: The maximum number of evaluations in flight. Defaults to None
+                (all trials of a generation at once).
+            common_random_numbers: Indicates if the k-th trial of every parameter configuration
+                gets the same seed, see `optimize`. Default is False.
+        """
+        if not iscoroutinefunction(objective):
+            raise TypeError(f"objective must be a coroutine function, got {type(objective)}.")
+        check_positive_int("max_concurrency", max_concurrency)
+
+        self._set_up(objective, params, maximize, n_runs, common_random_numbers)
+        bounds = self._collect_bounds()
+        limit = asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
+
+        seeds = [self._generate_seed() for _ in range(n_runs)]
+        run_results = [
+            await self._optimize_run_async(
+                seed, bounds, n_trials, n_best, limit, common_random_numbers
+            )
+            for seed in seeds
+        ]
+
+        # Save results and apply UCB ranking, the runs always use all trials
+        self.results = [result for results in run_results for result in results]
+        self._early_stops = [
+            {"reason": None, "used_trials": n_trials, "saved_trials": 0} for _ in run_results
+        ]
+        self._cache_info = None
+        self._profile = None
+
+    async def _optimize_run_async(
+        self,
+        seed: int,
+        bounds: list[tuple[int, int]],
+        n_trials: int,
+        n_best: int,
+        limit: Any,
+        common_random_numbers: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Executes a single optimization run of a coroutine objective with the ask/tell interface
+        of a clone of the Study's algorithm, one generation at a time.
+
+        Args:
+            seed: The seed of the run.
+            bounds: The bounds of the parameter configuration.
+            n_trials: The number of evaluations to perform on the objective.
+            n_best: The number of results to return.
+            limit: An async context manager that limits the number of evaluations in flight.
+            common_random_numbers: Indicates if the seeds of the trials are derived from the
+                seeds of the pulls.
+
+        Returns:
+            The results (as dictionaries) of the run.
+        """
+        rng = Random(seed)
+        algorithm = self.algorithm.clone()
+        if common_random_numbers:
+            algorithm.common_random_numbers = True
+        algorithm.start(bounds, seed)
+        algorithm.validate_budget(n_trials, n_best)
+
+        async def evaluate(solution: dict[str, Any]) -> float:
+            async with limit:
+                return self._direction * await self._objective(**solution)
+
+        while algorithm.used_trials < n_trials:
+            pulls = algorithm.ask(n_trials - algorithm.used_trials)
+
+            # Decode and draw seeds in the same order as `_evaluate_batch`
+            solutions = [self._decode(action_vector) for _, action_vector in pulls]
+            if self.seeded_call:
+                for (ticket, _), solution in zip(pulls, solutions, strict=True):
+                    pull_seed = algorithm.pull_seed(ticket) if common_random_numbers else None
+                    solution.update({"seed": self._trial_seed(pull_seed, rng)})
+
+            evaluations = await asyncio.gather(*(evaluate(solution) for solution in solutions))
+            for (ticket, _), evaluation in zip(pulls, evaluations, strict=True):
+                algorithm.tell(ticket, evaluation)
+
+        return self._to_results(algorithm.best(n_best))
+
+    def _collect_prior_arms(
+        self,
+        warm_start: str | os.PathLike | Sequence[PriorArmType],
+        bounds: list[tuple[int, int]],
+    ) -> list[PriorArmType]:
+        """
+        Collects the arms of an earlier optimization to warm start the algorithm with.
+
+        Args:
+            warm_start: The checkpoint file of the earlier optimization, or a sequence of
+                (action_vector, value, value_std_dev, n_evaluations) tuples.
+            bounds: The bounds of the parameter configuration.
+
+        Returns:
+            The prior arms as tuples, with the values in the direction of the optimization.
+        """
+        if isinstance(warm_start, (str, os.PathLike)):
+            # The values in a snapshot already are in the direction of its optimization
+            prior_arms = [
+                (arm.action_vector, arm.value, arm.value_std_dev, arm.n_evaluations)
+                for arm in GMAB.load(warm_start).arms
+            ]
+        elif isinstance(warm_start, Sequence):
+            prior_arms = [
+                (list(action_vector), self._direction * value, value_std_dev, n_evaluations)
+                for action_vector, value, value_std_dev, n_evaluations in warm_start
+            ]
+        else:
+            raise TypeError(
+                "warm_start must be a str, PathLike or a sequence of tuples, "
+                f"got {type(warm_start)}."
+            )
+
+        for action_vector, *_ in prior_arms:
+            if len(action_vector) != len(bounds):
+                raise ValueError(
+                    f"The action vectors of the prior arms must have {len(bounds)} actions, "
+                    f"got {len(action_vector)}."
+                )
+        return prior_arms
+
+    def _to_results(self, best_arms: list[Arm]) -> list[dict[str, Any]]:
+        """
+        Converts the best arms of a run into results with decoded parameters.
+
+        Args:
+            best_arms: The best arms, as returned by the algorithm.
+
+        Returns:
+            The results (as dictionaries) of the run.
+        """
+        results = []
+        for arm in best_arms:
+            result = arm.to_dict
+            action_vector = result.pop("action_vector")
+            result["params"] = self._decode(action_vector)
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _to_early_stop(algorithm: GMAB) -> dict[str, Any]:
+        """
+        Reports how the last optimization of the algorithm stopped.
+
+        Args:
+            algorithm: The algorithm after an optimization run.
+
+        Returns:
+            The stopping rule that ended the run early ('reason', or None if the run used all
+            trials), and the number of trials that the run used and saved.
+        """
+        return {
+            "reason": algorithm.stop_reason,
+            "used_trials": algorithm.used_trials,
+            "saved_trials": algorithm.saved_trials,
+        }
+
+    def _to_profile(self, algorithm: GMAB) -> dict[str, int] | None:
+        """
+        Combines the profile of the algorithm's last optimization with the time the Study spent
+        decoding and in the objective, and ends the profiling of the run.
+
+        Args:
+            algorithm: The algorithm after an optimization run.
+
+        Returns:
+            The profile of the run (see `profile`), or None if it has not been profiled.
+        """
+        run_profile, self._run_profile = self._run_profile, None
+        profile = algorithm.profile()
+        if profile is None or run_profile is None:
+            return None
+        profile.update(run_profile)
+        # What the algorithm spent evaluating, but neither the Study nor the objective
+        profile["marshalling_ns"] = max(
+            profile["evaluation_ns"] - run_profile["decode_ns"] - run_profile["objective_ns"], 0
+        )
+        return profile
+
+    @property
+    def early_stops(self) -> list[dict[str, Any]]:
+        """
+        Reports how each run of the last optimization stopped.
+
+        Returns:
+            One dictionary per run, with the stopping rule that ended the run early
+            ('reason': 'patience', 'confidence', 'deadline', 'target_value', 'interrupted' if
+            the iteration of `iter_optimize` has been ended early, or None if the run used all
+            trials), and the number of trials the run used ('used_trials') and saved
+            ('saved_trials').
+        """
+        return self._early_stops
+
+    @property
+    def cache_info(self) -> dict[str, int] | None:
+        """
+        Reports the evaluation cache of the last optimization, summed over all runs.
+
+        Returns:
+            The number of trials served from the cache ('hits'), and of calls to the objective
+            ('misses'), the number of values evicted ('evictions'), and the number ('entries') and
+            estimated memory ('bytes') of the values kept at the end of the runs. None if the
+            optimization used no cache.
+        """
+        return self._cache_info
+
+    @property
+    def profile(self) -> dict[str, int] | None:
+        """
+        Reports how the time of the last optimization split between the objective, the Study and
+        the algorithm, summed over all runs, if it has been profiled.
+
+        Returns:
+            The number of trials of configurations without ('new_arm_pulls') and with earlier
+            trials ('repulls'), which add up to the trials used, the number of bred
+            configurations skipped as they are in the current population already
+            ('duplicate_offspring'), of generations ('generations'), and of configurations moved in
+            the algorithm's sorted tree ('tree_reinserts'). The time in nanoseconds to breed the
+            generations ('breeding_ns'), to evaluate the trials ('evaluation_ns'), to update the
+            configurations with the values ('update_ns'), and to select the best configuration
+            ('selection_ns'). Of the evaluation, the time to decode and seed the trials
+            ('decode_ns'), the time in the objective ('objective_ns', including the executor),
+            and the remainder spent to pass the trials between the algorithm and the Study
+            ('marshalling_ns'). None if the optimization has not been profiled.
+        """
+        return self._profile
 
     @property
     def seeded_call(self) -> bool:
@@ -251,6 +1133,50 @@ class Study:
             self._rng = Random(self.seed) if self.seed else Random()
         return self._rng
 
+    def _rank_results(self) -> tuple[list[dict[str, Any]], float]:
+        """
+        Ranks the results with `_ucb_ranking` and computes their mean value. Both are computed
+        once after the results have been set, instead of again on each access of
+        `study.results` and the properties based on it.
+
+        Returns:
+            The ranked results, and their mean value.
+        """
+        if not self._results:
+            raise AttributeError("Study has no results. Run study.optimize() first.")
+        ranking = self._ranking
+        if ranking is None or ranking[0] is not self._results or ranking[1] != self._direction:
+            ranked_results = self._ucb_ranking(self._results, self._direction)
+            mean_value = mean([r["value"] for r in ranked_results])
+            ranking = self._ranking = (self._results, self._direction, ranked_results, mean_value)
+        return ranking[2], ranking[3]
+
+    @property
+    def _ranked_results(self) -> list[dict[str, Any]]:
+        """The results ranked by `_ucb_ranking`, see `_rank_results`."""
+        return self._rank_results()[0]
+
+    @staticmethod
+    def _copy_result(result: dict[str, Any]) -> dict[str, Any]:
+        """
+        Copies a result, so that callers can modify it without changing the cached ranking. The
+        result and its parameters are copied, as well as the lists of parameters with a size
+        larger than 1, but not the values of the parameters themselves.
+
+        Args:
+            result: A result (as a dictionary) of `_ranked_results`.
+
+        Returns:
+            A copy of the result.
+        """
+        result = dict(result)
+        if "params" in result:
+            result["params"] = {
+                name: list(value) if isinstance(value, list) else value
+                for name, value in result["params"].items()
+            }
+        return result
+
     @property
     def results(self) -> list[dict[str, Any]]:
         """
@@ -259,9 +1185,7 @@ class Study:
         Returns:
             A list of ranked results (as dictionaries) found during optimization.
         """
-        if not self._results:
-            raise AttributeError("Study has no results. Run study.optimize() first.")
-        return self._ucb_ranking(self._results, self._direction)
+        return [self._copy_result(result) for result in self._ranked_results]
 
     @results.setter
     def results(self, results: list[dict[str, Any]]) -> None:
@@ -272,6 +1196,39 @@ class Study:
             A list of results (as dictionaries) found during optimization.
         """
         self._results = results
+        self._ranking = None
+
+    def to_arrays(self) -> dict[str, Any]:
+        """
+        Exports the ranked results as columns, e.g. to analyze many results without pandas.
+
+        Returns:
+            A dictionary of NumPy arrays with one entry per result, in the order of
+            `study.results`: a column for each key of the results (e.g. 'value',
+            'n_evaluations' and 'ucb_rank'), and a column 'params_<name>' for each parameter,
+            with a second axis for parameters with a size larger than 1. Values of the same
+            type are stored with a matching dtype, mixed types and callables as objects.
+        """
+        import numpy as np
+
+        def to_column(values: list[Any]) -> Any:
+            if len({type(v) for v in values}) == 1 and not callable(values[0]):
+                return np.asarray(values)
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            return column
+
+        ranked_results = self._ranked_results
+        arrays = {}
+        for key in ranked_results[0]:
+            if key == "params":
+                for name in ranked_results[0]["params"]:
+                    arrays[f"params_{name}"] = to_column(
+                        [r["params"][name] for r in ranked_results]
+                    )
+            else:
+                arrays[key] = to_column([r[key] for r in ranked_results])
+        return arrays
 
     @property
     def best_value(self) -> float:
@@ -281,7 +1238,7 @@ class Study:
         Returns:
             The best value among `study.results`.
         """
-        return next(r["value"] for r in self.results if r["ucb_rank"] == 1)
+        return self._ranked_results[0]["value"]
 
     @property
     def mean_value(self) -> float:
@@ -291,7 +1248,7 @@ class Study:
         Returns:
             The mean value of `study.results`.
         """
-        return mean([r["value"] for r in self.results])
+        return self._rank_results()[1]
 
     @property
     def best_solution(self) -> dict[str, Any]:
@@ -301,7 +1258,7 @@ class Study:
         Returns:
             The solution (as a dictionary) that yielded `study.best_value`.
         """
-        return next(r for r in self.results if r["ucb_rank"] == 1)
+        return self._copy_result(self._ranked_results[0])
 
     @property
     def best_params(self) -> dict[str, Any]:
@@ -311,4 +1268,4 @@ class Study:
         Returns:
             The parameters (as a dictionary) that yielded `study.best_value`.
         """
-        return next(r["params"] for r in self.results if r["ucb_rank"] == 1)
+        return self._copy_result(self._ranked_results[0])["params"]
@@ -12,39 +12,376 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
-use pyo3::exceptions::PyRuntimeError;
+use numpy::ndarray::{Array2, Dimension};
+use numpy::{IntoPyArray, PyArray, PyArray1, PyArrayMethods};
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::marker::Ungil;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyDict, PyList, PyType};
 use std::panic;
+use std::path::PathBuf;
+use std::time::Duration;
 
 use evobandits_rust::arm::{Arm as RustArm, OptimizationFn};
+use evobandits_rust::cache::{CacheStats, CachedOptimizationFn, EvaluationCache};
 use evobandits_rust::evobandits::GMAB as RustGMAB;
 use evobandits_rust::genetic::{
     GeneticAlgorithm, CROSSOVER_RATE_DEFAULT, MUTATION_RATE_DEFAULT, MUTATION_SPAN_DEFAULT,
     POPULATION_SIZE_DEFAULT,
 };
+use evobandits_rust::islands::{Islands, Topology, MIGRATION_INTERVAL_DEFAULT, N_MIGRANTS_DEFAULT};
+use evobandits_rust::pull_log::PullLog;
+use evobandits_rust::snapshot::{Checkpoint, CHECKPOINT_INTERVAL_DEFAULT};
+use evobandits_rust::stopping::StoppingRules;
+
+// Marks an array as read-only, so the objective cannot modify the action vectors.
+fn read_only<D: Dimension>(array: Bound<'_, PyArray<i32, D>>) -> Bound<'_, PyArray<i32, D>> {
+    array
+        .getattr("flags")
+        .and_then(|flags| flags.setattr("writeable", false))
+        .expect("Failed to mark the action vectors as read-only");
+    array
+}
 
 struct PythonOptimizationFn {
     py_func: PyObject,
+    batch: bool,
+    array: bool,
+    seeded: bool,
 }
 
 impl PythonOptimizationFn {
-    fn new(py_func: PyObject) -> Self {
-        Self { py_func }
+    fn new(py_func: PyObject, batch: bool, array: bool, seeded: bool) -> Self {
+        Self {
+            py_func,
+            batch,
+            array,
+            seeded,
+        }
+    }
+
+    // Passes an action vector as a list of ints, or as a read-only 1-D NumPy int32 array, which
+    // is filled with a single copy of the action vector instead of one Python int per action.
+    fn action_vector_to_py<'py>(
+        &self,
+        py: Python<'py>,
+        action_vector: &[i32],
+    ) -> Bound<'py, PyAny> {
+        if self.array {
+            read_only(PyArray1::from_slice(py, action_vector)).into_any()
+        } else {
+            PyList::new(py, action_vector).unwrap().into_any()
+        }
+    }
+
+    // Passes the action vectors as a list of lists, or as a read-only 2-D NumPy int32 array with
+    // one row per action vector.
+    fn action_vectors_to_py<'py>(
+        &self,
+        py: Python<'py>,
+        action_vectors: &[&[i32]],
+    ) -> Bound<'py, PyAny> {
+        if self.array {
+            let dimension = action_vectors.first().map_or(0, |av| av.len());
+            let rows =
+                Array2::from_shape_vec((action_vectors.len(), dimension), action_vectors.concat())
+                    .expect("All action vectors must have the same dimension.");
+            read_only(rows.into_pyarray(py)).into_any()
+        } else {
+            let py_lists = action_vectors
+                .iter()
+                .map(|action_vector| PyList::new(py, *action_vector).unwrap());
+            PyList::new(py, py_lists).unwrap().into_any()
+        }
     }
 }
 
 impl OptimizationFn for PythonOptimizationFn {
     fn evaluate(&self, action_vector: &[i32]) -> f64 {
+        self.evaluate_seeded(action_vector, 0)
+    }
+
+    // Passes the seed of the pull on as second argument, if the function is seeded. Otherwise,
+    // Python objectives are seeded by the Study.
+    fn evaluate_seeded(&self, action_vector: &[i32], seed: u64) -> f64 {
+        if self.batch {
+            return self.evaluate_batch(&[action_vector], &[seed])[0];
+        }
+
         Python::with_gil(|py| {
-            let py_list = PyList::new(py, action_vector);
-            let result = self
-                .py_func
-                .call1(py, (py_list.unwrap(),))
-                .expect("Failed to call Python function");
+            let py_action_vector = self.action_vector_to_py(py, action_vector);
+            let result = if self.seeded {
+                self.py_func.call1(py, (py_action_vector, seed))
+            } else {
+                self.py_func.call1(py, (py_action_vector,))
+            }
+            .expect("Failed to call Python function");
             result.extract::<f64>(py).expect("Failed to extract f64")
         })
     }
+
+    // Passes the seeds of the pulls on as a list, if the function is seeded.
+    fn evaluate_batch(&self, action_vectors: &[&[i32]], seeds: &[u64]) -> Vec<f64> {
+        if !self.batch {
+            return action_vectors
+                .iter()
+                .zip(seeds)
+                .map(|(action_vector, &seed)| self.evaluate_seeded(action_vector, seed))
+                .collect();
+        }
+
+        // Cross the FFI boundary once per generation, with all pending action vectors
+        Python::with_gil(|py| {
+            let py_batch = self.action_vectors_to_py(py, action_vectors);
+            let result = if self.seeded {
+                self.py_func.call1(py, (py_batch, seeds.to_vec()))
+            } else {
+                self.py_func.call1(py, (py_batch,))
+            }
+            .expect("Failed to call Python function");
+            // Copy 1-D float arrays, e.g. from vectorized objectives, at once
+            let rewards = result
+                .downcast_bound::<PyArray1<f64>>(py)
+                .ok()
+                .and_then(|array| array.to_vec().ok())
+                .unwrap_or_else(|| {
+                    result
+                        .extract::<Vec<f64>>(py)
+                        .expect("Failed to extract Vec<f64>")
+                });
+            assert_eq!(
+                rewards.len(),
+                action_vectors.len(),
+                "Batch objective must return one value per action vector."
+            );
+            rewards
+        })
+    }
+}
+
+// Runs a call into the core with the GIL released, so other Python threads can run meanwhile, and
+// converts a panic into a Python RuntimeError. Callbacks into Python take the GIL for each call.
+fn run_core<T, F>(py: Python<'_>, f: F) -> PyResult<T>
+where
+    T: Ungil,
+    F: Ungil + FnOnce() -> T,
+{
+    py.allow_threads(|| panic::catch_unwind(panic::AssertUnwindSafe(f)))
+        .map_err(|err| {
+            if let Some(s) = err.downcast_ref::<&str>() {
+                PyRuntimeError::new_err(format!("{}", s))
+            } else if let Some(s) = err.downcast_ref::<String>() {
+                PyRuntimeError::new_err(format!("{}", s))
+            } else {
+                PyRuntimeError::new_err("EvoBandits Core raised an Error with unknown cause.")
+            }
+        })
+}
+
+// The options of the snapshots of an optimization, as given by an `evobandits.Checkpoint`, whose
+// attributes are extracted by name. The interval is given in seconds.
+#[derive(FromPyObject)]
+struct CheckpointArgs {
+    path: PathBuf,
+    every: Option<usize>,
+    interval: Option<f64>,
+}
+
+// Builds the checkpoint for the snapshots of an optimization, if one is given.
+fn checkpoint_from_args(args: Option<CheckpointArgs>) -> PyResult<Option<Checkpoint>> {
+    let Some(args) = args else {
+        return Ok(None);
+    };
+    if args.every == Some(0) {
+        return Err(PyValueError::new_err("every must be at least 1. (0)"));
+    }
+    if let Some(interval) = args.interval {
+        if !(interval > 0.0 && interval.is_finite()) {
+            return Err(PyValueError::new_err(format!(
+                "interval must be a positive number of seconds. ({})",
+                interval
+            )));
+        }
+    }
+    Ok(Some(Checkpoint::new(
+        args.path,
+        args.every,
+        args.interval.map(Duration::from_secs_f64),
+    )))
+}
+
+// The rules to stop an optimization early, as given by an `evobandits.StoppingRules`, whose
+// attributes are extracted by name. The deadline is given in seconds.
+#[derive(FromPyObject)]
+struct StoppingArgs {
+    patience: Option<usize>,
+    confidence: Option<f64>,
+    deadline: Option<f64>,
+    target: Option<f64>,
+}
+
+// Builds the rules to stop an optimization early, without rules if none are given.
+fn stopping_rules_from_args(args: Option<StoppingArgs>) -> PyResult<StoppingRules> {
+    let Some(args) = args else {
+        return Ok(StoppingRules::default());
+    };
+    if args.patience == Some(0) {
+        return Err(PyValueError::new_err("patience must be at least 1. (0)"));
+    }
+    if let Some(confidence) = args.confidence {
+        if !(confidence > 0.0 && confidence.is_finite()) {
+            return Err(PyValueError::new_err(format!(
+                "confidence must be a positive number. ({})",
+                confidence
+            )));
+        }
+    }
+    if let Some(deadline) = args.deadline {
+        if !(deadline >= 0.0 && deadline.is_finite()) {
+            return Err(PyValueError::new_err(format!(
+                "deadline must be a non-negative number of seconds. ({})",
+                deadline
+            )));
+        }
+    }
+    if args.target.is_some_and(f64::is_nan) {
+        return Err(PyValueError::new_err("target must be a number. (nan)"));
+    }
+    Ok(StoppingRules::new(
+        args.patience,
+        args.confidence,
+        args.deadline.map(Duration::from_secs_f64),
+        args.target,
+    ))
+}
+
+// The options of the cache for the evaluations of an optimization, as given by an
+// `evobandits.Cache`, whose attributes are extracted by name.
+#[derive(FromPyObject)]
+struct CacheArgs {
+    deterministic: bool,
+    max_size: Option<usize>,
+    max_bytes: Option<usize>,
+}
+
+// Builds the cache for the evaluations of an optimization, if one is given. The cache is
+// unbounded, unless a bound is given.
+fn cache_from_args(args: Option<CacheArgs>) -> PyResult<Option<EvaluationCache>> {
+    let Some(args) = args else {
+        return Ok(None);
+    };
+    if args.max_size == Some(0) {
+        return Err(PyValueError::new_err("max_size must be at least 1. (0)"));
+    }
+    if args.max_bytes == Some(0) {
+        return Err(PyValueError::new_err("max_bytes must be at least 1. (0)"));
+    }
+    Ok(Some(EvaluationCache::new(
+        args.max_size,
+        args.max_bytes,
+        args.deterministic,
+    )))
+}
+
+// Creates the log that the pulls of a run are recorded to, if a path is given.
+fn pull_log_from_args(path: Option<PathBuf>, dimension: usize) -> PyResult<Option<PullLog>> {
+    Ok(path
+        .map(|path| PullLog::create(path, dimension))
+        .transpose()?)
+}
+
+// Stops recording the pulls of a run, and writes the rest of the pull log. Errors of the run take
+// precedence over errors of the log.
+fn finish_pull_log<T>(gmab: &mut RustGMAB, result: PyResult<T>) -> PyResult<T> {
+    let pull_log = gmab.take_pull_log();
+    let result = result?;
+    if let Some(mut pull_log) = pull_log {
+        pull_log.flush()?;
+    }
+    Ok(result)
+}
+
+// The options of a run of `optimize` or `resume`, built from their arguments.
+struct RunOptions {
+    checkpoint: Option<Checkpoint>,
+    stopping: StoppingRules,
+    cache: Option<EvaluationCache>,
+    pull_log: Option<PullLog>,
+}
+
+impl RunOptions {
+    fn from_args(
+        checkpoint: Option<CheckpointArgs>,
+        stopping: Option<StoppingArgs>,
+        cache: Option<CacheArgs>,
+        pull_log: Option<PathBuf>,
+        dimension: usize,
+    ) -> PyResult<Self> {
+        Ok(Self {
+            checkpoint: checkpoint_from_args(checkpoint)?,
+            stopping: stopping_rules_from_args(stopping)?,
+            cache: cache_from_args(cache)?,
+            pull_log: pull_log_from_args(pull_log, dimension)?,
+        })
+    }
+
+    // Continues the optimization of a started GMAB, which records its pulls to the pull log, and
+    // serves repeated evaluations from the cache, if one is given.
+    fn resume(
+        &mut self,
+        gmab: &mut RustGMAB,
+        py_opti_function: PythonOptimizationFn,
+        n_trials: usize,
+        n_best: usize,
+    ) -> Vec<RustArm> {
+        gmab.set_pull_log(self.pull_log.take());
+        let checkpoint = self.checkpoint.as_ref();
+        match self.cache.as_ref() {
+            Some(cache) => gmab.resume(
+                CachedOptimizationFn::new(py_opti_function, cache),
+                n_trials,
+                n_best,
+                checkpoint,
+                &self.stopping,
+            ),
+            None => gmab.resume(
+                py_opti_function,
+                n_trials,
+                n_best,
+                checkpoint,
+                &self.stopping,
+            ),
+        }
+    }
+}
+
+// Builds the island model of a GMAB from its arguments.
+fn islands_from_args(
+    n_islands: usize,
+    migration_interval: usize,
+    n_migrants: usize,
+    topology: &str,
+) -> PyResult<Islands> {
+    if n_islands == 0 {
+        return Err(PyValueError::new_err("n_islands must be at least 1. (0)"));
+    }
+    if migration_interval == 0 {
+        return Err(PyValueError::new_err(
+            "migration_interval must be at least 1. (0)",
+        ));
+    }
+    let topology = Topology::from_name(topology).ok_or_else(|| {
+        PyValueError::new_err(format!(
+            "topology must be 'ring' or 'complete'. ({})",
+            topology
+        ))
+    })?;
+    Ok(Islands::new(
+        n_islands,
+        migration_interval,
+        n_migrants,
+        topology,
+    ))
 }
 
 #[pyclass]
@@ -102,10 +439,29 @@ impl From<RustArm> for Arm {
     }
 }
 
+// The arguments of `GMAB::new`, to pickle a GMAB by its configuration.
+type GmabArgs = (
+    usize,
+    f64,
+    f64,
+    f64,
+    bool,
+    usize,
+    usize,
+    usize,
+    &'static str,
+);
+
 #[pyclass(eq)]
 #[derive(Debug, PartialEq, Clone)]
 struct GMAB {
     gmab: RustGMAB,
+    // The island model of `optimize`, a single island runs one population. The islands run on
+    // separate threads, but a Python objective holds the GIL for each call, so they only evaluate
+    // in parallel if the objective releases it, e.g. in NumPy or native code.
+    islands: Islands,
+    // The counters of the cache of the last optimization, if it used one
+    cache_stats: Option<CacheStats>,
 }
 
 #[pymethods]
@@ -116,13 +472,24 @@ impl GMAB {
         mutation_rate=MUTATION_RATE_DEFAULT,
         crossover_rate=CROSSOVER_RATE_DEFAULT,
         mutation_span=MUTATION_SPAN_DEFAULT,
+        common_random_numbers=false,
+        n_islands=1,
+        migration_interval=MIGRATION_INTERVAL_DEFAULT,
+        n_migrants=N_MIGRANTS_DEFAULT,
+        topology="ring",
     ))]
     fn new(
         population_size: Option<usize>,
         mutation_rate: Option<f64>,
         crossover_rate: Option<f64>,
         mutation_span: Option<f64>,
+        common_random_numbers: bool,
+        n_islands: usize,
+        migration_interval: usize,
+        n_migrants: usize,
+        topology: &str,
     ) -> PyResult<Self> {
+        let islands = islands_from_args(n_islands, migration_interval, n_migrants, topology)?;
         let genetic_algorithm = GeneticAlgorithm {
             population_size: population_size.unwrap(),
             mutation_rate: mutation_rate.unwrap(),
@@ -130,8 +497,13 @@ impl GMAB {
             mutation_span: mutation_span.unwrap(),
             ..Default::default()
         };
-        let gmab = RustGMAB::new(genetic_algorithm);
-        Ok(GMAB { gmab })
+        let mut gmab = RustGMAB::new(genetic_algorithm);
+        gmab.set_common_random_numbers(common_random_numbers);
+        Ok(GMAB {
+            gmab,
+            islands,
+            cache_stats: None,
+        })
     }
 
     #[pyo3(signature = (
@@ -140,46 +512,330 @@ impl GMAB {
         n_trials,
         n_best,
         seed=None,
+        batch=false,
+        array=false,
+        seeded=false,
+        checkpoint=None,
+        stopping=None,
+        cache=None,
+        profile=false,
+        pull_log=None,
     ))]
     fn optimize(
         &mut self,
+        py: Python<'_>,
         py_func: PyObject,
         bounds: Vec<(i32, i32)>,
         n_trials: usize,
         n_best: usize,
         seed: Option<u64>,
+        batch: bool,
+        array: bool,
+        seeded: bool,
+        checkpoint: Option<CheckpointArgs>,
+        stopping: Option<StoppingArgs>,
+        cache: Option<CacheArgs>,
+        profile: bool,
+        pull_log: Option<PathBuf>,
     ) -> PyResult<Vec<Arm>> {
-        let py_opti_function = PythonOptimizationFn::new(py_func);
-
-        let result = panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
-            self.gmab
-                .optimize(py_opti_function, bounds, n_trials, n_best, seed)
-        }));
-
-        match result {
-            // Convert rust-only Vec<RustArm> into Python-compatible Vec<Arm> wrappers,
-            // so PyO3 can safely return them across the FFI boundary.
-            Ok(result) => {
-                let py_result: Vec<Arm> = result.into_iter().map(Arm::from).collect();
-                Ok(py_result)
-            }
-            Err(err) => {
-                if let Some(s) = err.downcast_ref::<&str>() {
-                    Err(PyRuntimeError::new_err(format!("{}", s)))
-                } else if let Some(s) = err.downcast_ref::<String>() {
-                    Err(PyRuntimeError::new_err(format!("{}", s)))
-                } else {
-                    Err(PyRuntimeError::new_err(
-                        "EvoBandits Core raised an Error with unknown cause.",
-                    ))
-                }
+        let py_opti_function = PythonOptimizationFn::new(py_func, batch, array, seeded);
+        let mut options =
+            RunOptions::from_args(checkpoint, stopping, cache, pull_log, bounds.len())?;
+        self.gmab.set_profiling(profile);
+
+        if self.islands.n_islands > 1 {
+            if options.checkpoint.is_some() || options.stopping != StoppingRules::default() {
+                return Err(PyValueError::new_err(
+                    "Checkpoints and stopping rules cannot be used with several islands.",
+                ));
             }
+            run_core(py, || self.gmab.set_pull_log(options.pull_log.take()))?;
+            // The islands share the cache and the pull log
+            let result = run_core(py, || match options.cache.as_ref() {
+                Some(cache) => self.gmab.optimize_islands(
+                    CachedOptimizationFn::new(py_opti_function, cache),
+                    bounds,
+                    n_trials,
+                    n_best,
+                    seed,
+                    &self.islands,
+                ),
+                None => self.gmab.optimize_islands(
+                    py_opti_function,
+                    bounds,
+                    n_trials,
+                    n_best,
+                    seed,
+                    &self.islands,
+                ),
+            });
+            return self.finish_run(result, options);
         }
+
+        let result = run_core(py, || {
+            self.gmab.start(bounds, seed);
+            options.resume(&mut self.gmab, py_opti_function, n_trials, n_best)
+        });
+        self.finish_run(result, options)
+    }
+
+    // Continues an optimization until `n_trials` trials have been used or a stopping rule applies,
+    // e.g. after `load`.
+    #[pyo3(signature = (
+        py_func,
+        n_trials,
+        n_best,
+        batch=false,
+        array=false,
+        seeded=false,
+        checkpoint=None,
+        stopping=None,
+        cache=None,
+        profile=false,
+        pull_log=None,
+    ))]
+    fn resume(
+        &mut self,
+        py: Python<'_>,
+        py_func: PyObject,
+        n_trials: usize,
+        n_best: usize,
+        batch: bool,
+        array: bool,
+        seeded: bool,
+        checkpoint: Option<CheckpointArgs>,
+        stopping: Option<StoppingArgs>,
+        cache: Option<CacheArgs>,
+        profile: bool,
+        pull_log: Option<PathBuf>,
+    ) -> PyResult<Vec<Arm>> {
+        let py_opti_function = PythonOptimizationFn::new(py_func, batch, array, seeded);
+        let dimension = self.bounds().len();
+        let mut options = RunOptions::from_args(checkpoint, stopping, cache, pull_log, dimension)?;
+        self.gmab.set_profiling(profile);
+
+        let result = run_core(py, || {
+            options.resume(&mut self.gmab, py_opti_function, n_trials, n_best)
+        });
+        self.finish_run(result, options)
+    }
+
+    // Runs the next generation of a started optimization, and returns the number of used trials,
+    // the best arm so far, and the number of evaluated arms.
+    #[pyo3(signature = (py_func, n_trials, batch=false, array=false, seeded=false))]
+    fn step(
+        &mut self,
+        py: Python<'_>,
+        py_func: PyObject,
+        n_trials: usize,
+        batch: bool,
+        array: bool,
+        seeded: bool,
+    ) -> PyResult<(usize, Arm, usize)> {
+        let py_opti_function = PythonOptimizationFn::new(py_func, batch, array, seeded);
+        let progress = run_core(py, || self.gmab.step(&py_opti_function, n_trials))?;
+        Ok((
+            progress.used_trials,
+            Arm::from(progress.best_arm),
+            progress.n_arms,
+        ))
+    }
+
+    fn save(&self, py: Python<'_>, path: PathBuf) -> PyResult<()> {
+        py.allow_threads(|| self.gmab.save(path))?;
+        Ok(())
+    }
+
+    #[staticmethod]
+    fn load(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        let gmab = py.allow_threads(|| RustGMAB::load(path))?;
+        Ok(GMAB {
+            gmab,
+            islands: Islands::default(),
+            cache_stats: None,
+        })
+    }
+
+    #[getter]
+    fn bounds(&self) -> Vec<(i32, i32)> {
+        let genetic_algorithm = self.gmab.get_genetic_algorithm();
+        genetic_algorithm
+            .lower_bound
+            .iter()
+            .copied()
+            .zip(genetic_algorithm.upper_bound.iter().copied())
+            .collect()
+    }
+
+    #[pyo3(signature = (bounds, seed=None))]
+    fn start(
+        &mut self,
+        py: Python<'_>,
+        bounds: Vec<(i32, i32)>,
+        seed: Option<u64>,
+    ) -> PyResult<()> {
+        run_core(py, || self.gmab.start(bounds, seed))
+    }
+
+    fn validate_budget(&self, py: Python<'_>, n_trials: usize, n_best: usize) -> PyResult<()> {
+        run_core(py, || self.gmab.validate_budget(n_trials, n_best))
+    }
+
+    fn ask(&mut self, py: Python<'_>, n: usize) -> PyResult<Vec<(u64, Vec<i32>)>> {
+        run_core(py, || self.gmab.ask(n))
+    }
+
+    fn pull_seed(&self, py: Python<'_>, ticket: u64) -> PyResult<u64> {
+        run_core(py, || self.gmab.pull_seed(ticket))
+    }
+
+    fn tell(&mut self, py: Python<'_>, ticket: u64, value: f64) -> PyResult<()> {
+        run_core(py, || self.gmab.tell(ticket, value))
+    }
+
+    fn best(&self, py: Python<'_>, n_best: usize) -> PyResult<Vec<Arm>> {
+        let result = run_core(py, || self.gmab.best(n_best))?;
+        Ok(result.into_iter().map(Arm::from).collect())
+    }
+
+    // Adds prior arms as (action_vector, value, value_std_dev, n_evaluations) tuples, whose number
+    // of evaluations is scaled by `weight`.
+    #[pyo3(signature = (prior_arms, weight=1.0))]
+    fn warm_start(
+        &mut self,
+        py: Python<'_>,
+        prior_arms: Vec<(Vec<i32>, f64, f64, i32)>,
+        weight: f64,
+    ) -> PyResult<()> {
+        run_core(py, || {
+            let prior_arms: Vec<RustArm> = prior_arms
+                .iter()
+                .map(|(action_vector, value, value_std_dev, n_evaluations)| {
+                    RustArm::from_statistics(action_vector, *value, *value_std_dev, *n_evaluations)
+                })
+                .collect();
+            self.gmab.warm_start(&prior_arms, weight)
+        })
+    }
+
+    #[getter]
+    fn arms(&self) -> Vec<Arm> {
+        self.gmab.arms().into_iter().map(Arm::from).collect()
+    }
+
+    #[getter]
+    fn get_common_random_numbers(&self) -> bool {
+        self.gmab.get_common_random_numbers()
+    }
+
+    #[setter]
+    fn set_common_random_numbers(&mut self, enabled: bool) {
+        self.gmab.set_common_random_numbers(enabled);
+    }
+
+    // The stopping rule that ended the last optimization early, or None if it used all trials.
+    #[getter]
+    fn stop_reason(&self) -> Option<&'static str> {
+        self.gmab
+            .early_stop()
+            .map(|early_stop| early_stop.reason.name())
+    }
+
+    // The number of trials that the last optimization has not used, as it stopped early.
+    #[getter]
+    fn saved_trials(&self) -> usize {
+        self.gmab
+            .early_stop()
+            .map_or(0, |early_stop| early_stop.saved_trials)
+    }
+
+    // The counters of the evaluation cache of the last optimization, or None if it used no cache.
+    fn cache_info(&self, py: Python) -> Option<Py<PyDict>> {
+        self.cache_stats.map(|stats| {
+            let dict = PyDict::new(py);
+            dict.set_item("hits", stats.hits).unwrap();
+            dict.set_item("misses", stats.misses).unwrap();
+            dict.set_item("evictions", stats.evictions).unwrap();
+            dict.set_item("entries", stats.entries).unwrap();
+            dict.set_item("bytes", stats.bytes).unwrap();
+            dict.into()
+        })
+    }
+
+    // The counters and timers of the hot path of the last optimization, or None if it has not been
+    // profiled. The times are in nanoseconds.
+    fn profile(&self, py: Python) -> Option<Py<PyDict>> {
+        self.gmab.profile().map(|profile| {
+            let dict = PyDict::new(py);
+            dict.set_item("new_arm_pulls", profile.new_arm_pulls)
+                .unwrap();
+            dict.set_item("repulls", profile.repulls).unwrap();
+            dict.set_item("duplicate_offspring", profile.duplicate_offspring)
+                .unwrap();
+            dict.set_item("generations", profile.generations).unwrap();
+            dict.set_item("tree_reinserts", profile.tree_reinserts)
+                .unwrap();
+            dict.set_item("breeding_ns", profile.breeding_ns).unwrap();
+            dict.set_item("evaluation_ns", profile.evaluation_ns)
+                .unwrap();
+            dict.set_item("update_ns", profile.update_ns).unwrap();
+            dict.set_item("selection_ns", profile.selection_ns).unwrap();
+            dict.into()
+        })
+    }
+
+    #[getter]
+    fn n_in_flight(&self) -> usize {
+        self.gmab.n_in_flight()
+    }
+
+    #[getter]
+    fn used_trials(&self) -> usize {
+        self.gmab.used_trials()
     }
 
     fn clone(&self) -> PyResult<Self> {
         let gmab = self.gmab.clone(); // Uses the derived clone() from Clone trait
-        Ok(GMAB { gmab })
+        Ok(GMAB {
+            gmab,
+            islands: self.islands.clone(),
+            cache_stats: None,
+        })
+    }
+
+    // Pickles the GMAB by its configuration, e.g. to send it to worker processes.
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<(Bound<'py, PyType>, GmabArgs)> {
+        let gmab = slf.borrow();
+        let genetic_algorithm = gmab.gmab.get_genetic_algorithm();
+        Ok((
+            slf.get_type(),
+            (
+                genetic_algorithm.population_size,
+                genetic_algorithm.mutation_rate,
+                genetic_algorithm.crossover_rate,
+                genetic_algorithm.mutation_span,
+                gmab.gmab.get_common_random_numbers(),
+                gmab.islands.n_islands,
+                gmab.islands.migration_interval,
+                gmab.islands.n_migrants,
+                gmab.islands.topology.name(),
+            ),
+        ))
+    }
+}
+
+impl GMAB {
+    // Writes the rest of the pull log of a run, keeps the counters of its cache, and converts its
+    // best arms into Python-compatible Arm wrappers, so PyO3 can safely return them across the
+    // FFI boundary.
+    fn finish_run(
+        &mut self,
+        result: PyResult<Vec<RustArm>>,
+        options: RunOptions,
+    ) -> PyResult<Vec<Arm>> {
+        let result = finish_pull_log(&mut self.gmab, result)?;
+        self.cache_stats = options.cache.map(|cache| cache.stats());
+        Ok(result.into_iter().map(Arm::from).collect())
     }
 }
 
@@ -192,6 +848,9 @@ fn evobandits(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("MUTATION_RATE_DEFAULT", MUTATION_RATE_DEFAULT)?;
     m.add("CROSSOVER_RATE_DEFAULT", CROSSOVER_RATE_DEFAULT)?;
     m.add("MUTATION_SPAN_DEFAULT", MUTATION_SPAN_DEFAULT)?;
+    m.add("CHECKPOINT_INTERVAL_DEFAULT", CHECKPOINT_INTERVAL_DEFAULT)?;
+    m.add("MIGRATION_INTERVAL_DEFAULT", MIGRATION_INTERVAL_DEFAULT)?;
+    m.add("N_MIGRANTS_DEFAULT", N_MIGRANTS_DEFAULT)?;
 
     Ok(())
 }
@@ -16,6 +16,9 @@
 Objective function and useful parameters for the multidimensional rosenbrock function
 """
 
+import asyncio
+
+import numpy as np
 from evobandits import Arm, IntParam
 from numpy import random
 
@@ -58,6 +61,33 @@ def noisy_rosenbrock(number: list, seed: int | None = None):
     return value
 
 
+def vectorized_function(number: np.ndarray):
+    # Rosenbrock Function for many trials at once, with one row of numbers per trial
+    number = number.astype(np.float64)
+    return np.sum(
+        100 * (number[:, 1:] - number[:, :-1] ** 2) ** 2 + (1 - number[:, :-1]) ** 2, axis=1
+    )
+
+
+def vectorized_noisy_rosenbrock(number: np.ndarray, seed: np.ndarray | None = None):
+    # Rosenbrock Function with Gaussian Noise, drawn with one seed per trial
+    value = vectorized_function(number)
+    seeds = [None] * len(number) if seed is None else seed
+    value += [random.default_rng(s).normal(0, 5) for s in seeds]
+    return value
+
+
+async def async_function(number: list):
+    # Rosenbrock Function as a coroutine, e.g. to mock a call to a simulation service
+    await asyncio.sleep(0)
+    return function(number)
+
+
+async def async_noisy_rosenbrock(number: list, seed: int | None = None):
+    await asyncio.sleep(0)
+    return noisy_rosenbrock(number, seed)
+
+
 if __name__ == "__main__":
     # Example usage
     result = function([1, 1])
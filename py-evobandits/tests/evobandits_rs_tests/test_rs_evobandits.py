@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
-from evobandits import GMAB, Arm
+from evobandits import GMAB, Arm, Cache, Checkpoint, StoppingRules, read_pull_log
 
 from tests._functions import rosenbrock as rb
 
@@ -45,6 +49,10 @@ def test_arm():
         {"mutation_rate": 0.1},
         {"crossover_rate": 0.9},
         {"mutation_span": 1.0},
+        {"n_islands": 4, "migration_interval": 3, "n_migrants": 1, "topology": "complete"},
+        {"n_islands": 0, "exp": pytest.raises(ValueError)},
+        {"migration_interval": 0, "exp": pytest.raises(ValueError)},
+        {"topology": "star", "exp": pytest.raises(ValueError)},
     ],
     ids=[
         "default",
@@ -52,6 +60,10 @@ def test_arm():
         "with_mutation_rate",
         "with_crossover_rate",
         "with_mutation_span",
+        "with_islands",
+        "invalid_n_islands",
+        "invalid_migration_interval",
+        "invalid_topology",
     ],
 )
 def test_gmab_init(kwargs):
@@ -100,6 +112,230 @@ def test_gmab(bounds, n_trials, kwargs):
         assert len(result) == n_best
 
 
+@pytest.mark.parametrize("batch", [False, True], ids=["single", "batch"])
+def test_gmab_array_input(batch):
+    bounds = [(-5, 10), (-5, 10)]
+
+    def objective(action_vectors):
+        # Action vectors are passed as read-only int32 arrays, one row per action vector in batches
+        assert isinstance(action_vectors, np.ndarray)
+        assert action_vectors.dtype == np.int32
+        assert action_vectors.ndim == (2 if batch else 1)
+        assert not action_vectors.flags.writeable
+        if batch:
+            return [rb.function(action_vector) for action_vector in action_vectors]
+        return rb.function(action_vectors)
+
+    def list_objective(action_vectors):
+        if batch:
+            return [rb.function(action_vector) for action_vector in action_vectors]
+        return rb.function(action_vectors)
+
+    result = GMAB().optimize(objective, bounds, 100, 3, 42, batch=batch, array=True)
+    expected = GMAB().optimize(list_objective, bounds, 100, 3, 42, batch=batch)
+    assert [arm.to_dict for arm in result] == [arm.to_dict for arm in expected]
+
+
+def test_gmab_vectorized():
+    # A vectorized objective evaluates all trials of a generation with a single call
+    bounds = [(-5, 10), (-5, 10)]
+    result = GMAB().optimize(rb.vectorized_function, bounds, 100, 3, 42, batch=True, array=True)
+    expected = GMAB().optimize(rb.function, bounds, 100, 3, 42)
+    assert [arm.to_dict for arm in result] == [arm.to_dict for arm in expected]
+
+
+def test_gmab_threads():
+    # Optimizations on several threads overlap, since the core runs without the GIL,
+    # and yield the same results as sequential ones
+    bounds = [(-5, 10), (-5, 10)]
+
+    def run(seed):
+        return [arm.to_dict for arm in GMAB().optimize(rb.function, bounds, 1000, 3, seed)]
+
+    expected = [run(seed) for seed in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert list(pool.map(run, range(4))) == expected
+
+
+def test_gmab_ask_tell():
+    # Driving the GMAB one generation at a time reproduces optimize
+    bounds = [(-5, 10), (-5, 10)]
+    gmab = GMAB()
+    gmab.start(bounds, 42)
+    while gmab.used_trials < 100:
+        for ticket, action_vector in gmab.ask(100 - gmab.used_trials):
+            gmab.tell(ticket, rb.function(action_vector))
+
+    expected = GMAB().optimize(rb.function, bounds, 100, 3, 42)
+    assert gmab.n_in_flight == 0
+    assert [arm.to_dict for arm in gmab.best(3)] == [arm.to_dict for arm in expected]
+
+
+def test_gmab_step():
+    # Stepping through all generations reproduces optimize
+    bounds = [(-5, 10), (-5, 10)]
+    gmab = GMAB()
+    gmab.start(bounds, 42)
+    progress = []
+    while gmab.used_trials < 100:
+        progress.append(gmab.step(rb.function, 100))
+
+    expected = GMAB().optimize(rb.function, bounds, 100, 3, 42)
+    assert [arm.to_dict for arm in gmab.best(3)] == [arm.to_dict for arm in expected]
+    used_trials, best_arm, n_arms = progress[-1]
+    assert used_trials == 100
+    assert best_arm.to_dict == expected[0].to_dict
+    assert n_arms == len(gmab.arms)
+
+    with pytest.raises(RuntimeError):
+        gmab.step(rb.function, 100)
+
+
+def test_gmab_pull_log(tmp_path):
+    bounds = [(-5, 10), (-5, 10)]
+    expected = GMAB().optimize(rb.function, bounds, 1000, 3, 42)
+
+    # Recording the pulls does not change the results, and records every trial
+    gmab = GMAB()
+    result = gmab.optimize(rb.function, bounds, 1000, 3, 42, pull_log=tmp_path / "first")
+    assert [arm.to_dict for arm in result] == [arm.to_dict for arm in expected]
+    pulls = read_pull_log(tmp_path / "first")
+    assert pulls["trial"].tolist() == list(range(1000))
+    assert not pulls["island"].any()
+    rewards = [rb.function(action_vector) for action_vector in pulls["action_vector"].tolist()]
+    assert pulls["reward"].tolist() == rewards
+
+    # Resuming records the remaining pulls of an uninterrupted run to a new log
+    gmab.resume(rb.function, 1200, 3, pull_log=tmp_path / "resumed")
+    resumed = read_pull_log(tmp_path / "resumed")
+    GMAB().optimize(rb.function, bounds, 1200, 3, 42, pull_log=tmp_path / "full")
+    full = read_pull_log(tmp_path / "full")
+    assert resumed["trial"].tolist() == list(range(200))
+    for name in ["arm", "action_vector", "reward", "seed"]:
+        assert (resumed[name] == full[name][1000:]).all()
+
+
+def test_gmab_ask_tell_in_flight():
+    gmab = GMAB(population_size=10)
+    gmab.start([(-5, 10), (-5, 10)], 42)
+
+    # No pulls can be bred before the initial population has been told
+    pulls = gmab.ask(100)
+    assert len(pulls) == 10
+    assert gmab.ask(100) == []
+    assert gmab.n_in_flight == 10
+
+    for ticket, action_vector in reversed(pulls):
+        gmab.tell(ticket, rb.function(action_vector))
+    assert len(gmab.ask(5)) == 5
+    assert gmab.n_in_flight == 5
+    assert gmab.used_trials == 10
+
+
+def test_gmab_save_load(tmp_path):
+    bounds = [(-5, 10), (-5, 10)]
+    expected = GMAB().optimize(rb.function, bounds, 100, 3, 42)
+
+    # A run with snapshots can be resumed from its last snapshot
+    path = tmp_path / "gmab.bin"
+    GMAB().optimize(rb.function, bounds, 50, 3, 42, checkpoint=Checkpoint(path))
+    gmab = GMAB.load(path)
+    assert gmab.bounds == bounds
+    assert gmab.used_trials == 50
+
+    result = gmab.resume(rb.function, 100, 3)
+    assert [arm.to_dict for arm in result] == [arm.to_dict for arm in expected]
+
+    with pytest.raises(OSError):
+        GMAB.load(tmp_path / "missing.bin")
+
+
+def test_gmab_stopping_rules():
+    bounds = [(-5, 10), (-5, 10)]
+    gmab = GMAB()
+    gmab.optimize(rb.function, bounds, 10000, 1, 42, stopping=StoppingRules(patience=3))
+    assert gmab.stop_reason == "patience"
+    assert gmab.saved_trials == 10000 - gmab.used_trials
+
+    # Without rules, the whole budget is used
+    gmab = GMAB()
+    gmab.optimize(rb.function, bounds, 100, 1, 42)
+    assert gmab.stop_reason is None
+    assert gmab.saved_trials == 0
+
+    # The binding validates rules of any object with the attributes of StoppingRules
+    invalid_rules = SimpleNamespace(patience=None, confidence=-1.0, deadline=None, target=None)
+    with pytest.raises(ValueError):
+        GMAB().optimize(rb.function, bounds, 100, 1, 42, stopping=invalid_rules)
+
+
+def test_gmab_cache():
+    bounds = [(-5, 10), (-5, 10)]
+    expected = GMAB().optimize(rb.function, bounds, 1000, 3, 42)
+
+    gmab = GMAB()
+    cache = Cache(deterministic=True, max_size=50)
+    result = gmab.optimize(rb.function, bounds, 1000, 3, 42, cache=cache)
+    assert [arm.to_dict for arm in result] == [arm.to_dict for arm in expected]
+    cache_info = gmab.cache_info()
+    assert cache_info["hits"] + cache_info["misses"] == 1000
+    assert cache_info["entries"] <= 50
+
+    # Without a cache, the objective is called for every trial
+    gmab = GMAB()
+    gmab.optimize(rb.function, bounds, 100, 1, 42)
+    assert gmab.cache_info() is None
+
+
+def test_gmab_profile():
+    bounds = [(-5, 10), (-5, 10)]
+    gmab = GMAB()
+    expected = gmab.optimize(rb.function, bounds, 1000, 3, 42)
+    assert gmab.profile() is None
+
+    # Profiling does not change the results, and counts every trial
+    gmab = GMAB()
+    result = gmab.optimize(rb.function, bounds, 1000, 3, 42, profile=True)
+    assert [arm.to_dict for arm in result] == [arm.to_dict for arm in expected]
+    profile = gmab.profile()
+    assert profile["new_arm_pulls"] + profile["repulls"] == 1000
+    assert profile["generations"] > 0
+    assert profile["evaluation_ns"] > 0
+
+
+def test_gmab_islands():
+    bounds = [(-5, 10), (-5, 10)]
+    gmab = GMAB(n_islands=3, migration_interval=2)
+    others = [gmab.clone(), pickle.loads(pickle.dumps(gmab))]
+    result = gmab.optimize(rb.function, bounds, 900, 3, 42)
+    assert len(result) == 3
+    assert gmab.used_trials == 900
+
+    # The islands are reproducible, and are kept by clones and pickles
+    for other in others:
+        other_result = other.optimize(rb.function, bounds, 900, 3, 42)
+        assert [arm.to_dict for arm in other_result] == [arm.to_dict for arm in result]
+
+    with pytest.raises(RuntimeError):
+        gmab.optimize(rb.function, bounds, 50, 1, 42)
+    with pytest.raises(ValueError):
+        gmab.optimize(rb.function, bounds, 900, 1, 42, stopping=StoppingRules(patience=3))
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda gmab: gmab.ask(1),
+        lambda gmab: gmab.tell(0, 0.0),
+        lambda gmab: gmab.best(0),
+    ],
+    ids=["ask_before_start", "tell_unknown_ticket", "invalid_n_best"],
+)
+def test_gmab_ask_tell_fails(call):
+    with pytest.raises(RuntimeError):
+        call(GMAB())
+
+
 @pytest.mark.parametrize(
     "this, other, expected_eq",
     [
@@ -111,3 +347,12 @@ def test_gmab(bounds, n_trials, kwargs):
 )
 def test_gmab_eq(this, other, expected_eq):
     assert (this == other) == expected_eq
+
+
+@pytest.mark.parametrize(
+    "gmab",
+    [GMAB(), GMAB(population_size=10, mutation_rate=0.1, crossover_rate=0.9, mutation_span=1.0)],
+    ids=["default", "modified"],
+)
+def test_gmab_pickle(gmab):
+    assert pickle.loads(pickle.dumps(gmab)) == gmab
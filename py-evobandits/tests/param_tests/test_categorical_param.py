@@ -1,5 +1,6 @@
 from contextlib import nullcontext
 
+import numpy as np
 import pytest
 from evobandits.params import CategoricalParam
 
@@ -46,3 +47,23 @@ def test_cat_param(choices, exp_bounds, expectation):
             exp_value = choices[idx]
             assert value == exp_value
             assert isinstance(value, type(exp_value))
+
+
+@pytest.mark.parametrize(
+    "choices, exp_dtype",
+    [
+        [["a", "b"], np.str_],
+        [[1, 2], np.int_],
+        [[1.0, 2.0], np.float64],
+        [["a", False], np.object_],
+        [[dummy_func, dummy_func], np.object_],
+    ],
+    ids=["choice_str", "choice_int", "choice_float", "choice_mixed", "choice_Callable"],
+)
+def test_cat_param_decode_columns(choices, exp_dtype):
+    param = CategoricalParam(choices)
+    actions = np.array([[1], [0], [1]], dtype=np.int32)
+
+    values = param.decode_columns(actions)
+    assert values.dtype.type == exp_dtype
+    assert values.tolist() == [choices[1], choices[0], choices[1]]
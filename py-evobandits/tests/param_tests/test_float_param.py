@@ -14,6 +14,7 @@
 
 from contextlib import nullcontext
 
+import numpy as np
 import pytest
 from evobandits.params import FloatParam
 
@@ -64,3 +65,17 @@ def test_float_param_mapping(param, action, exp_value):
     for _ in range(100):
         values.append(param.decode([action]))
     assert all(exp_value == x for x in values)
+
+
+@pytest.mark.parametrize(
+    "param",
+    [FloatParam(0, 1), FloatParam(0, 1, size=2), FloatParam(1, 2, log=True)],
+    ids=["base", "vector", "log_transform"],
+)
+def test_float_param_decode_columns(param):
+    actions = np.array([[0] * param.size, [5] * param.size, [100] * param.size], dtype=np.int32)
+
+    values = param.decode_columns(actions)
+    assert values.dtype == np.float64
+    for value, row in zip(values.tolist(), actions, strict=True):
+        assert value == pytest.approx(param.decode(row.tolist()))
@@ -1,5 +1,6 @@
 from contextlib import nullcontext
 
+import numpy as np
 import pytest
 from evobandits.params import IntParam
 
@@ -25,3 +26,13 @@ def test_int_param(low, high, kwargs, exp_bounds, exp_values):
         for x in range(bounds[0][0], bounds[0][1] + 1):
             values.append(param.decode([x]))
         assert values == exp_values
+
+
+@pytest.mark.parametrize("size, exp_shape", [(1, (3,)), (2, (3, 2))], ids=["scalar", "vector"])
+def test_int_param_decode_columns(size, exp_shape):
+    param = IntParam(0, 10, size)
+    actions = np.arange(3 * size, dtype=np.int32).reshape(3, size)
+
+    values = param.decode_columns(actions)
+    assert values.shape == exp_shape
+    assert values.tolist() == [param.decode(row.tolist()) for row in actions]
@@ -0,0 +1,80 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import numpy as np
+import pytest
+from evobandits.params import CategoricalParam, FloatParam, IntParam, ParamDecoder
+
+PARAMS = {
+    "int": IntParam(-5, 5),
+    "int_vector": IntParam(0, 10, size=3),
+    "float": FloatParam(0.123, 4.567),
+    "float_log": FloatParam(1e-4, 1e2, n_steps=50, log=True),
+    "float_vector": FloatParam(-1, 1, size=2, n_steps=7),
+    "cat": CategoricalParam(["a", None, 1.5]),
+    "cat_int": CategoricalParam([1, 2, 3]),
+}
+ACTION_VECTORS = np.array(
+    [
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [3, 1, 5, 10, 42, 17, 3, 6, 1, 1],
+        [10, 10, 10, 10, 100, 50, 7, 7, 2, 2],
+    ],
+    dtype=np.int32,
+)
+
+
+def decode_each_param(action_vector):
+    result = {}
+    idx = 0
+    for key, param in PARAMS.items():
+        result[key] = param.decode(action_vector[idx : idx + param.size])
+        idx += param.size
+    return result
+
+
+@pytest.mark.parametrize("as_list", [True, False], ids=["list", "array"])
+def test_decode(as_list):
+    decoder = ParamDecoder(PARAMS)
+    assert decoder.size == ACTION_VECTORS.shape[1]
+
+    for row in ACTION_VECTORS:
+        action_vector = row.tolist() if as_list else row
+        solution = decoder.decode(action_vector)
+        expected = decode_each_param(action_vector)
+        assert list(solution) == list(expected)
+        for key, value in expected.items():
+            # Values must be identical, not only approximately equal
+            assert np.array_equal(solution[key], value), key
+            assert type(solution[key]) is type(value), key
+
+
+def test_decode_columns():
+    decoder = ParamDecoder(PARAMS)
+    solutions = decoder.decode_columns(ACTION_VECTORS)
+
+    idx = 0
+    for key, param in PARAMS.items():
+        expected = param.decode_columns(ACTION_VECTORS[:, idx : idx + param.size])
+        assert solutions[key].dtype == expected.dtype, key
+        assert np.array_equal(solutions[key], expected), key
+        idx += param.size
+
+
+def test_pickle():
+    decoder = pickle.loads(pickle.dumps(ParamDecoder(PARAMS)))
+    action_vector = ACTION_VECTORS[1].tolist()
+    assert decoder.decode(action_vector) == decode_each_param(action_vector)
@@ -12,11 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
+import pickle
 from contextlib import nullcontext
-from unittest.mock import create_autospec
+from random import Random
+from unittest.mock import create_autospec, patch
 
 import pytest
-from evobandits import ALGORITHM_DEFAULT, GMAB, Study
+from evobandits import (
+    ALGORITHM_DEFAULT,
+    GMAB,
+    Cache,
+    Checkpoint,
+    Execution,
+    StoppingRules,
+    Study,
+    read_pull_log,
+)
 from evobandits.params.int_param import IntParam
 
 from tests._functions import clustering as cl
@@ -101,6 +114,68 @@ def test_study_init(seed, kwargs, exp_algorithm, caplog):
         [rb.function, rb.PARAMS, 1, {"maximize": "False", "exp": pytest.raises(TypeError)}],
         [rb.function, rb.PARAMS, 1, {"n_runs": "2", "exp": pytest.raises(TypeError)}],
         [rb.function, rb.PARAMS, 1, {"n_runs": 0, "exp": pytest.raises(ValueError)}],
+        [rb.function, rb.PARAMS, 1, {"execution": Execution("process", n_workers=2)}],
+        [rb.function, rb.PARAMS, 1, {"execution": "process", "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"execution": Execution(array=True)}],
+        [rb.vectorized_function, rb.PARAMS, 1, {"execution": Execution(vectorized=True)}],
+        [rb.function, rb.PARAMS, 1, {"checkpoint": 1, "exp": pytest.raises(TypeError)}],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"checkpoint": "study.bin", "n_runs": 2, "exp": pytest.raises(ValueError)},
+        ],
+        [rb.function, rb.PARAMS, 1, {"checkpoint": Checkpoint("study.bin", every=5)}],
+        [rb.function, rb.PARAMS, 1, {"warm_start": [([1, 1], 0.0, 0.0, 10)]}],
+        [rb.function, rb.PARAMS, 1, {"warm_start": 1, "exp": pytest.raises(TypeError)}],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"warm_start": [([1], 0.0, 0.0, 10)], "exp": pytest.raises(ValueError)},
+        ],
+        [rb.function, rb.PARAMS, 1, {"warm_start_weight": "1", "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"warm_start_weight": 0, "exp": pytest.raises(ValueError)}],
+        [rb.noisy_rosenbrock, rb.PARAMS, 1, {"common_random_numbers": True}],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"common_random_numbers": 1, "exp": pytest.raises(TypeError)},
+        ],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"common_random_numbers": True, "exp": pytest.raises(ValueError)},
+        ],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"stopping": StoppingRules(patience=5, confidence=3.0, deadline=60, target=0)},
+        ],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"stopping": {"patience": 5}, "exp": pytest.raises(TypeError)},
+        ],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"cache": Cache(deterministic=True, max_size=10, max_bytes=999)},
+        ],
+        [rb.function, rb.PARAMS, 1, {"cache": True, "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"profile": 1, "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"pull_log": 1, "exp": pytest.raises(TypeError)}],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"pull_log": "pulls", "n_runs": 2, "exp": pytest.raises(ValueError)},
+        ],
     ],
     ids=[
         "valid_default_testcase",
@@ -114,6 +189,28 @@ def test_study_init(seed, kwargs, exp_algorithm, caplog):
         "invalid_maximize_type",
         "invalid_n_runs_type",
         "invalid_n_runs_value",
+        "with_process_executor",
+        "invalid_execution_type",
+        "with_array",
+        "with_vectorized",
+        "invalid_checkpoint_type",
+        "invalid_checkpoint_with_n_runs",
+        "with_checkpoint",
+        "with_warm_start",
+        "invalid_warm_start_type",
+        "invalid_warm_start_dimension",
+        "invalid_warm_start_weight_type",
+        "invalid_warm_start_weight_value",
+        "with_common_random_numbers",
+        "invalid_common_random_numbers_type",
+        "invalid_common_random_numbers_without_seed",
+        "with_stopping_rules",
+        "invalid_stopping_type",
+        "with_cache",
+        "invalid_cache_type",
+        "invalid_profile_type",
+        "invalid_pull_log_type",
+        "invalid_pull_log_with_n_runs",
     ],
 )
 def test_optimize(objective, params, n_trials, kwargs):
@@ -135,6 +232,434 @@ def test_optimize(objective, params, n_trials, kwargs):
         assert mock_algorithm.optimize.call_count == kwargs.get("n_runs", 1)
 
 
+@pytest.mark.parametrize(
+    "objective, params",
+    [
+        [rb.function, rb.PARAMS],
+        [rb.noisy_rosenbrock, rb.PARAMS],
+    ],
+    ids=["deterministic", "seeded"],
+)
+def test_optimize_process_executor(objective, params):
+    # A seeded Study should yield the same results with any executor
+    serial_study = Study(seed=42)
+    serial_study.optimize(objective, params, 100, n_best=3)
+
+    process_study = Study(seed=42)
+    process_study.optimize(
+        objective, params, 100, n_best=3, execution=Execution("process", n_workers=2)
+    )
+
+    assert process_study.results == serial_study.results
+
+
+@pytest.mark.parametrize(
+    "objective, params",
+    [
+        [rb.function, rb.PARAMS],
+        [rb.noisy_rosenbrock, rb.PARAMS],
+    ],
+    ids=["deterministic", "seeded"],
+)
+def test_optimize_parallel_runs(objective, params):
+    # Parallel runs should yield the same results as sequential runs
+    serial_study = Study(seed=42)
+    serial_study.optimize(objective, params, 100, n_best=2, n_runs=3)
+
+    parallel_study = Study(seed=42)
+    parallel_study.optimize(
+        objective, params, 100, n_best=2, n_runs=3, execution=Execution(parallel_runs=True)
+    )
+
+    assert parallel_study.results == serial_study.results
+
+    # The runs draw the seeds of their trials from their own generators, not the Study's
+    rng = Random(42)
+    for _ in range(3):
+        rng.randint(0, 2**32 - 1)
+    assert serial_study.rng.getstate() == rng.getstate()
+    assert parallel_study.rng.getstate() == rng.getstate()
+
+
+def test_run_copy():
+    # Parallel runs send a copy of the Study without its results to the worker processes
+    study = Study(seed=42)
+    study.optimize(rb.noisy_rosenbrock, rb.PARAMS, 100, n_best=2)
+    run_study = pickle.loads(pickle.dumps(study._run_copy()))
+    assert not hasattr(run_study, "_results")
+    assert run_study.seeded_call
+    assert run_study._decode([1, 2]) == study._decode([1, 2])
+
+
+@pytest.mark.parametrize(
+    "objective, params",
+    [
+        [rb.function, rb.PARAMS],
+        [rb.noisy_rosenbrock, rb.PARAMS],
+    ],
+    ids=["deterministic", "seeded"],
+)
+def test_optimize_array(objective, params):
+    # Passing action vectors as arrays should not change the results
+    list_study = Study(seed=42)
+    list_study.optimize(objective, params, 100, n_best=3)
+
+    array_study = Study(seed=42)
+    array_study.optimize(objective, params, 100, n_best=3, execution=Execution(array=True))
+
+    assert array_study.results == list_study.results
+
+
+@pytest.mark.parametrize(
+    "objective, vectorized_objective, params",
+    [
+        [rb.function, rb.vectorized_function, rb.PARAMS],
+        [rb.noisy_rosenbrock, rb.vectorized_noisy_rosenbrock, rb.PARAMS],
+    ],
+    ids=["deterministic", "seeded"],
+)
+def test_optimize_vectorized(objective, vectorized_objective, params):
+    # A vectorized objective should yield the same results as evaluating each trial
+    study = Study(seed=42)
+    study.optimize(objective, params, 100, n_best=3)
+
+    vectorized_study = Study(seed=42)
+    vectorized_study.optimize(
+        vectorized_objective, params, 100, n_best=3, execution=Execution(vectorized=True)
+    )
+
+    assert vectorized_study.results == study.results
+
+
+@pytest.mark.parametrize(
+    "objective, params",
+    [
+        [rb.function, rb.PARAMS],
+        [rb.noisy_rosenbrock, rb.PARAMS],
+    ],
+    ids=["deterministic", "seeded"],
+)
+def test_optimize_resume(objective, params, tmp_path):
+    # An interrupted optimization should yield the same results once it is resumed
+    study = Study(seed=42)
+    study.optimize(objective, params, 200, n_best=3)
+
+    n_calls = 0
+
+    @functools.wraps(objective)
+    def interrupted_objective(*args, **kwargs):
+        nonlocal n_calls
+        n_calls += 1
+        if n_calls > 123:
+            raise RuntimeError("interrupted")
+        return objective(*args, **kwargs)
+
+    checkpoint = tmp_path / "study.bin"
+    with pytest.raises(RuntimeError):
+        Study(seed=42).optimize(
+            interrupted_objective,
+            params,
+            200,
+            n_best=3,
+            checkpoint=Checkpoint(checkpoint, every=20),
+        )
+    assert checkpoint.exists()
+
+    resumed_study = Study(seed=42)
+    resumed_study.optimize(objective, params, 200, n_best=3, checkpoint=checkpoint)
+
+    assert resumed_study.results == study.results
+
+
+def test_optimize_resume_fails(tmp_path):
+    # A checkpoint of an optimization with other parameters cannot be resumed
+    checkpoint = tmp_path / "study.bin"
+    Study(seed=42).optimize(rb.function, rb.PARAMS, 100, checkpoint=checkpoint)
+
+    with pytest.raises(ValueError):
+        Study(seed=42).optimize(cl.function, cl.PARAMS, 100, checkpoint=checkpoint)
+
+
+@pytest.mark.parametrize("maximize", [False, True], ids=["minimize", "maximize"])
+def test_optimize_warm_start(maximize):
+    # A warm start from the optimum returns it with a small budget
+    direction = -1 if maximize else 1
+
+    def objective(number: list) -> float:
+        return direction * rb.function(number)
+
+    prior_arms = [([1, 1], 0.0, 0.0, 100), ([2, 4], direction * 1.0, 0.0, 100)]
+    study = Study(seed=42)
+    study.optimize(objective, rb.PARAMS, 40, maximize=maximize, warm_start=prior_arms)
+
+    assert study.best_params == {"number": [1, 1]}
+
+
+def test_optimize_warm_start_from_checkpoint(tmp_path):
+    # A checkpoint holds the arms of an earlier optimization
+    checkpoint = tmp_path / "study.bin"
+    Study(seed=42).optimize(rb.function, rb.PARAMS, 100, checkpoint=checkpoint)
+    prior_arms = [
+        (arm.action_vector, arm.value, arm.value_std_dev, arm.n_evaluations)
+        for arm in GMAB.load(checkpoint).arms
+    ]
+
+    study = Study(seed=1)
+    study.optimize(rb.function, rb.PARAMS, 40, n_best=3, warm_start=checkpoint)
+    tuple_study = Study(seed=1)
+    tuple_study.optimize(rb.function, rb.PARAMS, 40, n_best=3, warm_start=prior_arms)
+
+    assert study.results == tuple_study.results
+
+
+@pytest.mark.parametrize(
+    "kwargs, reason",
+    [
+        [{"stopping": StoppingRules(patience=3)}, "patience"],
+        [{"stopping": StoppingRules(target=1000.0)}, "target_value"],
+        [{"maximize": True, "stopping": StoppingRules(target=1e9)}, None],
+        [{}, None],
+    ],
+    ids=["patience", "target", "target_not_reached_with_maximize", "no_rules"],
+)
+def test_optimize_early_stopping(kwargs, reason):
+    study = Study(seed=42)
+    study.optimize(rb.function, rb.PARAMS, 10000, n_runs=2, **kwargs)
+
+    assert len(study.early_stops) == 2
+    for early_stop in study.early_stops:
+        assert early_stop["reason"] == reason
+        assert early_stop["used_trials"] + early_stop["saved_trials"] == 10000
+        assert (early_stop["saved_trials"] > 0) == (reason is not None)
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["serial", "vectorized"])
+def test_optimize_deterministic(vectorized):
+    # Repeated trials are served from the cache, with the same results
+    objective = rb.vectorized_function if vectorized else rb.function
+    n_calls = 0
+
+    def counted_objective(number):
+        nonlocal n_calls
+        n_calls += len(number) if vectorized else 1
+        return objective(number)
+
+    execution = Execution(vectorized=vectorized)
+    study = Study(seed=42)
+    study.optimize(objective, rb.PARAMS, 1000, n_best=3, n_runs=2, execution=execution)
+    assert study.cache_info is None
+
+    cached_study = Study(seed=42)
+    cached_study.optimize(
+        counted_objective,
+        rb.PARAMS,
+        1000,
+        n_best=3,
+        n_runs=2,
+        execution=execution,
+        cache=Cache(deterministic=True),
+    )
+    assert cached_study.results == study.results
+    assert cached_study.cache_info["hits"] + cached_study.cache_info["misses"] == 2000
+    assert cached_study.cache_info["misses"] == n_calls
+    assert cached_study.cache_info["hits"] > 0
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["serial", "vectorized"])
+def test_optimize_profile(vectorized):
+    # Profiling does not change the results, and accounts for every trial
+    objective = rb.vectorized_function if vectorized else rb.function
+    execution = Execution(vectorized=vectorized)
+    study = Study(seed=42)
+    study.optimize(objective, rb.PARAMS, 1000, n_best=3, n_runs=2, execution=execution)
+    assert study.profile is None
+
+    profiled_study = Study(seed=42)
+    profiled_study.optimize(
+        objective, rb.PARAMS, 1000, n_best=3, n_runs=2, execution=execution, profile=True
+    )
+    assert profiled_study.results == study.results
+    profile = profiled_study.profile
+    assert profile["new_arm_pulls"] + profile["repulls"] == 2000
+    assert profile["generations"] > 0
+    assert profile["decode_ns"] > 0 and profile["objective_ns"] > 0
+    assert profile["marshalling_ns"] >= 0
+
+
+def test_optimize_pull_log(tmp_path):
+    # The pull log records every trial, and does not change the results
+    study = Study(seed=42)
+    study.optimize(rb.noisy_rosenbrock, rb.PARAMS, 1000, n_best=3, maximize=True)
+
+    logged_study = Study(seed=42)
+    logged_study.optimize(
+        rb.noisy_rosenbrock, rb.PARAMS, 1000, n_best=3, maximize=True, pull_log=tmp_path
+    )
+    assert logged_study.results == study.results
+
+    pulls = read_pull_log(tmp_path)
+    assert pulls["trial"].tolist() == list(range(1000))
+    assert pulls["action_vector"].shape == (1000, 2)
+    assert len(set(pulls["seed"].tolist())) == 1000
+
+    # The rewards of the best configuration add up to its value
+    best = pulls["action_vector"] == logged_study.best_params["number"]
+    assert pulls["reward"][best.all(axis=1)].mean() == pytest.approx(logged_study.best_value)
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["serial", "vectorized"])
+def test_iter_optimize(vectorized):
+    # Iterating over all generations reproduces a single run of optimize
+    objective = rb.vectorized_function if vectorized else rb.function
+    execution = Execution(vectorized=vectorized)
+    study = Study(seed=42)
+    study.optimize(objective, rb.PARAMS, 1000, n_best=3, execution=execution)
+
+    iter_study = Study(seed=42)
+    progress = list(
+        iter_study.iter_optimize(objective, rb.PARAMS, 1000, n_best=3, execution=execution)
+    )
+    assert iter_study.results == study.results
+    assert iter_study.early_stops[0]["reason"] is None
+    assert progress[-1].used_trials == 1000
+    used_trials = [p.used_trials for p in progress]
+    assert used_trials == sorted(set(used_trials))
+    assert progress[-1].n_arms >= len(iter_study.results)
+    assert progress[-1].params == {"number": list(progress[-1].action_vector)}
+
+
+def test_iter_optimize_break():
+    # Breaking out of the iteration ends the run with the results found so far
+    study = Study(seed=42)
+    for progress in study.iter_optimize(rb.function, rb.PARAMS, 1000, n_best=2):
+        if progress.used_trials >= 100:
+            break
+    assert len(study.results) == 2
+    assert study.early_stops[0]["reason"] == "interrupted"
+    assert study.early_stops[0]["used_trials"] == progress.used_trials
+    assert study.early_stops[0]["saved_trials"] == 1000 - progress.used_trials
+
+    # Invalid arguments raise before the iteration
+    with pytest.raises(TypeError):
+        study.iter_optimize(rb.function, rb.PARAMS, 1000, execution="serial")
+    with pytest.raises(ValueError):
+        study.iter_optimize(rb.function, rb.PARAMS, 1000, execution=Execution("process"))
+
+
+def test_optimize_common_random_numbers():
+    # The k-th trial of every configuration gets the same seed
+    trial_seeds = {}
+
+    def objective(number: list, seed: int) -> float:
+        trial_seeds.setdefault(tuple(number), []).append(seed)
+        return rb.noisy_rosenbrock(number, seed)
+
+    study = Study(seed=42)
+    study.optimize(objective, rb.PARAMS, 200, common_random_numbers=True)
+
+    n_trials = max(len(seeds) for seeds in trial_seeds.values())
+    assert n_trials > 1
+    for k in range(n_trials):
+        assert len({seeds[k] for seeds in trial_seeds.values() if len(seeds) > k}) == 1
+
+
+@pytest.mark.parametrize(
+    "optimize",
+    [
+        lambda study: study.optimize(
+            rb.vectorized_noisy_rosenbrock,
+            rb.PARAMS,
+            100,
+            n_best=3,
+            execution=Execution(vectorized=True),
+            common_random_numbers=True,
+        ),
+        lambda study: asyncio.run(
+            study.optimize_async(
+                rb.async_noisy_rosenbrock, rb.PARAMS, 100, n_best=3, common_random_numbers=True
+            )
+        ),
+    ],
+    ids=["vectorized", "async"],
+)
+def test_optimize_common_random_numbers_reproduces_results(optimize):
+    # Common random numbers yield the same results with any evaluation mode
+    study = Study(seed=42)
+    study.optimize(rb.noisy_rosenbrock, rb.PARAMS, 100, n_best=3, common_random_numbers=True)
+
+    other_study = Study(seed=42)
+    optimize(other_study)
+
+    assert other_study.results == study.results
+
+
+@pytest.mark.parametrize(
+    "objective, async_objective, params",
+    [
+        [rb.function, rb.async_function, rb.PARAMS],
+        [rb.noisy_rosenbrock, rb.async_noisy_rosenbrock, rb.PARAMS],
+    ],
+    ids=["deterministic", "seeded"],
+)
+def test_optimize_async(objective, async_objective, params):
+    # A coroutine objective should yield the same results as its synchronous counterpart
+    study = Study(seed=42)
+    study.optimize(objective, params, 100, n_best=3, n_runs=2)
+
+    async_study = Study(seed=42)
+    asyncio.run(
+        async_study.optimize_async(
+            async_objective, params, 100, n_best=3, n_runs=2, max_concurrency=4
+        )
+    )
+
+    assert async_study.results == study.results
+
+
+def test_optimize_async_latency():
+    # Evaluations with latency overlap, up to max_concurrency at a time
+    latency, n_trials, max_concurrency = 0.01, 100, 10
+    in_flight, max_in_flight = 0, 0
+
+    async def objective(number: list) -> float:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(latency)
+        in_flight -= 1
+        return rb.function(number)
+
+    study = Study(seed=42)
+    asyncio.run(
+        study.optimize_async(objective, rb.PARAMS, n_trials, max_concurrency=max_concurrency)
+    )
+
+    assert max_in_flight == max_concurrency
+
+
+@pytest.mark.parametrize(
+    "objective, kwargs",
+    [
+        [rb.function, {"exp": pytest.raises(TypeError)}],
+        [rb.async_function, {"max_concurrency": 2.0, "exp": pytest.raises(TypeError)}],
+        [rb.async_function, {"max_concurrency": 0, "exp": pytest.raises(ValueError)}],
+        [rb.async_function, {"n_runs": 0, "exp": pytest.raises(ValueError)}],
+        [rb.async_function, {"n_best": 0, "exp": pytest.raises(RuntimeError)}],
+    ],
+    ids=[
+        "invalid_objective_not_a_coroutine",
+        "invalid_max_concurrency_type",
+        "invalid_max_concurrency_value",
+        "invalid_n_runs_value",
+        "invalid_n_best_value",
+    ],
+)
+def test_optimize_async_fails(objective, kwargs):
+    study = Study(seed=42)
+    with kwargs.pop("exp"):
+        asyncio.run(study.optimize_async(objective, rb.PARAMS, 100, **kwargs))
+
+
 @pytest.mark.parametrize(
     "raw_results, direction, expected_results",
     [
@@ -287,6 +812,65 @@ def test_output_properties(direction, results, best_solution, best_params, best_
     assert study.mean_value == mean_value
 
 
+def test_results_ranking_is_cached():
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    study = Study(seed=42, algorithm=mock_algorithm)  # seeding to avoid warning log
+    study.results = [
+        {"value": 2.0, "n_evaluations": 1, "params": {"number": 2}},
+        {"value": 1.0, "n_evaluations": 1, "params": {"number": 1}},
+    ]
+
+    with patch.object(Study, "_ucb_ranking", wraps=Study._ucb_ranking) as ucb_ranking:
+        results = study.results
+        assert study.best_value == 1.0
+        assert study.best_params == {"number": 1}
+        assert study.mean_value == 1.5
+        assert ucb_ranking.call_count == 1
+
+        # Modifying the returned list does not modify the ranking
+        results.reverse()
+        assert study.best_solution == study.results[0] == results[1]
+
+        # Modifying the returned results does not modify the ranking either
+        results[0]["value"] = 0.0
+        results[0]["params"]["number"] = 0
+        study.best_solution["ucb_rank"] = 0
+        study.best_params["number"] = 0
+        assert study.results == [
+            {"value": 1.0, "n_evaluations": 1, "params": {"number": 1}, "ucb_rank": 1},
+            {"value": 2.0, "n_evaluations": 1, "params": {"number": 2}, "ucb_rank": 2},
+        ]
+        assert study.best_value == 1.0
+        assert ucb_ranking.call_count == 1
+
+        # Setting new results, or changing the direction, ranks the results again
+        study.results = [{"value": 3.0, "n_evaluations": 1, "params": {"number": 3}}]
+        assert study.best_value == 3.0
+        study._direction = -1
+        assert study.best_value == 3.0
+        assert ucb_ranking.call_count == 3
+
+
+def test_to_arrays():
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    study = Study(seed=42, algorithm=mock_algorithm)  # seeding to avoid warning log
+    study.results = [
+        {"value": 2.0, "n_evaluations": 1, "params": {"x": [2, 2], "c": "a"}},
+        {"value": 1.0, "n_evaluations": 2, "params": {"x": [1, 1], "c": None}},
+    ]
+
+    arrays = study.to_arrays()
+    assert list(arrays) == ["value", "n_evaluations", "params_x", "params_c", "ucb_rank"]
+    assert arrays["value"].tolist() == [1.0, 2.0]
+    assert arrays["n_evaluations"].tolist() == [2, 1]
+    assert arrays["ucb_rank"].tolist() == [1, 2]
+    assert arrays["params_x"].shape == (2, 2)
+    assert arrays["params_c"].dtype == object
+    assert arrays["params_c"].tolist() == [None, "a"]
+
+
 @pytest.mark.parametrize(
     "seed, objective, params, exp_value, expectation",
     [
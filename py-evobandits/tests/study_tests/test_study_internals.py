@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from random import Random
 
+import numpy as np
 import pytest
-from evobandits import CategoricalParam, IntParam
+from evobandits import CategoricalParam, FloatParam, IntParam
 from evobandits.study.study import Study
 
 
@@ -126,6 +128,39 @@ def test_decode(params, action_vector, exp_solution):
     assert solution == exp_solution
 
 
+@pytest.mark.parametrize(
+    "params, action_vectors",
+    [
+        [{"a": IntParam(0, 1)}, [[1], [0]]],
+        [{"a": IntParam(0, 1, 2)}, [[0, 1], [1, 1]]],
+        [{"a": FloatParam(0.0, 1.0, 2), "b": FloatParam(1.0, 2.0, log=True)}, [[0, 5, 100]]],
+        [
+            {"a": IntParam(0, 1, 2), "b": CategoricalParam([False, True])},
+            [[0, 1, 1], [1, 0, 0]],
+        ],
+        [{"a": CategoricalParam(["x", 1, None])}, [[0], [1], [2]]],
+    ],
+    ids=[
+        "one_dimension",
+        "one_param",
+        "float_params",
+        "multiple_params",
+        "mixed_choices",
+    ],
+)
+def test_decode_columns(params, action_vectors):
+    # Mock or patch dependencies
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = params
+
+    # Decoding columns must yield the same values as decoding each action vector
+    columns = study._decode_columns(np.array(action_vectors, dtype=np.int32))
+    for i, action_vector in enumerate(action_vectors):
+        exp_solution = study._decode(action_vector)
+        for key, exp_value in exp_solution.items():
+            assert np.asarray(columns[key][i]).tolist() == pytest.approx(exp_value)
+
+
 @pytest.mark.parametrize(
     "params, action_vector, exp_result, kwargs",
     [
@@ -154,6 +189,88 @@ def test_evaluate(params, action_vector, exp_result, kwargs):
     assert result == exp_result
 
 
+@pytest.mark.parametrize(
+    "params, action_vectors, exp_results, kwargs",
+    [
+        [{"a": IntParam(0, 1, 2)}, [[0, 1], [1, 1]], [-0.5, -1.0], {}],
+        [{"a": IntParam(0, 1, 2)}, [[0, 1], [1, 1]], [+0.5, +1.0], {"_direction": -1}],
+    ],
+    ids=[
+        "one_param",
+        "one_param_switch_direction",
+    ],
+)
+def test_evaluate_batch(params, action_vectors, exp_results, kwargs):
+    # Mock or patch dependencies
+    def dummy_objective(a: list):
+        return -sum(a) * 0.5
+
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = params
+    study._objective = dummy_objective
+    study._direction = kwargs.get("_direction", 1)
+
+    # Verify if study evaluates the objective with its executor
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        study._executor = executor
+        results = study._evaluate_batch(action_vectors)
+    assert results == exp_results
+
+
+def test_evaluate_batch_seeds():
+    # Seeds must be drawn in the same order as for serial evaluations
+    def dummy_objective(a: int, seed: int):
+        return seed
+
+    action_vectors = [[0], [1], [0]]
+    serial_study = Study(seed=42)  # with seed to avoid warning logs
+    serial_study._params = {"a": IntParam(0, 1)}
+    serial_study._objective = dummy_objective
+    exp_results = [serial_study._evaluate(action_vector) for action_vector in action_vectors]
+
+    study = Study(seed=42)
+    study._params = {"a": IntParam(0, 1)}
+    study._objective = dummy_objective
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        study._executor = executor
+        results = study._evaluate_batch(action_vectors)
+    assert results == exp_results
+
+
+@pytest.mark.parametrize("direction", [1, -1], ids=["minimize", "maximize"])
+def test_evaluate_vectorized(direction):
+    # Seeds must be drawn in the same order as for serial evaluations
+    def dummy_objective(a: int, seed: int):
+        return seed + a
+
+    def vectorized_objective(a: np.ndarray, seed: np.ndarray):
+        return seed + a
+
+    action_vectors = [[0], [1], [0]]
+    serial_study = Study(seed=42)  # with seed to avoid warning logs
+    serial_study._params = {"a": IntParam(0, 1)}
+    serial_study._objective = dummy_objective
+    serial_study._direction = direction
+    exp_results = [serial_study._evaluate(action_vector) for action_vector in action_vectors]
+
+    study = Study(seed=42)
+    study._params = {"a": IntParam(0, 1)}
+    study._objective = vectorized_objective
+    study._direction = direction
+    results = study._evaluate_vectorized(np.array(action_vectors, dtype=np.int32))
+    assert isinstance(results, np.ndarray)
+    assert results.tolist() == exp_results
+
+
+def test_evaluate_vectorized_fails_on_shape():
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 1)}
+    study._objective = lambda a: 0.0
+
+    with pytest.raises(ValueError):
+        study._evaluate_vectorized(np.array([[0], [1]], dtype=np.int32))
+
+
 @pytest.mark.parametrize(
     "study, other_study, expected_eq",
     [
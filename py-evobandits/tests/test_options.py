@@ -0,0 +1,161 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from contextlib import nullcontext
+
+import pytest
+from evobandits import Cache, Checkpoint, Execution, StoppingRules
+from evobandits.evobandits import CHECKPOINT_INTERVAL_DEFAULT
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp",
+    [
+        [{}, nullcontext()],
+        [{"executor": "process", "n_workers": 2}, nullcontext()],
+        [{"executor": "thread"}, pytest.raises(ValueError)],
+        [{"n_workers": 2.0}, pytest.raises(TypeError)],
+        [{"n_workers": 0}, pytest.raises(ValueError)],
+        [{"n_workers": 2, "parallel_runs": True}, nullcontext()],
+        [{"parallel_runs": 1}, pytest.raises(TypeError)],
+        [{"executor": "process", "parallel_runs": True}, pytest.raises(ValueError)],
+        [{"array": True}, nullcontext()],
+        [{"array": 1}, pytest.raises(TypeError)],
+        [{"vectorized": True}, nullcontext()],
+        [{"vectorized": 1}, pytest.raises(TypeError)],
+        [{"executor": "process", "vectorized": True}, pytest.raises(ValueError)],
+    ],
+    ids=[
+        "default",
+        "with_process_executor",
+        "invalid_executor_value",
+        "invalid_n_workers_type",
+        "invalid_n_workers_value",
+        "with_parallel_runs",
+        "invalid_parallel_runs_type",
+        "invalid_parallel_runs_with_executor",
+        "with_array",
+        "invalid_array_type",
+        "with_vectorized",
+        "invalid_vectorized_type",
+        "invalid_vectorized_with_executor",
+    ],
+)
+def test_execution(kwargs, exp):
+    with exp:
+        execution = Execution(**kwargs)
+        assert execution.executor == kwargs.get("executor", "serial")
+        assert execution.n_workers == kwargs.get("n_workers")
+        assert execution.parallel_runs == kwargs.get("parallel_runs", False)
+        assert execution.array == kwargs.get("array", False)
+        assert execution.vectorized == kwargs.get("vectorized", False)
+        assert repr(execution).startswith("Execution(executor=")
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp",
+    [
+        [{"path": "study.bin"}, nullcontext()],
+        [{"path": "study.bin", "every": 10, "interval": None}, nullcontext()],
+        [{"path": None}, pytest.raises(TypeError)],
+        [{"path": "study.bin", "every": 1.0}, pytest.raises(TypeError)],
+        [{"path": "study.bin", "every": 0}, pytest.raises(ValueError)],
+        [{"path": "study.bin", "interval": "60"}, pytest.raises(TypeError)],
+        [{"path": "study.bin", "interval": 0}, pytest.raises(ValueError)],
+    ],
+    ids=[
+        "default",
+        "with_every_without_interval",
+        "invalid_path_type",
+        "invalid_every_type",
+        "invalid_every_value",
+        "invalid_interval_type",
+        "invalid_interval_value",
+    ],
+)
+def test_checkpoint(kwargs, exp):
+    with exp:
+        checkpoint = Checkpoint(**kwargs)
+        assert checkpoint.path == kwargs["path"]
+        assert checkpoint.every == kwargs.get("every")
+        assert checkpoint.interval == kwargs.get("interval", CHECKPOINT_INTERVAL_DEFAULT)
+        assert repr(checkpoint).startswith("Checkpoint(path='study.bin'")
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp",
+    [
+        [{}, nullcontext()],
+        [{"patience": 5, "confidence": 3.0, "deadline": 60, "target": 0}, nullcontext()],
+        [{"deadline": 0, "target": float("-inf")}, nullcontext()],
+        [{"patience": 1.5}, pytest.raises(TypeError)],
+        [{"patience": 0}, pytest.raises(ValueError)],
+        [{"confidence": "3"}, pytest.raises(TypeError)],
+        [{"confidence": 0}, pytest.raises(ValueError)],
+        [{"confidence": float("inf")}, pytest.raises(ValueError)],
+        [{"deadline": "60"}, pytest.raises(TypeError)],
+        [{"deadline": -1}, pytest.raises(ValueError)],
+        [{"target": "0"}, pytest.raises(TypeError)],
+        [{"target": float("nan")}, pytest.raises(ValueError)],
+    ],
+    ids=[
+        "default",
+        "with_all_rules",
+        "with_zero_deadline_and_infinite_target",
+        "invalid_patience_type",
+        "invalid_patience_value",
+        "invalid_confidence_type",
+        "invalid_confidence_value",
+        "invalid_confidence_infinite",
+        "invalid_deadline_type",
+        "invalid_deadline_value",
+        "invalid_target_type",
+        "invalid_target_value",
+    ],
+)
+def test_stopping_rules(kwargs, exp):
+    with exp:
+        rules = StoppingRules(**kwargs)
+        for name in ("patience", "confidence", "deadline", "target"):
+            assert getattr(rules, name) == kwargs.get(name)
+        assert repr(rules).startswith("StoppingRules(patience=")
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp",
+    [
+        [{}, nullcontext()],
+        [{"deterministic": True, "max_size": 10, "max_bytes": 999}, nullcontext()],
+        [{"deterministic": 1}, pytest.raises(TypeError)],
+        [{"max_size": 1.0}, pytest.raises(TypeError)],
+        [{"max_size": 0}, pytest.raises(ValueError)],
+        [{"max_bytes": "1"}, pytest.raises(TypeError)],
+        [{"max_bytes": -1}, pytest.raises(ValueError)],
+    ],
+    ids=[
+        "default",
+        "with_all_options",
+        "invalid_deterministic_type",
+        "invalid_max_size_type",
+        "invalid_max_size_value",
+        "invalid_max_bytes_type",
+        "invalid_max_bytes_value",
+    ],
+)
+def test_cache(kwargs, exp):
+    with exp:
+        cache = Cache(**kwargs)
+        assert cache.deterministic == kwargs.get("deterministic", False)
+        assert cache.max_size == kwargs.get("max_size")
+        assert cache.max_bytes == kwargs.get("max_bytes")
+        assert repr(cache).startswith("Cache(deterministic=")
@@ -0,0 +1,79 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+
+import numpy as np
+import pytest
+from evobandits import read_pull_log
+from evobandits.pull_log import COLUMNS, PULL_LOG_MAGIC, PULL_LOG_VERSION
+
+
+def write_meta(path, dimension, committed, version=PULL_LOG_VERSION):
+    meta = PULL_LOG_MAGIC + struct.pack("<IQQ", version, dimension, committed)
+    (path / "meta").write_bytes(meta)
+
+
+def write_pull_log(path, dimension, n_pulls):
+    # Writes a pull log like the algorithm records it
+    write_meta(path, dimension, n_pulls)
+    for name, (file_name, dtype) in COLUMNS.items():
+        width = dimension if name == "action_vector" else 1
+        values = np.arange(n_pulls * width).astype(dtype)
+        values.tofile(path / file_name)
+
+
+def test_read_pull_log(tmp_path):
+    write_pull_log(tmp_path, 3, 5)
+    pulls = read_pull_log(tmp_path)
+    assert pulls["trial"].tolist() == list(range(5))
+    assert pulls["action_vector"].shape == (5, 3)
+    assert pulls["action_vector"][-1].tolist() == [12, 13, 14]
+    assert pulls["reward"].dtype == np.float64
+
+    # The columns are read-only views of the files
+    with pytest.raises(ValueError):
+        pulls["reward"][0] = 1.0
+
+
+def test_read_pull_log_partly_written(tmp_path):
+    # A flush that has been interrupted appended to some columns, but did not commit the pulls
+    write_pull_log(tmp_path, 2, 4)
+    with open(tmp_path / "seed.u64", "ab") as file:
+        file.write(b"\0" * 12)
+    write_meta(tmp_path, 2, 3)
+    assert [len(column) for column in read_pull_log(tmp_path).values()] == [3] * 6
+
+
+def test_read_empty_pull_log(tmp_path):
+    write_pull_log(tmp_path, 2, 0)
+    pulls = read_pull_log(tmp_path)
+    assert pulls["action_vector"].shape == (0, 2)
+    assert not pulls["seed"].flags.writeable
+
+
+@pytest.mark.parametrize(
+    "meta, exp",
+    [
+        [b"EVOBSNAP" + struct.pack("<IQQ", PULL_LOG_VERSION, 2, 1), "not an EvoBandits pull log"],
+        [PULL_LOG_MAGIC + struct.pack("<IQQ", PULL_LOG_VERSION + 1, 2, 1), "has version"],
+        [PULL_LOG_MAGIC + struct.pack("<IQ", PULL_LOG_VERSION, 2), "not an EvoBandits pull log"],
+    ],
+    ids=["invalid_magic", "invalid_version", "truncated_meta"],
+)
+def test_read_pull_log_fails(tmp_path, meta, exp):
+    write_pull_log(tmp_path, 2, 1)
+    (tmp_path / "meta").write_bytes(meta)
+    with pytest.raises(ValueError, match=exp):
+        read_pull_log(tmp_path)